@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import hiero.core
 import hiero.ui
 
 import nomenclator
@@ -18,3 +19,9 @@ target_action = hiero.ui.findMenuAction("foundry.menu.file")
 menu = target_action.menu()
 separator = menu.insertSeparator(menu.actions()[0])
 menu.insertActions(separator, [action1, action2])
+
+# Recent locations are fetched again once a project is saved.
+hiero.core.events.registerInterest(
+    hiero.core.events.EventType.kAfterProjectSave,
+    nomenclator.clear_recent_paths
+)
@@ -10,3 +10,6 @@ menu.addCommand("Nomenclator - Manage Comp...", nomenclator.open_comp_manager_di
 menu.addCommand("Nomenclator - Manage Outputs...", nomenclator.open_output_manager_dialog, index=1)
 menu.addCommand("Nomenclator - Settings...", nomenclator.open_settings_dialog, index=2)
 menu.addSeparator(index=3)
+
+# Recent locations are fetched again once a script is saved.
+nuke.addOnScriptSave(nomenclator.clear_recent_paths)
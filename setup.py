@@ -52,6 +52,11 @@ setup(
         ">=2.7, !=3.0.*, !=3.1.*, !=3.2.*, !=3.3.*, !=3.4.*, !=3.5*"
     ),
     install_requires=[],
+    entry_points={
+        "console_scripts": [
+            "nomenclator = nomenclator.command:main",
+        ],
+    },
     tests_require=TEST_REQUIRES,
     extras_require={
         "doc": DOC_REQUIRES,
@@ -1,14 +1,9 @@
 # -*- coding: utf-8 -*-
 
-import nuke
+# Modules required by the dialogs are imported on first use to prevent
+# loading Qt and all widgets when Nuke or Hiero starts.
 
-import nomenclator.config
-import nomenclator.context
-import nomenclator.utilities
-from nomenclator.dialog import CompoManagerDialog
-from nomenclator.dialog import OutputsManagerDialog
-from nomenclator.dialog import ProjectManagerDialog
-from nomenclator.dialog import SettingsDialog
+import contextlib
 
 from ._version import __version__
 
@@ -16,58 +11,145 @@ from ._version import __version__
 def open_comp_manager_dialog():
     """Open the dialog to manage composition script and render output paths.
     """
-    config = nomenclator.config.fetch()
-    context = nomenclator.context.fetch(config)
+    import nomenclator.context
+    import nomenclator.telemetry
+    import nomenclator.utilities
+    from nomenclator.dialog import CompoManagerDialog
 
-    panel = CompoManagerDialog(context)
+    with _session("comp_manager"):
+        config = _fetch_config()
+        context = nomenclator.context.fetch(config)
 
-    if not panel.exec_():
-        return
+        panel = CompoManagerDialog(context)
+        accepted = panel.exec_()
+        _record(config.comp_template_configs, panel.context, accepted)
 
-    context = panel.context
-    nomenclator.utilities.update_nodes(context)
-    nomenclator.utilities.save_comp(context)
+        if not accepted:
+            return
+
+        with nomenclator.telemetry.timer("apply"):
+            context = panel.context
+            nomenclator.utilities.update_nodes(context)
+            nomenclator.utilities.save_comp(context)
 
 
 def open_project_manager_dialog():
     """Open the dialog to manage project.
     """
-    config = nomenclator.config.fetch()
-    context = nomenclator.context.fetch(config, is_project=True)
+    import nomenclator.context
+    import nomenclator.telemetry
+    import nomenclator.utilities
+    from nomenclator.dialog import ProjectManagerDialog
+
+    with _session("project_manager"):
+        config = _fetch_config()
+        context = nomenclator.context.fetch(config, is_project=True)
 
-    panel = ProjectManagerDialog(context)
+        panel = ProjectManagerDialog(context)
+        accepted = panel.exec_()
+        _record(config.project_template_configs, panel.context, accepted)
 
-    if not panel.exec_():
-        return
+        if not accepted:
+            return
 
-    nomenclator.utilities.save_project(context)
+        with nomenclator.telemetry.timer("apply"):
+            nomenclator.utilities.save_project(context)
 
 
 def open_output_manager_dialog():
     """Open the dialog to manage render output paths.
     """
-    config = nomenclator.config.fetch()
-    context = nomenclator.context.fetch(config)
+    import nomenclator.context
+    import nomenclator.telemetry
+    import nomenclator.utilities
+    from nomenclator.dialog import OutputsManagerDialog
+
+    with _session("outputs_manager"):
+        config = _fetch_config()
+        context = nomenclator.context.fetch(config)
 
-    panel = OutputsManagerDialog(context)
+        panel = OutputsManagerDialog(context)
+        accepted = panel.exec_()
+        _record(config.comp_template_configs, panel.context, accepted)
 
-    if not panel.exec_():
-        return
+        if not accepted:
+            return
 
-    context = panel.context
-    nomenclator.utilities.update_nodes(context)
+        with nomenclator.telemetry.timer("apply"):
+            context = panel.context
+            nomenclator.utilities.update_nodes(context)
 
 
 def open_settings_dialog():
     """Open the dialog to manage settings.
     """
-    config = nomenclator.config.fetch()
-    panel = SettingsDialog(config)
+    import nuke
+
+    import nomenclator.config
+    import nomenclator.telemetry
+    from nomenclator.dialog import SettingsDialog
+
+    with _session("settings"):
+        config = _fetch_config()
+        nomenclator.telemetry.set_value(
+            "templates", len(config.comp_template_configs)
+            + len(config.project_template_configs)
+        )
+
+        panel = SettingsDialog(config)
+        accepted = panel.exec_()
+        nomenclator.telemetry.set_value("accepted", bool(accepted))
+
+        if not accepted:
+            return
+
+        try:
+            with nomenclator.telemetry.timer("apply"):
+                nomenclator.config.save(panel.config)
+        except Exception as error:
+            nuke.critical("Impossible to save config: {}".format(error))
+
+
+def clear_recent_paths(*args):
+    """Clear recent locations cached so that they are fetched again.
+
+    This is registered to be called when a scene is saved from the host
+    application. Arguments passed by the host application are ignored.
+    """
+    import nomenclator.utilities
 
-    if not panel.exec_():
-        return
+    nomenclator.utilities.clear_recent_paths()
+
+
+@contextlib.contextmanager
+def _session(name):
+    """Profile and record telemetry of dialog session *name*.
+    """
+    import nomenclator.profiling
+    import nomenclator.telemetry
+
+    with nomenclator.profiling.session(name):
+        with nomenclator.telemetry.session(name):
+            yield
+
+
+def _record(template_configs, context, accepted):
+    """Record telemetry values of the current dialog session.
+    """
+    import nomenclator.telemetry
+
+    nomenclator.telemetry.set_value("templates", len(template_configs))
+    nomenclator.telemetry.set_value("outputs", len(context.outputs))
+    nomenclator.telemetry.set_value("location_path", context.location_path)
+    nomenclator.telemetry.set_value("accepted", bool(accepted))
+
+
+def _fetch_config():
+    """Return configuration object and keep it up-to-date in the background.
+    """
+    import nomenclator.config
+    import nomenclator.telemetry
 
-    try:
-        nomenclator.config.save(panel.config)
-    except Exception as error:
-        nuke.critical("Impossible to save config: {}".format(error))
+    with nomenclator.telemetry.timer("config_load"):
+        nomenclator.config.start_watcher()
+        return nomenclator.config.fetch()
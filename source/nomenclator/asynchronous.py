@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+# Coroutines to fetch and update contexts from an asyncio event loop. This
+# module requires Python 3.
+
+import asyncio
+import functools
+import os
+
+import nomenclator.config
+import nomenclator.context
+import nomenclator.scanner
+import nomenclator.utilities
+
+
+async def fetch_config(location_path=None, executor=None):
+    """Return configuration object without blocking the event loop.
+
+    Configuration files are read in *executor*.
+
+    :param location_path: Path to the folder to discover a configuration file
+        from (see :func:`nomenclator.config.fetch`). Default is None.
+
+    :param executor: :class:`concurrent.futures.Executor` instance. Default is
+        None, which means that the default executor of the event loop is used.
+
+    :return: :class:`~nomenclator.config.Config` instance.
+
+    """
+    return await _run(
+        executor, nomenclator.config.fetch, location_path=location_path
+    )
+
+
+async def fetch(config, is_project=False, path=None, executor=None):
+    """Return context object without blocking the event loop.
+
+    This is the asynchronous counterpart of :func:`nomenclator.context.fetch`.
+    When *path* is specified, output nodes are read from the composition
+    script in *executor* (see :func:`nomenclator.scanner.fetch_nodes`).
+    Otherwise, the current session is queried from the event loop thread as
+    the host API must not be called from other threads, and recent projects
+    are checked in *executor* (see
+    :func:`nomenclator.utilities.resolve_recent_project_paths`).
+
+    :param config: :class:`~nomenclator.config.Config` instance.
+
+    :param is_project: Indicate whether the project context is requested.
+        Default is False, which means that the composition context will be
+        returned.
+
+    :param path: Path to the scene file. Default is None, which means that
+        the scene opened in the current session is used.
+
+    :param executor: :class:`concurrent.futures.Executor` instance. Default is
+        None, which means that the default executor of the event loop is used.
+
+    :return: :class:`~nomenclator.context.Context` instance.
+
+    """
+    nodes = None
+    recent_locations = None
+
+    if path is not None:
+        if not is_project:
+            nodes = await _run(executor, nomenclator.scanner.fetch_nodes, path)
+
+    elif is_project:
+        file_paths = nomenclator.utilities.fetch_recent_project_files(
+            max_values=config.max_locations
+        )
+        recent_locations = await _run(
+            executor, nomenclator.utilities.resolve_recent_project_paths,
+            file_paths, max_values=config.max_locations
+        )
+
+    return nomenclator.context.fetch(
+        config, is_project=is_project, path=path, nodes=nodes,
+        recent_locations=recent_locations
+    )
+
+
+async def update(context, discover_next_version=True, executor=None):
+    """Return updated context object without blocking the event loop.
+
+    This is the asynchronous counterpart of :func:`nomenclator.context.update`.
+    The location path is listed in *executor* when the next version must be
+    discovered, and the context is then updated with the same logic.
+
+    :param context: :class:`~nomenclator.context.Context` instance.
+
+    :param discover_next_version: Indicate whether the next version of the
+        scene should be discovered and added to the context. Default is True.
+        Otherwise, the version of the current scene is added to the context.
+
+    :param executor: :class:`concurrent.futures.Executor` instance. Default is
+        None, which means that the default executor of the event loop is used.
+
+    :return: updated :class:`~nomenclator.context.Context` instance.
+
+    """
+    file_names = None
+
+    # The location path is only listed when a template configuration matches,
+    # as it would be by the synchronous function.
+    if discover_next_version and nomenclator.utilities.fetch_template_config(
+        context.location_path, context.template_configs, {}
+    ) is not None:
+        file_names = await _run(executor, os.listdir, context.location_path)
+
+    contexts = nomenclator.context.update_many(
+        [context], discover_next_version=discover_next_version,
+        fetch_file_names=lambda _: file_names
+    )
+    return next(contexts)
+
+
+async def fetch_next_version(path, pattern, token_mapping, executor=None):
+    """Fetch next version from scene files saved in *path*.
+
+    This is the asynchronous counterpart of
+    :func:`nomenclator.utilities.fetch_next_version`. The *path* is listed in
+    *executor*.
+
+    :param path: Path to fetch scene files from.
+
+    :param pattern: Pattern to compare scene files with.
+
+    :param token_mapping: Mapping regrouping resolved token values associated
+        with their name.
+
+    :param executor: :class:`concurrent.futures.Executor` instance. Default is
+        None, which means that the default executor of the event loop is used.
+
+    :return: version integer.
+
+    """
+    file_names = await _run(executor, os.listdir, path)
+
+    return nomenclator.utilities.fetch_next_version(
+        path, pattern, token_mapping, file_names=file_names
+    )
+
+
+async def _run(executor, function, *args, **kwargs):
+    """Return result of *function* executed in *executor*."""
+    loop = asyncio.get_event_loop()
+
+    return await loop.run_in_executor(
+        executor, functools.partial(function, *args, **kwargs)
+    )
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+
+import os
+import threading
+
+try:
+    import queue
+except ImportError:
+    # Python 2
+    import Queue as queue
+
+import nomenclator.utilities
+
+#: Maximum number of directories waiting to be classified.
+MAX_PENDING_PATHS = 10000
+
+#: Status of a directory matching exactly one template of each kind.
+MATCHED = "matched"
+
+#: Status of a directory matching no templates.
+UNMATCHED = "unmatched"
+
+#: Status of a directory matching several templates of the same kind.
+AMBIGUOUS = "ambiguous"
+
+
+def audit(root, config, jobs=1, max_depth=None):
+    """Yield classification records for all directories under *root*.
+
+    Each directory is compared against the composition and project template
+    configurations from *config* with the same logic as
+    :func:`nomenclator.utilities.fetch_template_config`. The first template
+    matching is the one used by the dialogs, so a directory matching several
+    templates of the same kind is reported as ambiguous.
+
+    Records are yielded as soon as directories are listed, so the tree is
+    never held in memory. The order of records is not deterministic.
+
+    :param root: Path to the root folder to audit.
+
+    :param config: :class:`~nomenclator.config.Config` instance.
+
+    :param jobs: Number of threads listing directories in parallel.
+        Default is 1.
+
+    :param max_depth: Maximum depth of directories to audit relatively to
+        *root*. Default is None, which means that the whole tree is audited.
+
+    :return: Generator of mappings containing the "path", the "status" and the
+        list of matching templates for each kind ("comp" and "project"). Each
+        matching template is represented by a mapping with its "id" and the
+        "tokens" extracted from the path.
+
+    """
+    for path in walk(root, jobs=jobs, max_depth=max_depth):
+        yield classify(
+            path, config.comp_template_configs,
+            config.project_template_configs
+        )
+
+
+def classify(path, comp_template_configs, project_template_configs):
+    """Return classification record for directory *path*.
+
+    :param path: Path to the directory.
+
+    :param comp_template_configs: List of
+        :class:`~nomenclator.config.TemplateConfig` instances for composition
+        scripts.
+
+    :param project_template_configs: List of
+        :class:`~nomenclator.config.TemplateConfig` instances for projects.
+
+    :return: Mapping containing the "path", the "status" and the list of
+        matching templates for each kind ("comp" and "project").
+
+    """
+    record = {"path": path}
+
+    for kind, template_configs in [
+        ("comp", comp_template_configs),
+        ("project", project_template_configs)
+    ]:
+        record[kind] = [
+            {"id": config.id, "tokens": tokens}
+            for config, tokens in
+            nomenclator.utilities.fetch_matching_template_configs(
+                path, template_configs
+            )
+        ]
+
+    if len(record["comp"]) > 1 or len(record["project"]) > 1:
+        record["status"] = AMBIGUOUS
+
+    elif len(record["comp"]) or len(record["project"]):
+        record["status"] = MATCHED
+
+    else:
+        record["status"] = UNMATCHED
+
+    return record
+
+
+def walk(root, jobs=1, max_depth=None):
+    """Yield paths of *root* and all directories under *root*.
+
+    Directories are listed in parallel by *jobs* threads. Symbolic links are
+    not followed and directories which cannot be listed are yielded without
+    their content.
+
+    :param root: Path to the root folder.
+
+    :param jobs: Number of threads listing directories in parallel.
+        Default is 1.
+
+    :param max_depth: Maximum depth of directories to yield relatively to
+        *root*. Default is None, which means that the whole tree is walked.
+
+    :return: Generator of directory paths.
+
+    """
+    directories = queue.Queue()
+    paths = queue.Queue(maxsize=MAX_PENDING_PATHS)
+    stop_event = threading.Event()
+
+    # Number of directories queued or being listed.
+    pending = {"value": 1}
+    lock = threading.Lock()
+
+    # Sentinel indicating that all directories have been listed.
+    done = object()
+
+    def _list():
+        """List directories from queue until stopped."""
+        while not stop_event.is_set():
+            try:
+                path, depth = directories.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            sub_paths = []
+            if max_depth is None or depth < max_depth:
+                sub_paths = _fetch_sub_directories(path)
+
+            with lock:
+                pending["value"] += len(sub_paths)
+
+            for _path in sub_paths:
+                directories.put((_path, depth + 1))
+
+            _put(paths, path, stop_event)
+
+            # The path must be yielded before the directory is considered
+            # listed to ensure that it comes before the sentinel.
+            with lock:
+                pending["value"] -= 1
+                is_last = pending["value"] == 0
+
+            if is_last:
+                _put(paths, done, stop_event)
+
+    directories.put((os.path.abspath(root), 0))
+
+    for _ in range(max(1, jobs)):
+        thread = threading.Thread(target=_list)
+        thread.daemon = True
+        thread.start()
+
+    try:
+        while True:
+            path = paths.get()
+            if path is done:
+                return
+
+            yield path
+
+    finally:
+        stop_event.set()
+
+
+def _put(_queue, item, stop_event):
+    """Put *item* into *_queue* unless *stop_event* is set while waiting."""
+    while not stop_event.is_set():
+        try:
+            _queue.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            continue
+
+
+def _fetch_sub_directories(path):
+    """Return paths of directories within *path* without following links."""
+    try:
+        if hasattr(os, "scandir"):
+            return [
+                entry.path for entry in os.scandir(path)
+                if entry.is_dir(follow_symlinks=False)
+            ]
+
+        # Python 2
+        return [
+            _path for _path in (
+                os.path.join(path, name) for name in os.listdir(path)
+            )
+            if os.path.isdir(_path) and not os.path.islink(_path)
+        ]
+
+    except OSError:
+        return []
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import sys
+
+import nomenclator.config
+import nomenclator.context
+import nomenclator.scanner
+import nomenclator.utilities
+
+#: Prefix of the output line containing the result.
+RESULT_PREFIX = "nomenclator-result:"
+
+#: Script executed by Nuke in terminal mode to process a composition script.
+BOOTSTRAP_SCRIPT = "import nomenclator.batch\nnomenclator.batch.main()\n"
+
+
+def process_script(path, dry_run=False):
+    """Update render outputs of composition script from *path*.
+
+    The script is opened in the current :term:`Nuke` session and render
+    outputs are updated with the same logic as the Outputs Manager dialog.
+    The script is then saved unless *dry_run* is True.
+
+    :param path: Path to the composition script.
+
+    :param dry_run: Indicate whether changes should only be returned without
+        updating and saving the script. Default is False.
+
+    :return: Result mapping.
+
+    """
+    import nuke
+
+    nuke.scriptOpen(path)
+
+    config = nomenclator.config.fetch(location_path=os.path.dirname(path))
+    context = nomenclator.context.fetch(config)
+    context = update(context)
+
+    changes = fetch_changes(context)
+    error = fetch_error(context)
+
+    if error is None and not dry_run and len(changes):
+        nomenclator.utilities.update_nodes(context)
+        nuke.scriptSave()
+
+    return {
+        "path": path,
+        "changes": changes,
+        "error": error,
+    }
+
+
+def preview_script(path):
+    """Return changes to apply to render outputs of composition script *path*.
+
+    Output nodes are extracted from the script with
+    :func:`nomenclator.scanner.fetch_nodes` without launching :term:`Nuke`,
+    so the script is never updated.
+
+    :param path: Path to the composition script.
+
+    :return: Result mapping.
+
+    """
+    try:
+        nodes = nomenclator.scanner.fetch_nodes(path)
+
+        config = nomenclator.config.fetch(location_path=os.path.dirname(path))
+        context = nomenclator.context.fetch(config, path=path, nodes=nodes)
+        context = update(context)
+
+    except Exception as error:
+        return {"path": path, "changes": [], "error": str(error)}
+
+    return {
+        "path": path,
+        "changes": fetch_changes(context),
+        "error": fetch_error(context),
+    }
+
+
+def update(context):
+    """Return *context* updated from the name of its composition script.
+
+    The description and the version are extracted from the script name with
+    :func:`nomenclator.utilities.fetch_scene_tokens`, so that scripts saved
+    under any description keep their description and version.
+
+    :param context: :class:`~nomenclator.context.Context` instance.
+
+    :return: updated :class:`~nomenclator.context.Context` instance.
+
+    :raise: :exc:`ValueError` if the script name does not match the
+        template configuration of its location.
+
+    """
+    token_mapping = dict(context.tokens)
+
+    config = nomenclator.utilities.fetch_template_config(
+        context.location_path, context.template_configs, token_mapping
+    )
+
+    # Errors are reported by the context when no template matches.
+    if config is not None:
+        token_mapping.update({
+            "padding": context.padding,
+            "username": context.username
+        })
+
+        data = nomenclator.utilities.fetch_scene_tokens(
+            context.path, config.pattern_base, token_mapping
+        )
+        if data is None or not int(data.get("version", 0)):
+            raise ValueError(
+                "Script name does not match template configuration "
+                "[{}]: {}".format(config.id, os.path.basename(context.path))
+            )
+
+        if data.get("description") is not None:
+            # noinspection PyProtectedMember
+            context = context._replace(description=data["description"])
+
+    return nomenclator.context.update(context, discover_next_version=False)
+
+
+def fetch_changes(context):
+    """Return list of changes to apply to outputs from *context*.
+
+    :param context: :class:`~nomenclator.context.Context` instance.
+
+    :return: List of mappings containing the node name, the new node name,
+        the old output path and the new output path.
+
+    """
+    changes = []
+
+    for output in context.outputs:
+        if not output.enabled:
+            continue
+
+        if output.path == output.old_path and output.name == output.new_name:
+            continue
+
+        changes.append({
+            "name": output.name,
+            "new_name": output.new_name,
+            "old_path": output.old_path,
+            "path": output.path,
+        })
+
+    return changes
+
+
+def fetch_error(context):
+    """Return error message which prevent outputs from *context* to be updated.
+
+    :param context: :class:`~nomenclator.context.Context` instance.
+
+    :return: Error message or None.
+
+    """
+    for output in context.outputs:
+        if output.enabled and output.error is not None:
+            return "{}: {}".format(output.name, output.error["message"])
+
+    if context.error is not None:
+        return context.error["message"]
+
+    return None
+
+
+def main(arguments=None):
+    """Process script from command line *arguments* and print result.
+
+    This is executed by :term:`Nuke` in terminal mode with
+    :data:`BOOTSTRAP_SCRIPT`::
+
+        nuke -t bootstrap.py /path/to/script.nk [--dry-run]
+
+    The result is printed as JSON on a single line prefixed by
+    :data:`RESULT_PREFIX`.
+
+    :param arguments: List of command line arguments. Default is None, which
+        means that :data:`sys.argv` is used.
+
+    """
+    if arguments is None:
+        arguments = sys.argv[1:]
+
+    path = arguments[0]
+    dry_run = "--dry-run" in arguments[1:]
+
+    try:
+        result = process_script(path, dry_run=dry_run)
+    except Exception as error:
+        result = {"path": path, "changes": [], "error": str(error)}
+
+    print(RESULT_PREFIX + json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,455 @@
+# -*- coding: utf-8 -*-
+
+import argparse
+import glob
+import json
+import multiprocessing
+import multiprocessing.pool
+import os
+import subprocess
+import sys
+import tempfile
+
+import nomenclator.audit
+import nomenclator.batch
+import nomenclator.config
+import nomenclator.service
+from nomenclator._version import __version__
+
+
+def main(arguments=None):
+    """Execute command line interface from *arguments*.
+
+    :param arguments: List of command line arguments. Default is None, which
+        means that :data:`sys.argv` is used.
+
+    :return: Exit code.
+
+    """
+    parser = construct_parser()
+    namespace = parser.parse_args(arguments)
+
+    if namespace.command == "rename":
+        paths = fetch_script_paths(namespace.paths)
+        if not len(paths):
+            parser.error("no composition scripts found.")
+
+        results = rename(
+            paths,
+            dry_run=namespace.dry_run or namespace.headless,
+            jobs=namespace.jobs,
+            nuke_executable=namespace.nuke,
+            headless=namespace.headless,
+        )
+        return 0 if all(result["error"] is None for result in results) else 1
+
+    if namespace.command == "audit":
+        if not os.path.isdir(namespace.root):
+            parser.error("{} is not a directory.".format(namespace.root))
+
+        summary = audit(
+            namespace.root,
+            jobs=namespace.jobs,
+            max_depth=namespace.max_depth,
+            statuses=namespace.status,
+        )
+        return 0 if not summary[nomenclator.audit.AMBIGUOUS] else 1
+
+    if namespace.command == "serve":
+        serve(namespace.socket or namespace.port, jobs=namespace.jobs)
+        return 0
+
+    parser.print_help()
+    return 1
+
+
+def construct_parser():
+    """Return argument parser for the command line interface."""
+    parser = argparse.ArgumentParser(
+        prog="nomenclator",
+        description="Apply naming conventions to Nuke composition scripts."
+    )
+    parser.add_argument(
+        "--version", action="version", version="%(prog)s " + __version__
+    )
+
+    subparsers = parser.add_subparsers(dest="command")
+
+    rename_parser = subparsers.add_parser(
+        "rename",
+        help="Update render outputs of composition scripts.",
+        description=(
+            "Update render outputs of composition scripts from the "
+            "configuration and save them."
+        )
+    )
+    rename_parser.add_argument(
+        "paths", nargs="+", metavar="PATH",
+        help="Paths or glob patterns of composition scripts (.nk)."
+    )
+    rename_parser.add_argument(
+        "-n", "--dry-run", action="store_true",
+        help="Print changes without updating scripts."
+    )
+    rename_parser.add_argument(
+        "--headless", action="store_true",
+        help=(
+            "Read scripts without launching Nuke. Scripts are never updated "
+            "in this mode, which implies --dry-run."
+        )
+    )
+    rename_parser.add_argument(
+        "-j", "--jobs", type=int, default=multiprocessing.cpu_count(),
+        help="Number of scripts processed in parallel. Default is %(default)s."
+    )
+    rename_parser.add_argument(
+        "--nuke", default="nuke",
+        help="Path to Nuke executable. Default is '%(default)s'."
+    )
+
+    statuses = [
+        nomenclator.audit.MATCHED,
+        nomenclator.audit.UNMATCHED,
+        nomenclator.audit.AMBIGUOUS,
+    ]
+
+    audit_parser = subparsers.add_parser(
+        "audit",
+        help="Classify directories of a show against template configurations.",
+        description=(
+            "Classify all directories under a root folder against composition "
+            "and project template configurations, and print one JSON record "
+            "per directory. Exit with code 1 if any directory matches several "
+            "templates of the same kind."
+        )
+    )
+    audit_parser.add_argument(
+        "root", metavar="ROOT", help="Path to the root folder to audit."
+    )
+    audit_parser.add_argument(
+        "-j", "--jobs", type=int, default=multiprocessing.cpu_count() * 4,
+        help=(
+            "Number of threads listing directories in parallel. "
+            "Default is %(default)s."
+        )
+    )
+    audit_parser.add_argument(
+        "--max-depth", type=int, default=None,
+        help="Maximum depth of directories to audit relatively to ROOT."
+    )
+    audit_parser.add_argument(
+        "--status", action="append", choices=statuses,
+        help=(
+            "Only print records with this status. Can be used several times. "
+            "Default is to print all records."
+        )
+    )
+
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Start local naming service.",
+        description=(
+            "Start a local service resolving scene names, output paths and "
+            "next versions over JSON-RPC."
+        )
+    )
+    group = serve_parser.add_mutually_exclusive_group(required=True)
+    group.add_argument(
+        "--socket", metavar="PATH", help="Path to the Unix socket to listen on."
+    )
+    group.add_argument(
+        "--port", type=int, help="Port to listen on the local host."
+    )
+    serve_parser.add_argument(
+        "-j", "--jobs", type=int, default=multiprocessing.cpu_count(),
+        help=(
+            "Number of connections handled concurrently. "
+            "Default is %(default)s."
+        )
+    )
+
+    return parser
+
+
+def fetch_script_paths(patterns):
+    """Return composition script paths from list of *patterns*.
+
+    :param patterns: List of paths or glob patterns.
+
+    :return: List of composition script paths sorted as requested.
+
+    """
+    paths = []
+
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern)) or [pattern]:
+            path = os.path.abspath(path)
+
+            if not path.endswith(".nk") or not os.path.isfile(path):
+                continue
+
+            if path not in paths:
+                paths.append(path)
+
+    return paths
+
+
+def rename(
+    paths, dry_run=False, jobs=1, nuke_executable="nuke", headless=False,
+    stream=None
+):
+    """Update render outputs of composition scripts from *paths*.
+
+    Each script is processed in a separate :term:`Nuke` process in terminal
+    mode with :func:`nomenclator.batch.main`, so that an error in one script
+    does not affect the others. Changes for each script and a summary are
+    written to *stream* as soon as they are available.
+
+    If *headless* is True, scripts are read with
+    :func:`nomenclator.batch.preview_script` in a pool of worker processes
+    without launching :term:`Nuke`, and are never updated.
+
+    :param paths: List of composition script paths.
+
+    :param dry_run: Indicate whether changes should only be printed without
+        updating scripts. Default is False.
+
+    :param jobs: Number of scripts processed in parallel. Default is 1.
+
+    :param nuke_executable: Path to :term:`Nuke` executable. Default is "nuke".
+
+    :param headless: Indicate whether scripts should be read without
+        launching :term:`Nuke`. Default is False.
+
+    :param stream: Stream to write the report to. Default is None, which
+        means that :data:`sys.stdout` is used.
+
+    :return: List of result mappings sorted as *paths*.
+
+    """
+    stream = stream or sys.stdout
+
+    if headless:
+        pool = multiprocessing.Pool(max(1, jobs))
+
+        try:
+            return _process_all(
+                pool, nomenclator.batch.preview_script, paths, stream,
+                dry_run=True
+            )
+
+        finally:
+            pool.close()
+            pool.join()
+
+    handle, bootstrap_path = tempfile.mkstemp(suffix=".py")
+
+    with os.fdopen(handle, "w") as bootstrap_stream:
+        bootstrap_stream.write(nomenclator.batch.BOOTSTRAP_SCRIPT)
+
+    def _process(path):
+        """Process composition script from *path*."""
+        return process_script(
+            path, bootstrap_path, dry_run=dry_run,
+            nuke_executable=nuke_executable
+        )
+
+    pool = multiprocessing.pool.ThreadPool(max(1, jobs))
+
+    try:
+        return _process_all(pool, _process, paths, stream, dry_run=dry_run)
+
+    finally:
+        pool.close()
+        pool.join()
+        os.remove(bootstrap_path)
+
+
+def _process_all(pool, function, paths, stream, dry_run=False):
+    """Process all *paths* with *function* in *pool* and write report.
+
+    :return: List of result mappings sorted as *paths*.
+
+    """
+    results = []
+
+    for result in pool.imap(function, paths):
+        write_result(result, stream, dry_run=dry_run)
+        results.append(result)
+
+    write_summary(results, stream, dry_run=dry_run)
+    return results
+
+
+def process_script(path, bootstrap_path, dry_run=False, nuke_executable="nuke"):
+    """Process composition script from *path* in a :term:`Nuke` process.
+
+    :param path: Path to the composition script.
+
+    :param bootstrap_path: Path to the script executed by :term:`Nuke`.
+
+    :param dry_run: Indicate whether changes should only be returned without
+        updating the script. Default is False.
+
+    :param nuke_executable: Path to :term:`Nuke` executable. Default is "nuke".
+
+    :return: Result mapping.
+
+    """
+    command = [nuke_executable, "-t", bootstrap_path, path]
+    if dry_run:
+        command.append("--dry-run")
+
+    # Ensure that the package can be imported by Nuke.
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([
+        _path for _path in [
+            os.path.dirname(os.path.dirname(nomenclator.batch.__file__)),
+            env.get("PYTHONPATH")
+        ] if _path
+    ])
+
+    try:
+        process = subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=env
+        )
+        output, _ = process.communicate()
+
+    except OSError as error:
+        return {"path": path, "changes": [], "error": str(error)}
+
+    lines = output.decode("utf-8", "replace").splitlines()
+
+    for line in reversed(lines):
+        if line.startswith(nomenclator.batch.RESULT_PREFIX):
+            return json.loads(line[len(nomenclator.batch.RESULT_PREFIX):])
+
+    message = "Nuke exited with code {}".format(process.returncode)
+    if len(lines):
+        message += ": {}".format(lines[-1])
+
+    return {"path": path, "changes": [], "error": message}
+
+
+def write_result(result, stream, dry_run=False):
+    """Write *result* mapping for one composition script to *stream*."""
+    if result["error"] is not None:
+        stream.write("[error] {}\n".format(result["path"]))
+        stream.write("    {}\n".format(result["error"]))
+
+    elif not len(result["changes"]):
+        stream.write("[unchanged] {}\n".format(result["path"]))
+
+    else:
+        label = "would update" if dry_run else "updated"
+        stream.write("[{}] {}\n".format(label, result["path"]))
+
+        for change in result["changes"]:
+            name = change["name"]
+            if change["new_name"] != name:
+                name = "{} -> {}".format(name, change["new_name"])
+
+            stream.write("    {}\n".format(name))
+            stream.write("    - {}\n".format(change["old_path"]))
+            stream.write("    + {}\n".format(change["path"]))
+
+    stream.flush()
+
+
+def write_summary(results, stream, dry_run=False):
+    """Write summary of all *results* to *stream*."""
+    failed = [result for result in results if result["error"] is not None]
+    updated = [
+        result for result in results
+        if result["error"] is None and len(result["changes"])
+    ]
+
+    stream.write(
+        "\n{} script(s) processed: {} {}, {} unchanged, {} failed.\n".format(
+            len(results), len(updated),
+            "would be updated" if dry_run else "updated",
+            len(results) - len(updated) - len(failed), len(failed)
+        )
+    )
+    stream.flush()
+
+
+def audit(root, jobs=1, max_depth=None, statuses=None, stream=None):
+    """Classify directories under *root* against template configurations.
+
+    The configuration is fetched for *root*, so a configuration file
+    discovered from the location is used (see
+    :func:`nomenclator.config.discover`). Each record returned by
+    :func:`nomenclator.audit.audit` is written to *stream* as a JSON line, and
+    a summary is written to :data:`sys.stderr`.
+
+    :param root: Path to the root folder to audit.
+
+    :param jobs: Number of threads listing directories in parallel.
+        Default is 1.
+
+    :param max_depth: Maximum depth of directories to audit relatively to
+        *root*. Default is None, which means that the whole tree is audited.
+
+    :param statuses: List of statuses of records to write. Default is None,
+        which means that all records are written.
+
+    :param stream: Stream to write the records to. Default is None, which
+        means that :data:`sys.stdout` is used.
+
+    :return: Mapping regrouping the number of directories associated with
+        each status.
+
+    """
+    stream = stream or sys.stdout
+
+    config = nomenclator.config.fetch(location_path=root)
+
+    summary = {
+        nomenclator.audit.MATCHED: 0,
+        nomenclator.audit.UNMATCHED: 0,
+        nomenclator.audit.AMBIGUOUS: 0,
+    }
+
+    for record in nomenclator.audit.audit(
+        root, config, jobs=jobs, max_depth=max_depth
+    ):
+        summary[record["status"]] += 1
+
+        if statuses is None or record["status"] in statuses:
+            stream.write(json.dumps(record, sort_keys=True) + "\n")
+
+    stream.flush()
+
+    sys.stderr.write(
+        "{} directories audited: {} matched, {} unmatched, {} ambiguous.\n"
+        .format(
+            sum(summary.values()), summary[nomenclator.audit.MATCHED],
+            summary[nomenclator.audit.UNMATCHED],
+            summary[nomenclator.audit.AMBIGUOUS],
+        )
+    )
+
+    return summary
+
+
+def serve(address, jobs=1):
+    """Start naming service listening on *address* until interrupted.
+
+    :param address: Path to a Unix socket, or port number on the local host.
+
+    :param jobs: Number of connections handled concurrently. Default is 1.
+
+    """
+    server = nomenclator.service.create_server(address, jobs=jobs)
+
+    sys.stderr.write(
+        "Naming service listening on {}\n".format(server.server_address)
+    )
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
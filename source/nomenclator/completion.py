@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+
+# Directory listings used to complete location paths. Directories are listed
+# by a background thread and cached, so that typing a location is never
+# blocked by slow storage.
+
+import os
+import threading
+
+import nomenclator.utilities
+
+#: Maximum number of directory listings kept in memory before the cache is
+#: cleared.
+CACHE_SIZE = 256
+
+
+class DirectoryLister(object):
+    """Lister fetching sub-directory names in a background thread.
+
+    Listings are cached per directory. When a listing is not cached yet, it
+    is scheduled and *callback* is called from the background thread once it
+    is available::
+
+        >>> lister = DirectoryLister(callback=handle_listing)
+        >>> lister.fetch("/path") is None
+        True
+        >>> # 'handle_listing' is called with "/path" and ("a", "b").
+        >>> lister.fetch("/path")
+        ("a", "b")
+
+    The directory requested last is listed first, and the thread stops once
+    all requested directories are listed.
+
+    """
+
+    def __init__(self, callback=None, cache_size=CACHE_SIZE):
+        """Initiate lister.
+
+        :param callback: Function called with the directory path and the
+            tuple of sub-directory names once a directory is listed. Default
+            is None.
+
+        :param cache_size: Maximum number of listings kept in memory. Default
+            is :data:`CACHE_SIZE`.
+
+        """
+        self._callback = callback
+        self._cache_size = cache_size
+        self._cache = {}
+        self._paths = []
+        self._generation = 0
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def fetch(self, path):
+        """Return sub-directory names of *path* if listed.
+
+        :param path: Path to the directory to list.
+
+        :return: Tuple of sub-directory names, or None if the directory is not
+            listed yet.
+
+        """
+        with self._lock:
+            if path in self._cache:
+                return self._cache[path]
+
+            if path in self._paths:
+                self._paths.remove(path)
+
+            self._paths.append(path)
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._process)
+                self._thread.daemon = True
+                self._thread.start()
+
+        return None
+
+    def cancel(self):
+        """Drop pending listings and ignore listing in progress.
+
+        Listings already cached are kept.
+
+        """
+        with self._lock:
+            self._paths = []
+            self._generation += 1
+
+    def clear(self):
+        """Remove all listings from the cache."""
+        with self._lock:
+            self._cache.clear()
+
+    def wait(self, timeout=None):
+        """Wait until all pending listings are done.
+
+        :param timeout: Maximum number of seconds to wait. Default is None,
+            which means that this function waits until all directories are
+            listed.
+
+        :return: Boolean indicating whether all directories were listed.
+
+        """
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+            return not thread.is_alive()
+
+        return True
+
+    def _process(self):
+        """List requested directories until none are pending."""
+        while True:
+            with self._lock:
+                if not len(self._paths):
+                    self._thread = None
+                    return
+
+                path = self._paths.pop()
+                generation = self._generation
+
+            names = list_directories(path)
+
+            with self._lock:
+                if len(self._cache) >= self._cache_size:
+                    self._cache.clear()
+
+                self._cache[path] = names
+                is_cancelled = generation != self._generation
+
+            if self._callback is not None and not is_cancelled:
+                self._callback(path, names)
+
+
+def list_directories(path):
+    """Return sorted tuple of sub-directory names within *path*.
+
+    An empty tuple is returned if *path* cannot be listed.
+
+    """
+    try:
+        if hasattr(os, "scandir"):
+            names = [entry.name for entry in os.scandir(path) if entry.is_dir()]
+
+        else:
+            # Python 2
+            names = [
+                name for name in os.listdir(path)
+                if os.path.isdir(os.path.join(path, name))
+            ]
+
+    except OSError:
+        return tuple()
+
+    return tuple(sorted(names, key=lambda name: name.lower()))
+
+
+def fetch_completions(
+    text, names, recent_locations=None, template_configs=None
+):
+    """Return list of location paths completing *text*.
+
+    Recent locations starting with *text* come first, followed by the
+    directories whose path match one of the template configurations, and then
+    by the other directories. Comparisons are case insensitive.
+
+    :param text: Location path being typed.
+
+    :param names: Sub-directory names of the parent folder of *text* returned
+        by :func:`list_directories`.
+
+    :param recent_locations: List of recent location paths. Default is None.
+
+    :param template_configs: List of available
+        :class:`~nomenclator.config.TemplateConfig` instances. Default is None.
+
+    :return: List of paths.
+
+    """
+    folder, prefix = os.path.split(text)
+    prefix = prefix.lower()
+
+    completions = []
+
+    for path in recent_locations or []:
+        if (
+            path.lower().startswith(text.lower()) and path != text
+            and path not in completions
+        ):
+            completions.append(path)
+
+    paths = [
+        os.path.join(folder, name) for name in names
+        if name.lower().startswith(prefix)
+    ]
+
+    def _is_matching(_path):
+        """Indicate whether *_path* matches a template configuration."""
+        return nomenclator.utilities.fetch_template_config(
+            _path, template_configs or [], {}
+        ) is not None
+
+    completions += [
+        path for path in sorted(paths, key=lambda p: not _is_matching(p))
+        if path not in completions
+    ]
+
+    return completions
@@ -3,10 +3,15 @@
 import os
 import collections
 import getpass
+import threading
+import time
 
+import nomenclator.profiling
 import nomenclator.vendor.toml as toml
 from nomenclator.symbol import (
     CONFIG_FILE_NAME,
+    DEFAULT_WATCHER_INTERVAL,
+    DISCOVERY_CACHE_TIMEOUT,
     DEFAULT_EXPRESSION,
     DEFAULT_MATCH_START,
     DEFAULT_MATCH_END,
@@ -66,37 +71,497 @@ OutputTemplateConfig = collections.namedtuple(
 )
 
 
+#: Cached data mappings associated with each configuration file path.
+_LAYER_CACHE = {}
+
+#: Cached modification stamps and configuration objects associated with each
+#: list of configuration file paths merged.
+_CACHE = {}
+
+#: Thread and event used to watch configuration files.
+_WATCHER = {}
+
+#: Cached discovery results associated with each folder.
+_DISCOVERY_CACHE = {}
+
+#: Lock protecting the configuration caches.
+_LOCK = threading.Lock()
+
+
 def path():
     """Return path to configuration file.
 
     The configuration file is returned from the :envvar:`NOMENCLATOR_CONFIG_PATH`
     environment variable, or from the :file:`~/.nuke` folder.
 
+    When several folders are defined in the :envvar:`NOMENCLATOR_CONFIG_PATH`
+    environment variable, the last one is returned as it has the highest
+    priority.
+
+    """
+    return paths()[-1]
+
+
+def paths():
+    """Return paths to all configuration files sorted by priority.
+
+    The configuration files are returned from the
+    :envvar:`NOMENCLATOR_CONFIG_PATH` environment variable, which can contain
+    several folders separated by :data:`os.pathsep`. The last folder has the
+    highest priority. If the environment variable is not set, the
+    configuration file from the :file:`~/.nuke` folder is returned.
+
     """
     personal_path = os.path.join(os.path.expanduser("~"), ".nuke")
-    return os.path.join(os.getenv("NOMENCLATOR_CONFIG_PATH", personal_path), CONFIG_FILE_NAME)
+    value = os.getenv("NOMENCLATOR_CONFIG_PATH", personal_path)
+
+    folders = [folder for folder in value.split(os.pathsep) if len(folder)]
+    if not len(folders):
+        folders = [personal_path]
+
+    return [os.path.join(folder, CONFIG_FILE_NAME) for folder in folders]
+
+
+@nomenclator.profiling.timed("config.fetch")
+def fetch(location_path=None):
+    """Return configuration object.
+
+    All configuration files returned by :func:`paths` are merged following
+    the rules defined in :func:`merge`.
+
+    The configuration object is cached and will only be re-created when one
+    of the configuration files is added, removed or modified. Each
+    configuration file is only read once per modification. When the
+    configuration is watched (see :func:`start_watcher`), the cached
+    configuration object is returned without checking the files. If
+    *location_path* is specified, only the configuration file discovered is
+    checked.
+
+    :param location_path: Path to a location which can contain a
+        configuration file in one of its parent folders. If a configuration
+        file is found with :func:`discover`, it is merged over all other
+        configuration files. Default is None.
+
+    :return: :class:`Config` instance.
+
+    """
+    base_paths = config_paths = paths()
+
+    if location_path is not None:
+        location_config_path = discover(location_path)
+        if (
+            location_config_path is not None
+            and location_config_path not in config_paths
+        ):
+            config_paths = config_paths + [location_config_path]
+
+    key = tuple(config_paths)
+
+    with _LOCK:
+        watching = is_watching()
+
+        cached = _CACHE.get(key)
+        if cached is not None and location_path is None and watching:
+            return cached[1]
+
+        # Watched configuration files are kept up to date by the watcher, so
+        # that only the configuration file discovered is checked.
+        layers = [
+            _LAYER_CACHE.get(_path, (None, {}))
+            if watching and _path in base_paths else _fetch_layer(_path)
+            for _path in config_paths
+        ]
+        stamps = tuple(stamp for stamp, _ in layers)
+
+        if cached is None or cached[0] != stamps:
+            data = {}
+
+            for _, _data in layers:
+                data = merge(data, _data)
+
+            cached = (stamps, load(data))
+            _CACHE[key] = cached
+
+        return cached[1]
+
+
+def start_watcher(interval=DEFAULT_WATCHER_INTERVAL):
+    """Start watching configuration files in a background thread.
+
+    Configuration files are polled every *interval* seconds and the cached
+    configuration object is re-created as soon as one of the files is
+    modified, so that :func:`fetch` always returns an up-to-date
+    configuration without reading any file.
+
+    Nothing is done if the configuration is already watched.
+
+    :param interval: Number of seconds between each check. Default is
+        :data:`~nomenclator.symbol.DEFAULT_WATCHER_INTERVAL`.
+
+    """
+    with _LOCK:
+        if _WATCHER.get("thread") is not None:
+            return
+
+        event = threading.Event()
+        thread = threading.Thread(target=_watch, args=(event, interval))
+        thread.daemon = True
+
+        _WATCHER["event"] = event
+        _WATCHER["thread"] = thread
+
+    # Ensure that the configuration is loaded before watching it.
+    _refresh()
+
+    thread.start()
+
+
+def stop_watcher():
+    """Stop watching configuration files."""
+    with _LOCK:
+        event = _WATCHER.pop("event", None)
+        thread = _WATCHER.pop("thread", None)
+
+    if event is not None:
+        event.set()
+
+    if thread is not None and thread.is_alive():
+        thread.join()
+
+
+def is_watching():
+    """Indicate whether configuration files are watched."""
+    return _WATCHER.get("thread") is not None
+
+
+def _watch(event, interval):
+    """Refresh configuration every *interval* seconds until *event* is set."""
+    while not event.wait(interval):
+        _refresh()
+
+
+def _refresh():
+    """Re-create configuration object if configuration files were modified.
+
+    Errors are ignored so that the previous configuration object is kept if
+    a configuration file cannot be read.
+
+    """
+    config_paths = paths()
+
+    try:
+        with _LOCK:
+            stamps = tuple(_fetch_layer(_path)[0] for _path in config_paths)
+            cached = _CACHE.get(tuple(config_paths))
+            if cached is not None and cached[0] == stamps:
+                return
+
+            # Remove cached configuration so that it is re-created.
+            _CACHE.pop(tuple(config_paths), None)
+
+        fetch()
+
+    except Exception:
+        pass
+
+
+def discover(location_path):
+    """Return path to configuration file nearest to *location_path*.
+
+    Parent folders of *location_path* are walked upward until a folder
+    containing a :file:`nomenclator.toml` configuration file is found.
+
+    Result for each folder is cached and only checked again against the
+    folder modification time after :data:`~nomenclator.symbol.DISCOVERY_CACHE_TIMEOUT`
+    seconds, so that repeated discoveries within the same folders do not
+    access the file system.
+
+    :param location_path: Path to start the discovery from.
+
+    :return: Path to configuration file, or None if no configuration file
+        is found.
+
+    """
+    if not len(location_path):
+        return None
+
+    folder = os.path.abspath(location_path)
 
+    while True:
+        config_path = os.path.join(folder, CONFIG_FILE_NAME)
+        if _has_config_file(folder, config_path):
+            return config_path
 
-def fetch():
-    """Return configuration object."""
-    config_path = path()
+        parent_folder = os.path.dirname(folder)
+        if parent_folder == folder:
+            return None
 
-    data = {}
+        folder = parent_folder
 
-    if os.path.exists(config_path):
-        with open(config_path, "r") as stream:
-            data = toml.load(stream)
 
-    return load(data)
+def _has_config_file(folder, config_path):
+    """Indicate whether *folder* contains the configuration file.
+
+    :param folder: Path to folder to check.
+
+    :param config_path: Path to configuration file within *folder*.
+
+    :return: Boolean value.
+
+    """
+    now = time.time()
+
+    cached = _DISCOVERY_CACHE.get(folder)
+    if cached is not None and now - cached[1] < DISCOVERY_CACHE_TIMEOUT:
+        return cached[2]
+
+    try:
+        stamp = os.stat(folder).st_mtime
+    except OSError:
+        stamp = None
+
+    if cached is not None and cached[0] == stamp:
+        exists = cached[2]
+    else:
+        exists = stamp is not None and os.path.isfile(config_path)
+
+    _DISCOVERY_CACHE[folder] = (stamp, now, exists)
+    return exists
+
+
+def _fetch_layer(config_path):
+    """Return modification stamp and data mapping from *config_path*.
+
+    The data mapping is cached and only read again when the modification
+    stamp of the configuration file has changed.
+
+    :param config_path: Path to configuration file.
+
+    :return: Tuple containing the modification stamp, or None if the file does
+        not exist, and the data mapping.
+
+    """
+    try:
+        status = os.stat(config_path)
+    except OSError:
+        _LAYER_CACHE.pop(config_path, None)
+        return None, {}
+
+    stamp = (status.st_mtime, status.st_size)
+
+    cached = _LAYER_CACHE.get(config_path)
+    if cached is not None and cached[0] == stamp:
+        return cached
+
+    with open(config_path, "r") as stream:
+        data = toml.load(stream)
+
+    _LAYER_CACHE[config_path] = (stamp, data)
+    return stamp, data
+
+
+def merge(data, other):
+    """Return data mapping from *other* merged over *data*.
+
+    Incoming mappings will not be mutated. Values are merged with the following
+    rules:
+
+    * Template configurations are merged by identifier, so that a template from
+      *other* replaces the template from *data* with the same identifier.
+      New templates are appended.
+    * Tokens and colorspace aliases are merged by key.
+    * Other values from *other* replace values from *data*.
+
+    Values from *data* can be removed with a "removed" table in *other*, which
+    lists the identifiers of the templates and the keys of the tokens and
+    colorspace aliases to remove, or other keys set to true::
+
+        [removed]
+        tokens = ["key1"]
+        comp-templates = ["Episodic"]
+        default-padding = true
+
+    :param data: Data mapping with the lowest priority.
+
+    :param other: Data mapping with the highest priority.
+
+    :return: Merged data mapping.
+
+    """
+    merged = collections.OrderedDict(
+        (key, value) for key, value in data.items() if key != "removed"
+    )
+
+    for key, value in other.get("removed", {}).items():
+        if key in ("comp-templates", "project-templates"):
+            merged[key] = [
+                item for item in merged.get(key, [])
+                if item["id"] not in value
+            ]
+
+        elif key in ("tokens", "colorspace-aliases") and key in merged:
+            merged[key] = collections.OrderedDict(
+                (_key, _value) for _key, _value in merged.get(key, {}).items()
+                if _key not in value
+            )
+
+        elif value is True:
+            merged.pop(key, None)
+
+    for key, value in other.items():
+        if key == "removed":
+            continue
+
+        elif key in ("comp-templates", "project-templates"):
+            items = collections.OrderedDict(
+                (item["id"], item) for item in merged.get(key, [])
+            )
+            items.update((item["id"], item) for item in value)
+            merged[key] = list(items.values())
+
+        elif key in ("tokens", "colorspace-aliases"):
+            mapping = collections.OrderedDict(merged.get(key, {}))
+            mapping.update(value)
+            merged[key] = mapping
+
+        else:
+            merged[key] = value
+
+    return merged
 
 
 def save(config):
-    """Save *config* as a configuration file."""
-    data = dump(config)
+    """Save *config* as a configuration file.
+
+    The configuration file with the highest priority is used. When several
+    configuration files are used, only values which differ from the values
+    merged from the other configuration files are saved, and values removed
+    from these files are recorded in a "removed" table (see :func:`merge`).
+
+    """
+    base_paths = paths()[:-1]
+
+    if len(base_paths):
+        base_data = {}
+
+        with _LOCK:
+            for _path in base_paths:
+                _, _data = _fetch_layer(_path)
+                base_data = merge(base_data, _data)
+
+        data = _difference(config, load(base_data), base_data)
+
+    else:
+        data = dump(config)
 
     with open(path(), "w") as stream:
         toml.dump(data, stream)
 
+    # Ensure that the configuration object is re-created on next fetch.
+    with _LOCK:
+        _CACHE.clear()
+
+
+def _difference(config, base_config, base_data):
+    """Return data mapping with values from *config* not in *base_config*.
+
+    Values are recorded even when they are identical to the default values,
+    so that they override values from configuration files with lower
+    priority.
+
+    :param config: :class:`Config` instance to save.
+
+    :param base_config: :class:`Config` instance loaded from configuration
+        files with lower priority.
+
+    :param base_data: Data mapping merged from configuration files with lower
+        priority.
+
+    :return: Data mapping.
+
+    """
+    data = collections.OrderedDict()
+    removed = collections.OrderedDict()
+
+    for key, value, base_value in [
+        ("descriptions", list(config.descriptions),
+         list(base_config.descriptions)),
+        ("default-description", config.default_description,
+         base_config.default_description),
+        ("create-subfolders", config.create_subfolders,
+         base_config.create_subfolders),
+        ("max-locations", config.max_locations, base_config.max_locations),
+        ("max-padding", config.max_padding, base_config.max_padding),
+        ("default-padding", config.default_padding,
+         base_config.default_padding),
+        ("username", None if config.username_is_default else config.username,
+         None if base_config.username_is_default else base_config.username),
+    ]:
+        if value == base_value:
+            continue
+
+        if value is None:
+            removed[key] = True
+        else:
+            data[key] = value
+
+    for key, items, base_items in [
+        ("colorspace-aliases", config.colorspace_aliases,
+         base_config.colorspace_aliases),
+        ("tokens", config.tokens, base_config.tokens),
+    ]:
+        items = collections.OrderedDict(items)
+        base_items = collections.OrderedDict(base_items)
+        if items == base_items:
+            continue
+
+        # Default colorspace aliases are replaced by the first mapping
+        # defined, so it must be complete.
+        if key not in base_data:
+            data[key] = items
+            continue
+
+        mapping = collections.OrderedDict(
+            (_key, value) for _key, value in items.items()
+            if base_items.get(_key) != value
+        )
+        if len(mapping):
+            data[key] = mapping
+
+        removed_keys = [_key for _key in base_items if _key not in items]
+        if len(removed_keys):
+            removed[key] = removed_keys
+
+    for key, items, base_items in [
+        ("comp-templates",
+         dump_template_configs(
+             config.comp_template_configs, include_outputs=True
+         ),
+         dump_template_configs(
+             base_config.comp_template_configs, include_outputs=True
+         )),
+        ("project-templates",
+         dump_template_configs(config.project_template_configs),
+         dump_template_configs(base_config.project_template_configs)),
+    ]:
+        base_items = collections.OrderedDict(
+            (item["id"], item) for item in base_items
+        )
+
+        keys = set(item["id"] for item in items)
+        removed_keys = [_key for _key in base_items if _key not in keys]
+        if len(removed_keys):
+            removed[key] = removed_keys
+
+        items = [item for item in items if base_items.get(item["id"]) != item]
+        if len(items):
+            data[key] = items
+
+    if len(removed):
+        data["removed"] = removed
+
+    return data
+
 
 def dump(config):
     """Return data mapping from *config* object."""
@@ -3,7 +3,10 @@
 import collections
 import copy
 import os
+import re
 
+import nomenclator.instrumentation
+import nomenclator.profiling
 import nomenclator.utilities
 import nomenclator.template
 
@@ -47,6 +50,7 @@ OutputContext = collections.namedtuple(
         "file_types",
         "multi_views",
         "colorspace",
+        "node_colorspace",
         "append_username_to_name",
         "append_colorspace_to_name",
         "append_passname_to_name",
@@ -56,7 +60,10 @@ OutputContext = collections.namedtuple(
 )
 
 
-def fetch(config, is_project=False):
+@nomenclator.profiling.timed("context.fetch")
+def fetch(
+    config, is_project=False, path=None, nodes=None, recent_locations=None
+):
     """Fetch context object.
 
     :param config: :class:`~nomenclator.config.Config` instance.
@@ -65,6 +72,19 @@ def fetch(config, is_project=False):
         Default is False, which means that the composition context will be
         returned.
 
+    :param path: Path to the scene file. Default is None, which means that
+        the path of the scene opened in the current session is used with the
+        recent locations. Otherwise, no recent locations are returned.
+
+    :param nodes: Tuple with a list of output nodes and a list of all node
+        names, as returned by :func:`nomenclator.utilities.fetch_nodes`.
+        Default is None, which means that nodes are fetched from the current
+        session.
+
+    :param recent_locations: List of recent location paths. Default is None,
+        which means that recent locations are fetched from the current session
+        when *path* is None.
+
     :return: :class:`Context` instance.
 
     """
@@ -81,20 +101,31 @@ def fetch(config, is_project=False):
     outputs = tuple()
 
     if not is_project:
-        path = nomenclator.utilities.fetch_current_comp_path()
         template_configs = config.comp_template_configs
         suffix = "nk"
-        recent_locations = nomenclator.utilities.fetch_recent_comp_paths(
-            max_values=config.max_locations,
-        )
+
+        if path is None:
+            path = nomenclator.utilities.fetch_current_comp_path()
+
+            if recent_locations is None:
+                recent_locations = nomenclator.utilities.fetch_recent_comp_paths(
+                    max_values=config.max_locations,
+                )
 
     else:
-        path = nomenclator.utilities.fetch_current_project_path()
         template_configs = config.project_template_configs
         suffix = "hrox"
-        recent_locations = nomenclator.utilities.fetch_recent_project_paths(
-            max_values=config.max_locations,
-        )
+
+        if path is None:
+            path = nomenclator.utilities.fetch_current_project_path()
+
+            if recent_locations is None:
+                recent_locations = nomenclator.utilities.fetch_recent_project_paths(
+                    max_values=config.max_locations,
+                )
+
+    if recent_locations is None:
+        recent_locations = tuple()
 
     # Fetch matching template configuration if possible.
     _config = None
@@ -109,13 +140,13 @@ def fetch(config, is_project=False):
         append_username_to_name = _config.append_username_to_name
 
         if not is_project:
-            outputs = fetch_outputs(config, _config.outputs)
+            outputs = fetch_outputs(config, _config.outputs, nodes=nodes)
 
     else:
         append_username_to_name = False
 
         if not is_project:
-            outputs = fetch_outputs(config, [])
+            outputs = fetch_outputs(config, [], nodes=nodes)
 
     return Context(
         location_path=os.path.dirname(path),
@@ -137,7 +168,8 @@ def fetch(config, is_project=False):
     )
 
 
-def fetch_outputs(config, template_configs):
+@nomenclator.profiling.timed("context.fetch_outputs")
+def fetch_outputs(config, template_configs, nodes=None):
     """Fetch list of output context objects.
 
     An output context is returned for each matching output node.
@@ -147,12 +179,20 @@ def fetch_outputs(config, template_configs):
     :param template_configs: List of
         :class:`~nomenclator.config.OutputTemplateConfig` instances.
 
+    :param nodes: Tuple with a list of output nodes and a list of all node
+        names, as returned by :func:`nomenclator.utilities.fetch_nodes`.
+        Default is None, which means that nodes are fetched from the current
+        session.
+
     :return: Tuple of :class:`OutputContext` instances.
 
     """
     outputs = []
 
-    nodes, node_names = nomenclator.utilities.fetch_nodes()
+    if nodes is None:
+        nodes = nomenclator.utilities.fetch_nodes()
+
+    nodes, node_names = nodes
     alias_mapping = dict(config.colorspace_aliases)
 
     mapping = {config.id: config for config in template_configs}
@@ -188,6 +228,8 @@ def fetch_outputs(config, template_configs):
             append_passname_to_name = False
             append_passname_to_subfolder = False
 
+        colorspace = nomenclator.utilities.fetch_colorspace(node, {})
+
         context = OutputContext(
             name=node.name(),
             new_name=node.name(),
@@ -201,7 +243,8 @@ def fetch_outputs(config, template_configs):
             file_type=nomenclator.utilities.fetch_file_type(node, "exr"),
             file_types=nomenclator.utilities.fetch_file_types(node),
             multi_views=nomenclator.utilities.has_multiple_views(node),
-            colorspace=nomenclator.utilities.fetch_colorspace(node, alias_mapping),
+            colorspace=alias_mapping.get(colorspace) or colorspace,
+            node_colorspace=colorspace,
             append_username_to_name=append_username_to_name,
             append_colorspace_to_name=append_colorspace_to_name,
             append_passname_to_name=append_passname_to_name,
@@ -213,7 +256,235 @@ def fetch_outputs(config, template_configs):
     return tuple(outputs)
 
 
-def update(context, discover_next_version=True):
+def create(
+    config, location_path, description=None, tokens=None, is_project=False,
+    outputs=tuple()
+):
+    """Create context object for *location_path* without opening any scene.
+
+    This is used to resolve names from tools running outside of :term:`Nuke`
+    and :term:`Hiero` with :func:`update` or :func:`update_many`.
+
+    :param config: :class:`~nomenclator.config.Config` instance.
+
+    :param location_path: Path to the folder where the scene would be saved.
+
+    :param description: Description of the scene. Default is None, which means
+        that the default description from *config* is used.
+
+    :param tokens: Mapping of token values added to the tokens from *config*.
+        Default is None.
+
+    :param is_project: Indicate whether the project context is requested.
+        Default is False, which means that the composition context will be
+        returned.
+
+    :param outputs: Tuple of :class:`OutputContext` instances. Default is an
+        empty tuple.
+
+    :return: :class:`Context` instance.
+
+    """
+    paddings = nomenclator.utilities.fetch_paddings(max_value=config.max_padding)
+
+    padding = config.default_padding
+    if padding is None and len(paddings):
+        padding = paddings[0]
+
+    if description is None:
+        description = config.default_description
+
+    if description is None and len(config.descriptions):
+        description = config.descriptions[0]
+
+    if not is_project:
+        template_configs = config.comp_template_configs
+        suffix = "nk"
+
+    else:
+        template_configs = config.project_template_configs
+        suffix = "hrox"
+
+    _config = nomenclator.utilities.fetch_template_config(
+        location_path, template_configs, {}
+    )
+
+    _tokens = dict(config.tokens)
+    _tokens.update(tokens or {})
+
+    return Context(
+        location_path=location_path,
+        recent_locations=tuple(),
+        path="",
+        suffix=suffix,
+        version=None,
+        description=description,
+        descriptions=config.descriptions,
+        append_username_to_name=(
+            _config is not None and _config.append_username_to_name
+        ),
+        padding=padding,
+        paddings=paddings,
+        create_subfolders=config.create_subfolders,
+        tokens=tuple(sorted(_tokens.items())),
+        username=config.username,
+        template_configs=template_configs,
+        outputs=outputs,
+        error=None
+    )
+
+
+def create_output(
+    template_configs, name, destination=None, passname=None, file_type="exr",
+    colorspace="default", multi_views=False
+):
+    """Create output context object without any output node.
+
+    This is used with :func:`create` to resolve output paths from tools
+    running outside of :term:`Nuke`.
+
+    :param template_configs: List of available
+        :class:`~nomenclator.config.OutputTemplateConfig` instances.
+
+    :param name: Name of the output.
+
+    :param destination: Identifier of the output template configuration to
+        use. Default is None, which means that the first output template
+        configuration sorted by identifier is used.
+
+    :param passname: Name of the pass. Default is None, which means that
+        *name* is used.
+
+    :param file_type: File type of the output. Default is "exr".
+
+    :param colorspace: Colorspace of the output. Default is "default".
+
+    :param multi_views: Indicate whether the output is rendered with multiple
+        views. Default is False.
+
+    :return: :class:`OutputContext` instance.
+
+    """
+    mapping = {config.id: config for config in template_configs}
+    destinations = tuple(sorted(mapping.keys()))
+
+    _config = mapping.get(destination)
+
+    if _config is None and len(destinations):
+        _config = mapping[destinations[0]]
+
+    return OutputContext(
+        name=name,
+        new_name=name,
+        blacklisted_names=tuple(),
+        path="",
+        old_path="",
+        passname=passname or name,
+        enabled=True,
+        destination=_config.id if _config is not None else "",
+        destinations=destinations,
+        file_type=file_type,
+        file_types=(file_type,),
+        multi_views=multi_views,
+        colorspace=colorspace,
+        node_colorspace=colorspace,
+        append_username_to_name=(
+            _config is not None and _config.append_username_to_name
+        ),
+        append_colorspace_to_name=(
+            _config is not None and _config.append_colorspace_to_name
+        ),
+        append_passname_to_name=(
+            _config is not None and _config.append_passname_to_name
+        ),
+        append_passname_to_subfolder=(
+            _config is not None and _config.append_passname_to_subfolder
+        ),
+        error=None
+    )
+
+
+def update_from_config(context, config):
+    """Return context object updated with values from *config*.
+
+    Incoming *context* will not be mutated.
+
+    This is used to apply a configuration discovered from the location path
+    of the context (see :func:`nomenclator.config.discover`). The default
+    description and padding of *config* are applied, or the current values
+    are kept if *config* does not define them and they are still available.
+    The colorspace aliases of *config* are applied to the outputs.
+
+    :param context: :class:`Context` instance.
+
+    :param config: :class:`~nomenclator.config.Config` instance.
+
+    :return: updated :class:`Context` instance.
+
+    """
+    if context.suffix == "hrox":
+        template_configs = config.project_template_configs
+    else:
+        template_configs = config.comp_template_configs
+
+    paddings = _resize_paddings(context.paddings, config.max_padding)
+
+    padding = config.default_padding
+    if padding is None and context.padding in paddings:
+        padding = context.padding
+    elif padding is None and len(paddings):
+        padding = paddings[0]
+
+    description = config.default_description
+    if description is None and context.description in config.descriptions:
+        description = context.description
+    elif description is None and len(config.descriptions):
+        description = config.descriptions[0]
+
+    alias_mapping = dict(config.colorspace_aliases)
+
+    # noinspection PyProtectedMember
+    outputs = tuple(
+        output._replace(
+            colorspace=(
+                alias_mapping.get(output.node_colorspace)
+                or output.node_colorspace
+            )
+        )
+        for output in context.outputs
+    )
+
+    # noinspection PyProtectedMember
+    return context._replace(
+        description=description,
+        descriptions=config.descriptions,
+        padding=padding,
+        paddings=paddings,
+        create_subfolders=config.create_subfolders,
+        tokens=config.tokens,
+        username=config.username,
+        template_configs=template_configs,
+        outputs=outputs,
+    )
+
+
+def _resize_paddings(paddings, max_value):
+    """Return *paddings* with *max_value* values in the same notation.
+
+    This is used instead of :func:`nomenclator.utilities.fetch_paddings` so
+    that the notation is not fetched again from :term:`Nuke`, which can only
+    be accessed from the main thread.
+
+    """
+    if len(paddings) and paddings[0].startswith("%"):
+        return tuple("%{0:02}d".format(index + 1) for index in range(max_value))
+
+    return tuple("#" * (index + 1) for index in range(max_value))
+
+
+@nomenclator.profiling.timed("context.update")
+@nomenclator.instrumentation.counted("context.update")
+def update(context, discover_next_version=True, versions=None):
     """Return updated context object with generated paths.
 
     Incoming *context* will not be mutated.
@@ -224,6 +495,132 @@ def update(context, discover_next_version=True):
         scene should be discovered and added to the context. Default is True.
         Otherwise, the version of the current scene is added to the context.
 
+    :param versions: Mapping regrouping next version associated with each
+        description, as returned by :func:`fetch_next_versions` for the same
+        location. Default is None, which means that the location is listed
+        to discover the next version. Otherwise, the location is only listed
+        if the description is not in the mapping and the pattern does not
+        contain any description token.
+
+    :return: updated :class:`Context` instance.
+
+    """
+    return _update(context, discover_next_version, versions=versions)
+
+
+@nomenclator.profiling.timed("context.fetch_next_versions")
+def fetch_next_versions(context, file_names=None):
+    """Return next version of each description for location of *context*.
+
+    The location is listed once to discover the next version of all
+    descriptions of the context and of the descriptions found in the
+    location, so that the description can be changed without listing the
+    location again::
+
+        >>> versions = fetch_next_versions(context)
+        >>> context = update(
+        ...     context._replace(description="roto"), versions=versions
+        ... )
+
+    The mapping depends on the location path, the tokens, the padding, the
+    username and the template configurations of the context.
+
+    :param context: :class:`Context` instance.
+
+    :param file_names: List of file names within the location path. Default
+        is None, which means that the location path is listed.
+
+    :return: Mapping regrouping next version integer associated with each
+        description, or an empty mapping if no template configuration matches
+        the location path.
+
+    """
+    token_mapping = dict(context.tokens)
+
+    config = nomenclator.utilities.fetch_template_config(
+        context.location_path,
+        context.template_configs,
+        token_mapping
+    )
+    if config is None:
+        return {}
+
+    token_mapping.update({
+        "padding": context.padding,
+        "username": context.username
+    })
+
+    return nomenclator.utilities.fetch_next_versions(
+        context.location_path, config.pattern_base, token_mapping,
+        descriptions=context.descriptions, file_names=file_names
+    )
+
+
+def update_many(contexts, discover_next_version=True, fetch_file_names=None):
+    """Yield updated context objects with generated paths.
+
+    This is equivalent to calling :func:`update` for each context, but the
+    content of each location is only listed once to discover the next
+    versions. Template patterns and template matches are cached for all
+    calls (see :func:`nomenclator.template.construct_regexp` and
+    :func:`nomenclator.utilities.fetch_template_config`).
+
+    For instance::
+
+        >>> config = nomenclator.config.fetch()
+        >>> contexts = update_many(
+        ...     create(config, location_path, description=description)
+        ...     for location_path, description in requests
+        ... )
+
+    Incoming *contexts* will not be mutated.
+
+    :param contexts: Iterable of :class:`Context` instances.
+
+    :param discover_next_version: Indicate whether the next version of the
+        scenes should be discovered and added to the contexts. Default is
+        True. Otherwise, the version of each scene is added to its context.
+
+    :param fetch_file_names: Function returning the list of file names within
+        a location path. Default is None, which means that each location path
+        is listed once for all *contexts*.
+
+    :return: Generator of updated :class:`Context` instances, in the same
+        order as *contexts*.
+
+    """
+    if fetch_file_names is None:
+        file_names = {}
+
+        def fetch_file_names(path):
+            """Return file names within *path* listed only once."""
+            if path not in file_names:
+                file_names[path] = os.listdir(path)
+
+            return file_names[path]
+
+    for context in contexts:
+        yield _update(context, discover_next_version, fetch_file_names)
+
+
+def _update(
+    context, discover_next_version, fetch_file_names=None, versions=None
+):
+    """Return updated context object with generated paths.
+
+    :param context: :class:`Context` instance.
+
+    :param discover_next_version: Indicate whether the next version of the
+        scene should be discovered and added to the context.
+
+    :param fetch_file_names: Function returning the list of file names
+        within a location path. Default is None, which means that the location
+        path is listed by
+        :func:`nomenclator.utilities.fetch_next_version`.
+
+    :param versions: Mapping regrouping next version associated with each
+        description. Default is None.
+
     :return: updated :class:`Context` instance.
 
     """
@@ -253,7 +650,10 @@ def update(context, discover_next_version=True):
     })
 
     # Discover version.
-    version = _fetch_version(context, config, token_mapping, discover_next_version)
+    version = _fetch_version(
+        context, config, token_mapping, discover_next_version,
+        fetch_file_names, versions
+    )
 
     # Update token values with version found.
     token_mapping["version"] = "{0:03d}".format(version)
@@ -291,7 +691,10 @@ def update(context, discover_next_version=True):
         )
 
 
-def _fetch_version(context, config, token_mapping, discover_next_version):
+def _fetch_version(
+    context, config, token_mapping, discover_next_version,
+    fetch_file_names=None, versions=None
+):
     """Return version for context.
 
     :param context: :class:`Context` instance.
@@ -305,12 +708,36 @@ def _fetch_version(context, config, token_mapping, discover_next_version):
         scene should be returned. Otherwise, the version of the current scene is
         returned.
 
+    :param fetch_file_names: Function returning the list of file names
+        within a location path. Default is None, which means that the location
+        path is listed by
+        :func:`nomenclator.utilities.fetch_next_version`.
+
+    :param versions: Mapping regrouping next version associated with each
+        description. Default is None.
+
     :return: Version integer.
 
     """
     if discover_next_version:
+        if versions is not None:
+            if context.description in versions:
+                return versions[context.description]
+
+            # Descriptions missing from the mapping have no scene files,
+            # unless the pattern does not contain any description token so
+            # that the version is shared between all descriptions.
+            if re.search(r"{description[:}]", config.pattern_base):
+                return 1
+
+        file_names = None
+
+        if fetch_file_names is not None:
+            file_names = fetch_file_names(context.location_path)
+
         return nomenclator.utilities.fetch_next_version(
-            context.location_path, config.pattern_base, token_mapping
+            context.location_path, config.pattern_base, token_mapping,
+            file_names=file_names
         )
 
     else:
@@ -319,6 +746,7 @@ def _fetch_version(context, config, token_mapping, discover_next_version):
         )
 
 
+@nomenclator.profiling.timed("context.update_outputs")
 def update_outputs(
     contexts, template_configs, token_mapping, ignore_errors=False
 ):
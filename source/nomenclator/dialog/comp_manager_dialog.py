@@ -10,26 +10,48 @@ from nomenclator.widget import DescriptionSelector
 from nomenclator.widget import PathWidget
 from nomenclator.widget import VersionWidget
 from nomenclator.widget import OutputSettingsForm
+import nomenclator.config
 import nomenclator.context
+import nomenclator.prefetch
+import nomenclator.profiling
 
+from .mixin import FirstPaintMixin
 from .theme import classic_style
 
 
-class CompoManagerDialog(QtWidgets.QDialog):
+class CompoManagerDialog(FirstPaintMixin, QtWidgets.QDialog):
 
+    @nomenclator.profiling.timed("CompoManagerDialog.__init__")
     def __init__(self, context, parent=None):
         """Initiate dialog."""
         super(CompoManagerDialog, self).__init__(parent)
         self._setup_ui()
         self._connect_signals()
 
-        context = nomenclator.context.update(context)
+        # Next version of each description, with the context values used to
+        # discover them.
+        self._versions = (None, {})
+
+        # Configuration applied to the context.
+        self._config = None
+
+        context = self._update_from_config(
+            context,
+            nomenclator.config.fetch(location_path=context.location_path)
+        )
+        context = self._resolve(context)
         self._initial_context = context
+        self._initial_config = self._config
         self._context = context
 
         self.set_values(context)
         self.update(context)
 
+        # Resolve recent locations in the background so that switching to one
+        # of them does not access the file system.
+        self._prefetcher = nomenclator.prefetch.Prefetcher(context)
+        self._prefetcher.start()
+
         self._location.setFocus()
 
     @property
@@ -37,12 +59,18 @@ class CompoManagerDialog(QtWidgets.QDialog):
         """Return updated context."""
         return self._context
 
+    def done(self, result):
+        """Stop prefetching recent locations when the dialog is closed."""
+        self._prefetcher.cancel()
+        super(CompoManagerDialog, self).done(result)
+
     def set_values(self, context):
         """Initialize values."""
         self._location.blockSignals(True)
         self._location.set_items(
             context.recent_locations,
-            os.path.dirname(context.path)
+            os.path.dirname(context.path),
+            template_configs=context.template_configs
         )
         self._location.blockSignals(False)
 
@@ -50,10 +78,12 @@ class CompoManagerDialog(QtWidgets.QDialog):
         self._outputs_settings_group.setEnabled(len(context.outputs) > 0)
         self._output_settings_form.set_values(context)
 
+    @nomenclator.profiling.timed("CompoManagerDialog.update")
     def update(self, context):
         """Update values from context."""
         self._error_manager_widget.set_values(context)
         self._comp_settings_form.update(context)
+        self._comp_settings_form.set_versions(self._versions[1])
         self._output_settings_form.update(context)
 
         self._update_buttons_states()
@@ -114,6 +144,7 @@ class CompoManagerDialog(QtWidgets.QDialog):
         self._comp_settings_form.updated.connect(self._update_context)
         self._location.updated.connect(self._update_location)
 
+    @nomenclator.profiling.timed("CompoManagerDialog._update_location")
     def _update_location(self):
         """Update location path in context."""
         path = self._location.value
@@ -122,25 +153,79 @@ class CompoManagerDialog(QtWidgets.QDialog):
         if len(path) > 1 and path.endswith(os.sep):
             path = path[:-1]
 
-        self._update_context("location_path", path)
+        # noinspection PyProtectedMember
+        context = self._context._replace(location_path=path)
+
+        location = self._prefetcher.fetch(path)
+        if location is not None:
+            config = location.config
+        else:
+            config = nomenclator.config.fetch(location_path=path)
+
+        # Update description choices if a different configuration is applied.
+        if config is not self._config:
+            context = self._update_from_config(context, config)
+            self._comp_settings_form.set_values(context)
+
+        # Check if names can be generated, without accessing the file system
+        # if the location was prefetched.
+        file_names = location.file_names if location is not None else None
+        self._context = self._resolve(context, file_names=file_names)
+        self.update(self._context)
 
+    @nomenclator.profiling.timed("CompoManagerDialog._update_full_context")
     def _update_full_context(self):
         """Replace context object."""
         self._context = self._output_settings_form.context
 
         # Check if names can be generated.
-        self._context = nomenclator.context.update(self._context)
+        self._context = self._resolve(self._context)
         self.update(self._context)
 
+    @nomenclator.profiling.timed("CompoManagerDialog._update_context")
     def _update_context(self, key, value):
         """Update context object from *key* and *value*."""
         # noinspection PyProtectedMember
         self._context = self._context._replace(**{key: value})
 
         # Check if names can be generated.
-        self._context = nomenclator.context.update(self._context)
+        self._context = self._resolve(self._context)
         self.update(self._context)
 
+    def _update_from_config(self, context, config):
+        """Return *context* updated with values from *config*.
+
+        The configuration is recorded so that default values are only applied
+        again when the location uses a different configuration.
+
+        """
+        self._config = config
+        return nomenclator.context.update_from_config(context, config)
+
+    def _resolve(self, context, file_names=None):
+        """Return *context* updated with generated paths.
+
+        The next versions of all descriptions are discovered at once, so that
+        the location is not listed again when only the description changes.
+
+        :param file_names: List of file names within the location path.
+            Default is None, which means that the location path is listed if
+            necessary.
+
+        """
+        key = (
+            context.location_path, context.tokens, context.padding,
+            context.username, context.descriptions, context.template_configs
+        )
+
+        if self._versions[0] != key:
+            versions = nomenclator.context.fetch_next_versions(
+                context, file_names=file_names
+            )
+            self._versions = (key, versions)
+
+        return nomenclator.context.update(context, versions=self._versions[1])
+
     def _button_clicked(self, button):
         """Modify the state of the dialog depending on the button clicked."""
         mapping = {
@@ -157,6 +242,7 @@ class CompoManagerDialog(QtWidgets.QDialog):
 
         elif button == mapping["Reset"]:
             self._context = self._initial_context
+            self._config = self._initial_config
             self.set_values(self._context)
             self.update(self._context)
 
@@ -204,6 +290,12 @@ class CompSettingsForm(QtWidgets.QWidget):
         self._script_path.set_path(context.path)
         self._version_widget.set_value(context.version)
 
+    def set_versions(self, versions):
+        """Display latest version saved for each description."""
+        self._description_selector.blockSignals(True)
+        self._description_selector.set_versions(versions)
+        self._description_selector.blockSignals(False)
+
     def _setup_ui(self):
         """Initialize user interface."""
         main_layout = QtWidgets.QGridLayout(self)
@@ -235,3 +327,4 @@ class CompSettingsForm(QtWidgets.QWidget):
                 "append_username_to_name", state == QtCore.Qt.Checked
             )
         )
+
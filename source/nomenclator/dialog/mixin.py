@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+from nomenclator.vendor.Qt import QtCore
+import nomenclator.telemetry
+
+
+class FirstPaintMixin(object):
+    """Mix-in class recording time to first paint of a dialog.
+
+    It must be placed before the Qt dialog class in the base classes::
+
+        >>> class Dialog(FirstPaintMixin, QtWidgets.QDialog):
+        ...     pass
+
+    """
+
+    def showEvent(self, event):
+        """Record time to first paint when the dialog is shown."""
+        super(FirstPaintMixin, self).showEvent(event)
+
+        # The timer is triggered once pending paint events are processed.
+        QtCore.QTimer.singleShot(
+            0, lambda: nomenclator.telemetry.mark("first_paint")
+        )
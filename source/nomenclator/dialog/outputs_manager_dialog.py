@@ -5,12 +5,15 @@ from nomenclator.vendor.Qt import QtWidgets, QtCore
 from nomenclator.widget import ErrorManagerWidget
 from nomenclator.widget import OutputSettingsForm
 import nomenclator.context
+import nomenclator.profiling
 
+from .mixin import FirstPaintMixin
 from .theme import classic_style
 
 
-class OutputsManagerDialog(QtWidgets.QDialog):
+class OutputsManagerDialog(FirstPaintMixin, QtWidgets.QDialog):
 
+    @nomenclator.profiling.timed("OutputsManagerDialog.__init__")
     def __init__(self, context, parent=None):
         """Initiate dialog."""
         super(OutputsManagerDialog, self).__init__(parent)
@@ -35,6 +38,7 @@ class OutputsManagerDialog(QtWidgets.QDialog):
         """Initialize values."""
         self._output_settings_form.set_values(context)
 
+    @nomenclator.profiling.timed("OutputsManagerDialog.update")
     def update(self, context):
         """Update values from context."""
         self._error_manager_widget.set_values(context)
@@ -83,6 +87,7 @@ class OutputsManagerDialog(QtWidgets.QDialog):
         self._button_box.clicked.connect(self._button_clicked)
         self._output_settings_form.updated.connect(self._update_full_context)
 
+    @nomenclator.profiling.timed("OutputsManagerDialog._update_full_context")
     def _update_full_context(self):
         """Replace context object."""
         self._context = self._output_settings_form.context
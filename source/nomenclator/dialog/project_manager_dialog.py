@@ -9,21 +9,33 @@ from nomenclator.widget import GroupWidget
 from nomenclator.widget import DescriptionSelector
 from nomenclator.widget import PathWidget
 from nomenclator.widget import VersionWidget
+import nomenclator.config
 import nomenclator.context
+import nomenclator.profiling
 
+from .mixin import FirstPaintMixin
 from .theme import classic_style
 
 
-class ProjectManagerDialog(QtWidgets.QDialog):
+class ProjectManagerDialog(FirstPaintMixin, QtWidgets.QDialog):
 
+    @nomenclator.profiling.timed("ProjectManagerDialog.__init__")
     def __init__(self, context, parent=None):
         """Initiate dialog."""
         super(ProjectManagerDialog, self).__init__(parent)
         self._setup_ui()
         self._connect_signals()
 
+        # Configuration applied to the context.
+        self._config = None
+
+        context = self._update_from_config(
+            context,
+            nomenclator.config.fetch(location_path=context.location_path)
+        )
         context = nomenclator.context.update(context)
         self._initial_context = context
+        self._initial_config = self._config
         self._context = context
 
         self.set_values(context)
@@ -41,12 +53,14 @@ class ProjectManagerDialog(QtWidgets.QDialog):
         self._location.blockSignals(True)
         self._location.set_items(
             context.recent_locations,
-            os.path.dirname(context.path)
+            os.path.dirname(context.path),
+            template_configs=context.template_configs
         )
         self._location.blockSignals(False)
 
         self._project_settings_form.set_values(context)
 
+    @nomenclator.profiling.timed("ProjectManagerDialog.update")
     def update(self, context):
         """Update values from context."""
         self._error_manager_widget.set_values(context)
@@ -108,6 +122,7 @@ class ProjectManagerDialog(QtWidgets.QDialog):
         self._project_settings_form.updated.connect(self._update_context)
         self._location.updated.connect(self._update_location)
 
+    @nomenclator.profiling.timed("ProjectManagerDialog._update_location")
     def _update_location(self):
         """Update location path in context."""
         path = self._location.value
@@ -116,8 +131,20 @@ class ProjectManagerDialog(QtWidgets.QDialog):
         if len(path) > 1 and path.endswith(os.sep):
             path = path[:-1]
 
-        self._update_context("location_path", path)
+        # noinspection PyProtectedMember
+        context = self._context._replace(location_path=path)
+        config = nomenclator.config.fetch(location_path=path)
+
+        # Update description choices if a different configuration is applied.
+        if config is not self._config:
+            context = self._update_from_config(context, config)
+            self._project_settings_form.set_values(context)
 
+        # Check if names can be generated.
+        self._context = nomenclator.context.update(context)
+        self.update(self._context)
+
+    @nomenclator.profiling.timed("ProjectManagerDialog._update_context")
     def _update_context(self, key, value):
         """Update context object from *key* and *value*."""
         # noinspection PyProtectedMember
@@ -127,6 +154,16 @@ class ProjectManagerDialog(QtWidgets.QDialog):
         self._context = nomenclator.context.update(self._context)
         self.update(self._context)
 
+    def _update_from_config(self, context, config):
+        """Return *context* updated with values from *config*.
+
+        The configuration is recorded so that default values are only applied
+        again when the location uses a different configuration.
+
+        """
+        self._config = config
+        return nomenclator.context.update_from_config(context, config)
+
     def _button_clicked(self, button):
         """Modify the state of the dialog depending on the button clicked."""
         mapping = {
@@ -143,6 +180,7 @@ class ProjectManagerDialog(QtWidgets.QDialog):
 
         elif button == mapping["Reset"]:
             self._context = self._initial_context
+            self._config = self._initial_config
             self.set_values(self._context)
             self.update(self._context)
 
@@ -215,3 +253,4 @@ class ProjectSettingsForm(QtWidgets.QWidget):
                 "append_username_to_name", state == QtCore.Qt.Checked
             )
         )
+
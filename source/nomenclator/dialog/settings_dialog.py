@@ -4,6 +4,8 @@ from nomenclator.vendor.Qt import QtWidgets, QtCore
 from nomenclator.widget import EditableList
 from nomenclator.widget import EditableTabWidget
 from nomenclator.widget import EditableTable
+import nomenclator.instrumentation
+import nomenclator.profiling
 import nomenclator.utilities
 from nomenclator.config import (
     TemplateConfig,
@@ -12,11 +14,13 @@ from nomenclator.config import (
     load_output_template_configs
 )
 
+from .mixin import FirstPaintMixin
 from .theme import classic_style
 
 
-class SettingsDialog(QtWidgets.QDialog):
+class SettingsDialog(FirstPaintMixin, QtWidgets.QDialog):
 
+    @nomenclator.profiling.timed("SettingsDialog.__init__")
     def __init__(self, config, parent=None):
         """Initiate dialog."""
         super(SettingsDialog, self).__init__(parent)
@@ -87,6 +91,9 @@ class SettingsDialog(QtWidgets.QDialog):
 
         self._button_box.clicked.connect(self._button_clicked)
 
+    @nomenclator.instrumentation.counted(
+        "settings_dialog.SettingsDialog._update_config"
+    )
     def _update_config(self, key, value):
         """Update config object from *key* and *value*."""
         # noinspection PyProtectedMember
@@ -235,6 +242,10 @@ class GlobalSettingsForm(QtWidgets.QWidget):
             lambda state: self.updated.emit("create_subfolders", state == QtCore.Qt.Checked)
         )
 
+        nomenclator.instrumentation.watch(
+            self.updated, "settings_dialog.GlobalSettingsForm.updated"
+        )
+
 
 class CompSettingsForm(QtWidgets.QWidget):
     """Form to manage comp settings."""
@@ -248,6 +259,9 @@ class CompSettingsForm(QtWidgets.QWidget):
         self._setup_ui()
         self._connect_signals()
 
+    @nomenclator.instrumentation.counted(
+        "settings_dialog.CompSettingsForm.templates"
+    )
     def templates(self):
         """Return list of templates."""
         templates = []
@@ -288,6 +302,10 @@ class CompSettingsForm(QtWidgets.QWidget):
         self._tab_widget.tab_removed.connect(self._template_updated)
         self._tab_widget.tab_edited.connect(self._template_updated)
 
+        nomenclator.instrumentation.watch(
+            self.updated, "settings_dialog.CompSettingsForm.updated"
+        )
+
     def _add_template(self):
         """Add a new tab for template."""
         identifier = "Comp{}".format(self._tab_widget.count() + 1)
@@ -317,6 +335,9 @@ class ProjectSettingsForm(QtWidgets.QWidget):
         self._setup_ui()
         self._connect_signals()
 
+    @nomenclator.instrumentation.counted(
+        "settings_dialog.ProjectSettingsForm.templates"
+    )
     def templates(self):
         """Return list of templates."""
         templates = []
@@ -357,6 +378,10 @@ class ProjectSettingsForm(QtWidgets.QWidget):
         self._tab_widget.tab_removed.connect(self._template_updated)
         self._tab_widget.tab_edited.connect(self._template_updated)
 
+        nomenclator.instrumentation.watch(
+            self.updated, "settings_dialog.ProjectSettingsForm.updated"
+        )
+
     def _add_template(self):
         """Add a new tab for template."""
         identifier = "Project{}".format(self._tab_widget.count() + 1)
@@ -447,6 +472,10 @@ class _CompTemplateForm(QtWidgets.QWidget):
         self._tab_widget.tab_removed.connect(lambda: self.updated.emit())
         self._tab_widget.tab_edited.connect(lambda: self.updated.emit())
 
+        nomenclator.instrumentation.watch(
+            self.updated, "settings_dialog._CompTemplateForm.updated"
+        )
+
     def _add_output_template(self):
         """Add a new tab for output template."""
         identifier = "Output{}".format(self._tab_widget.count() + 1)
@@ -510,6 +539,10 @@ class _ProjectTemplateForm(QtWidgets.QWidget):
         """Initialize signals connection."""
         self._template_form.updated.connect(self.updated.emit)
 
+        nomenclator.instrumentation.watch(
+            self.updated, "settings_dialog._ProjectTemplateForm.updated"
+        )
+
 
 class _OutputTemplateForm(QtWidgets.QWidget):
     """Form to manage output template settings."""
@@ -560,6 +593,10 @@ class _OutputTemplateForm(QtWidgets.QWidget):
         """Initialize signals connection."""
         self._template_form.updated.connect(self.updated.emit)
 
+        nomenclator.instrumentation.watch(
+            self.updated, "settings_dialog._OutputTemplateForm.updated"
+        )
+
 
 class _TemplateSceneForm(QtWidgets.QWidget):
     """Form to manage config template settings for scene."""
@@ -671,6 +708,10 @@ class _TemplateSceneForm(QtWidgets.QWidget):
         self._match_end.stateChanged.connect(lambda: self.updated.emit())
         self._append_username_to_name.stateChanged.connect(lambda: self.updated.emit())
 
+        nomenclator.instrumentation.watch(
+            self.updated, "settings_dialog._TemplateSceneForm.updated"
+        )
+
 
 class _TemplateOutputForm(QtWidgets.QWidget):
     """Form to manage config template settings for output."""
@@ -788,6 +829,10 @@ class _TemplateOutputForm(QtWidgets.QWidget):
         self._append_passname_to_name.stateChanged.connect(lambda: self.updated.emit())
         self._append_passname_to_subfolder.stateChanged.connect(lambda: self.updated.emit())
 
+        nomenclator.instrumentation.watch(
+            self.updated, "settings_dialog._TemplateOutputForm.updated"
+        )
+
 
 class ColorspaceSettingsForm(QtWidgets.QWidget):
     """Form to manage colorspace settings."""
@@ -825,6 +870,10 @@ class ColorspaceSettingsForm(QtWidgets.QWidget):
             lambda values: self.updated.emit("colorspace_aliases", values)
         )
 
+        nomenclator.instrumentation.watch(
+            self.updated, "settings_dialog.ColorspaceSettingsForm.updated"
+        )
+
 
 class TokenSettingsForm(QtWidgets.QWidget):
     """Form to manage token settings."""
@@ -862,6 +911,10 @@ class TokenSettingsForm(QtWidgets.QWidget):
             lambda values: self.updated.emit("tokens", values)
         )
 
+        nomenclator.instrumentation.watch(
+            self.updated, "settings_dialog.TokenSettingsForm.updated"
+        )
+
 
 class AdvancedSettingsForm(QtWidgets.QWidget):
     """Form to manage advanced settings."""
@@ -939,6 +992,10 @@ class AdvancedSettingsForm(QtWidgets.QWidget):
         self._max_padding.valueChanged.connect(lambda v: self.updated.emit("max_padding", v))
         self._username_is_default.stateChanged.connect(self._toggle_username_default)
 
+        nomenclator.instrumentation.watch(
+            self.updated, "settings_dialog.AdvancedSettingsForm.updated"
+        )
+
     def _toggle_username_default(self):
         """Indicate whether the username used is default or not."""
         value = self._username_is_default.isChecked()
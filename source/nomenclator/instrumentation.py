@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+
+# Instrumentation is only enabled when the NOMENCLATOR_DEBUG_SIGNALS
+# environment variable is set before the package is imported. Otherwise,
+# signals are not watched and functions are returned unchanged by 'counted'
+# so that no overhead is added.
+
+import contextlib
+import datetime
+import functools
+import json
+import os
+import sys
+import threading
+
+#: Path to the file where the counts of each user action are written, or "-"
+#: to write them to the standard error, or None if instrumentation is
+#: disabled.
+DEBUG_PATH = os.environ.get("NOMENCLATOR_DEBUG_SIGNALS") or None
+
+#: Signal emissions and recomputations counted during the current user
+#: action, or None if no action is in progress.
+_ACTION = {"emits": None, "recomputations": None}
+
+#: Lock protecting the counts.
+_LOCK = threading.Lock()
+
+
+def is_enabled():
+    """Indicate whether instrumentation is enabled."""
+    return DEBUG_PATH is not None
+
+
+def watch(signal, name):
+    """Count emissions of *signal* under *name*.
+
+    For instance::
+
+        >>> watch(self.updated, "output_list.SettingsForm.updated")
+
+    When instrumentation is disabled, the signal is not watched.
+
+    :param signal: :term:`Qt Signal` bound to a widget.
+
+    :param name: Name under which emissions are counted.
+
+    """
+    if not is_enabled():
+        return
+
+    signal.connect(lambda *args: _count("emits", name))
+
+
+def counted(name):
+    """Return decorator counting calls of a recomputation under *name*.
+
+    For instance::
+
+        >>> @counted("output_list.OutputList.outputs_context")
+        ... def outputs_context(self):
+        ...     pass
+
+    When instrumentation is disabled, the function is returned unchanged.
+
+    :param name: Name under which calls are counted.
+
+    :return: Decorator.
+
+    """
+    def _decorator(function):
+        """Return *function* counting calls if instrumentation is enabled."""
+        if not is_enabled():
+            return function
+
+        @functools.wraps(function)
+        def _wrapped(*args, **kwargs):
+            """Count call and return result of function."""
+            _count("recomputations", name)
+            return function(*args, **kwargs)
+
+        return _wrapped
+
+    return _decorator
+
+
+def _count(kind, name):
+    """Increment counter *name* of *kind* for the current user action.
+
+    If no action is in progress, a new action is started and reported once
+    all events triggered by the user are processed.
+
+    """
+    with _LOCK:
+        is_new = _ACTION["emits"] is None
+        if is_new:
+            _ACTION["emits"] = {}
+            _ACTION["recomputations"] = {}
+
+        counts = _ACTION[kind]
+        counts[name] = counts.get(name, 0) + 1
+
+    if is_new:
+        _schedule(report)
+
+
+def _schedule(function):
+    """Call *function* once pending events are processed by Qt.
+
+    *function* is called immediately when no Qt application is running or
+    when the current thread is not the main thread of the application, as Qt
+    timers require an event loop in the calling thread.
+
+    """
+    try:
+        from nomenclator.vendor.Qt import QtCore
+    except ImportError:
+        function()
+        return
+
+    application = QtCore.QCoreApplication.instance()
+
+    if (
+        application is None
+        or QtCore.QThread.currentThread() != application.thread()
+    ):
+        function()
+        return
+
+    QtCore.QTimer.singleShot(0, function)
+
+
+def fetch_counts():
+    """Return counts of the current user action.
+
+    :return: Mapping containing the "emits" and "recomputations" mappings
+        which associate each name with a number of calls.
+
+    """
+    with _LOCK:
+        return {
+            "emits": dict(_ACTION["emits"] or {}),
+            "recomputations": dict(_ACTION["recomputations"] or {}),
+        }
+
+
+def report():
+    """Write counts of the current user action and end it.
+
+    :return: Mapping returned by :func:`fetch_counts`, or None if no action
+        is in progress.
+
+    """
+    with _LOCK:
+        if _ACTION["emits"] is None:
+            return None
+
+        counts = {
+            "emits": _ACTION["emits"],
+            "recomputations": _ACTION["recomputations"],
+        }
+        _ACTION["emits"] = None
+        _ACTION["recomputations"] = None
+
+    try:
+        dump(counts)
+    except (IOError, OSError) as error:
+        sys.stderr.write(
+            "Impossible to write signal counts: {}\n".format(error)
+        )
+
+    return counts
+
+
+@contextlib.contextmanager
+def action():
+    """Count signal emissions and recomputations within block.
+
+    The mapping yielded is filled with the counts when the block exits, so
+    that they can be asserted in tests::
+
+        >>> with action() as counts:
+        ...     form.set_append_passname_to_name(True)
+        >>> counts["recomputations"]["context.update"]
+        1
+
+    When instrumentation is disabled, the mapping contains no counts.
+
+    :return: Mapping containing the "emits" and "recomputations" mappings
+        which associate each name with a number of calls.
+
+    """
+    counts = {"emits": {}, "recomputations": {}}
+
+    if not is_enabled():
+        yield counts
+        return
+
+    # End the previous action if it is still in progress.
+    report()
+
+    with _LOCK:
+        _ACTION["emits"] = {}
+        _ACTION["recomputations"] = {}
+
+    try:
+        yield counts
+
+    finally:
+        # The action is already ended if a pending report was processed
+        # within the block.
+        counts.update(report() or {})
+
+
+def dump(counts):
+    """Write *counts* of a user action.
+
+    One JSON line is appended to the file set with
+    :envvar:`NOMENCLATOR_DEBUG_SIGNALS`, or a table is written to the standard
+    error if the value is "-".
+
+    :param counts: Mapping returned by :func:`fetch_counts`.
+
+    """
+    if DEBUG_PATH == "-":
+        sys.stderr.write(
+            "Nomenclator action: {} emits, {} recomputations\n".format(
+                sum(counts["emits"].values()),
+                sum(counts["recomputations"].values())
+            )
+        )
+
+        for kind in ("emits", "recomputations"):
+            mapping = counts[kind]
+
+            for key in sorted(mapping, key=lambda k: (-mapping[k], k)):
+                sys.stderr.write("  {:<50} {:>6} {}\n".format(
+                    key, mapping[key], kind
+                ))
+        return
+
+    data = dict(counts, date=datetime.datetime.now().isoformat())
+
+    with open(DEBUG_PATH, "a") as stream:
+        stream.write(json.dumps(data, sort_keys=True) + "\n")
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+# Speculative prefetch of recent locations. The configuration and the content
+# of each recent location are fetched in a background thread when a dialog is
+# opened, so that switching to a recent location does not access the file
+# system.
+
+import collections
+import os
+import threading
+
+import nomenclator.config
+import nomenclator.context
+import nomenclator.telemetry
+import nomenclator.utilities
+
+#: Data prefetched for a location.
+Location = collections.namedtuple(
+    "Location", ["path", "config", "file_names", "context"]
+)
+
+
+class Prefetcher(object):
+    """Prefetcher of recent locations running in a background thread.
+
+    For instance::
+
+        >>> prefetcher = Prefetcher(context)
+        >>> prefetcher.start()
+        >>> location = prefetcher.fetch(path)
+        >>> if location is not None:
+        ...     context = update(context, location)
+
+    Locations are prefetched in the order of
+    :attr:`~nomenclator.context.Context.recent_locations`, which is bounded by
+    the maximum number of locations from the configuration.
+
+    """
+
+    def __init__(self, context):
+        """Initiate prefetcher.
+
+        :param context: :class:`~nomenclator.context.Context` instance used
+            to resolve each recent location.
+
+        """
+        self._context = context
+        self._locations = {}
+        self._event = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start prefetching recent locations in a background thread.
+
+        Nothing is done if the prefetcher was already started.
+
+        """
+        with self._lock:
+            if self._thread is not None:
+                return
+
+            self._thread = threading.Thread(target=self._process)
+            self._thread.daemon = True
+            self._thread.start()
+
+    def cancel(self):
+        """Stop prefetching after the location in progress."""
+        self._event.set()
+
+    def wait(self, timeout=None):
+        """Wait until the prefetcher is done.
+
+        :param timeout: Maximum number of seconds to wait. Default is None,
+            which means that this function waits until all locations are
+            prefetched.
+
+        :return: Boolean indicating whether the prefetcher is done.
+
+        """
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+            return not thread.is_alive()
+
+        return True
+
+    def fetch(self, path):
+        """Return :class:`Location` prefetched for *path*.
+
+        :return: :class:`Location` instance, or None if *path* is not
+            prefetched yet.
+
+        """
+        with self._lock:
+            return self._locations.get(path)
+
+    def _process(self):
+        """Prefetch recent locations until cancelled."""
+        # Work done in the background is recorded separately from the work
+        # triggered by the user.
+        with nomenclator.telemetry.prefixed("prefetch"):
+            for path in self._context.recent_locations:
+                if self._event.is_set():
+                    return
+
+                # Locations which cannot be listed are resolved when selected.
+                try:
+                    location = prefetch(self._context, path)
+                except (IOError, OSError):
+                    continue
+
+                with self._lock:
+                    self._locations[path] = location
+
+
+def prefetch(context, path):
+    """Return data for location *path* fetched from the file system.
+
+    The configuration discovered from *path* is applied to *context*, and the
+    content of *path* is listed if it matches a template configuration so that
+    the next version can be discovered.
+
+    :param context: :class:`~nomenclator.context.Context` instance.
+
+    :param path: Path to the location to prefetch.
+
+    :return: :class:`Location` instance.
+
+    :raise: :exc:`OSError` if *path* cannot be listed.
+
+    """
+    config = nomenclator.config.fetch(location_path=path)
+
+    # noinspection PyProtectedMember
+    _context = nomenclator.context.update_from_config(
+        context._replace(location_path=path), config
+    )
+
+    file_names = None
+
+    if nomenclator.utilities.fetch_template_config(
+        path, _context.template_configs, {}
+    ) is not None:
+        file_names = os.listdir(path)
+
+    location = Location(path, config, file_names, None)
+    return location._replace(context=update(_context, location))
+
+
+def update(context, location):
+    """Return *context* updated for prefetched *location*.
+
+    This is equivalent to applying the configuration of the location and
+    calling :func:`nomenclator.context.update`, without accessing the file
+    system.
+
+    :param context: :class:`~nomenclator.context.Context` instance.
+
+    :param location: :class:`Location` instance.
+
+    :return: updated :class:`~nomenclator.context.Context` instance.
+
+    """
+    # noinspection PyProtectedMember
+    context = nomenclator.context.update_from_config(
+        context._replace(location_path=location.path), location.config
+    )
+
+    contexts = nomenclator.context.update_many(
+        [context], fetch_file_names=lambda _: location.file_names
+    )
+    return next(contexts)
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+
+# Instrumentation is only enabled when the NOMENCLATOR_PROFILE or the
+# NOMENCLATOR_TRACE environment variable is set before the package is
+# imported. Otherwise, functions are returned unchanged by 'timed' so that no
+# overhead is added.
+
+import contextlib
+import datetime
+import functools
+import json
+import os
+import sys
+import threading
+import timeit
+
+#: Path to the file where profiling results are written, or "-" to write them
+#: to the standard error, or None if profiling is disabled.
+PROFILE_PATH = os.environ.get("NOMENCLATOR_PROFILE") or None
+
+#: Path to the file where the trace of each session is written in the Chrome
+#: Trace Event format, or None if tracing is disabled.
+TRACE_PATH = os.environ.get("NOMENCLATOR_TRACE") or None
+
+#: Extensions of file paths receiving :mod:`cProfile` statistics.
+CPROFILE_EXTENSIONS = (".prof", ".pstats")
+
+#: Number of calls, total and maximum duration associated with each name.
+_TIMERS = {}
+
+#: Trace events recorded during the current session, with the time at which
+#: the session started.
+_TRACE = {"events": None, "origin": 0.0}
+
+#: Lock protecting the timers and trace events.
+_LOCK = threading.Lock()
+
+
+def is_enabled():
+    """Indicate whether profiling or tracing is enabled."""
+    return PROFILE_PATH is not None or TRACE_PATH is not None
+
+
+def timed(name):
+    """Return decorator measuring calls of a function under *name*.
+
+    For instance::
+
+        >>> @timed("context.fetch")
+        ... def fetch(config):
+        ...     pass
+
+    Each call is also recorded as a span in the trace of the current session
+    if tracing is enabled. When profiling and tracing are disabled, the
+    function is returned unchanged.
+
+    :param name: Name under which calls are recorded.
+
+    :return: Decorator.
+
+    """
+    def _decorator(function):
+        """Return *function* wrapped with a timer if profiling is enabled."""
+        if not is_enabled():
+            return function
+
+        @functools.wraps(function)
+        def _wrapped(*args, **kwargs):
+            """Call function and record its duration."""
+            start = timeit.default_timer()
+
+            try:
+                return function(*args, **kwargs)
+
+            finally:
+                record(name, timeit.default_timer() - start, start=start)
+
+        return _wrapped
+
+    return _decorator
+
+
+def record(name, duration, start=None):
+    """Record one call of *name* lasting *duration* seconds.
+
+    :param name: Name of the call recorded.
+
+    :param duration: Duration of the call in seconds.
+
+    :param start: Time at which the call started, as returned by
+        :func:`timeit.default_timer`. Default is None, which means that the
+        call is not added to the trace of the current session.
+
+    """
+    with _LOCK:
+        timer = _TIMERS.setdefault(name, [0, 0.0, 0.0])
+        timer[0] += 1
+        timer[1] += duration
+        timer[2] = max(timer[2], duration)
+
+        if start is not None and _TRACE["events"] is not None:
+            _TRACE["events"].append(
+                _create_event(name, start, duration)
+            )
+
+
+def _create_event(name, start, duration):
+    """Return complete event mapping in the Chrome Trace Event format."""
+    return {
+        "name": name,
+        "cat": name.split(".", 1)[0],
+        "ph": "X",
+        "ts": (start - _TRACE["origin"]) * 1e6,
+        "dur": duration * 1e6,
+        "pid": os.getpid(),
+        "tid": threading.current_thread().ident,
+    }
+
+
+def fetch_events():
+    """Return list of trace events recorded during the current session."""
+    with _LOCK:
+        return list(_TRACE["events"] or [])
+
+
+def fetch_timers():
+    """Return mapping of recorded timers associated with their name.
+
+    Each timer is a mapping containing the number of "calls", the "total"
+    and the "max" duration in seconds.
+
+    """
+    with _LOCK:
+        return {
+            name: {"calls": calls, "total": total, "max": maximum}
+            for name, (calls, total, maximum) in _TIMERS.items()
+        }
+
+
+def reset():
+    """Remove all recorded timers and trace events."""
+    with _LOCK:
+        _TIMERS.clear()
+
+        if _TRACE["events"] is not None:
+            _TRACE["events"] = []
+
+
+@contextlib.contextmanager
+def session(name):
+    """Profile a dialog session and write results when it is closed.
+
+    Timers recorded during the session are appended as one JSON line to the
+    file set with :envvar:`NOMENCLATOR_PROFILE`, or written as a table to the
+    standard error if the value is "-". If the file has a ".prof" or ".pstats"
+    extension, the whole session is profiled with :mod:`cProfile` and the
+    statistics are written to this file instead, so that they can be read
+    with :mod:`pstats`.
+
+    If :envvar:`NOMENCLATOR_TRACE` is set, a span is recorded for each timed
+    call during the session, and the trace is written to the file set in the
+    Chrome Trace Event format, which can be opened in `Perfetto
+    <https://ui.perfetto.dev>`_ or ``about:tracing``.
+
+    When profiling and tracing are disabled, nothing is done.
+
+    :param name: Name of the session (e.g. "comp_manager").
+
+    """
+    if not is_enabled():
+        yield
+        return
+
+    profiler = None
+    if PROFILE_PATH is not None and PROFILE_PATH.endswith(CPROFILE_EXTENSIONS):
+        import cProfile
+        profiler = cProfile.Profile()
+
+    start = timeit.default_timer()
+
+    with _LOCK:
+        _TIMERS.clear()
+
+        if TRACE_PATH is not None:
+            _TRACE["events"] = []
+            _TRACE["origin"] = start
+
+    if profiler is not None:
+        profiler.enable()
+
+    try:
+        yield
+
+    finally:
+        if profiler is not None:
+            profiler.disable()
+
+        duration = timeit.default_timer() - start
+
+        with _LOCK:
+            events = _TRACE["events"]
+            _TRACE["events"] = None
+
+        try:
+            if profiler is not None:
+                profiler.dump_stats(PROFILE_PATH)
+            elif PROFILE_PATH is not None:
+                dump(name, duration, fetch_timers())
+
+            if events is not None:
+                events.insert(0, _create_event(
+                    "session.{}".format(name), start, duration
+                ))
+                dump_trace(events)
+
+        except (IOError, OSError) as error:
+            sys.stderr.write(
+                "Impossible to write profiling results: {}\n".format(error)
+            )
+
+
+def dump(name, duration, timers):
+    """Write profiling results of session *name*.
+
+    :param name: Name of the session.
+
+    :param duration: Duration of the session in seconds.
+
+    :param timers: Mapping of timers returned by :func:`fetch_timers`.
+
+    """
+    if PROFILE_PATH == "-":
+        sys.stderr.write("Nomenclator session '{}' ({:.3f}s)\n".format(
+            name, duration
+        ))
+
+        for key in sorted(timers, key=lambda k: -timers[k]["total"]):
+            sys.stderr.write(
+                "  {:<40} {:>6} calls {:>10.3f}ms total {:>10.3f}ms max\n"
+                .format(
+                    key, timers[key]["calls"], timers[key]["total"] * 1000,
+                    timers[key]["max"] * 1000
+                )
+            )
+        return
+
+    data = {
+        "session": name,
+        "date": datetime.datetime.now().isoformat(),
+        "duration": duration,
+        "timers": timers,
+    }
+
+    with open(PROFILE_PATH, "a") as stream:
+        stream.write(json.dumps(data, sort_keys=True) + "\n")
+
+
+def dump_trace(events):
+    """Write trace *events* in the Chrome Trace Event format.
+
+    :param events: List of event mappings returned by :func:`fetch_events`.
+
+    """
+    data = {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    with open(TRACE_PATH, "w") as stream:
+        json.dump(data, stream)
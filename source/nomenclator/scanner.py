@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+
+import mmap
+import re
+
+from nomenclator.symbol import OUTPUT_CLASSES
+
+#: Regular expression to detect the start of a node block or the end of a
+#: group within a composition script. Nodes within groups are indented.
+HEADER_EXPRESSION = re.compile(
+    br"^(?P<indent>[ \t]*)"
+    br"(?:(?P<end_group>end_group)|(?P<class>[A-Za-z_]\w*) \{)[ \t]*\r?$",
+    re.MULTILINE
+)
+
+#: Default knob values for each output node class when knobs are not saved in
+#: scripts. Deep outputs do not have any "colorspace" knob.
+DEFAULT_KNOB_VALUES = {
+    "Write": {
+        "file": "",
+        "file_type": "",
+        "views": "main",
+        "colorspace": "default",
+        "disable": False,
+    },
+    "DeepWrite": {
+        "file": "",
+        "file_type": "",
+        "views": "main",
+        "disable": False,
+    },
+}
+
+
+class Node(object):
+    """Node extracted from a composition script.
+
+    It reproduces the part of the :class:`nuke.Node` interface used by
+    :mod:`nomenclator.utilities`, so that nodes extracted from a script can be
+    used in place of nodes from the current :term:`Nuke` session.
+
+    """
+
+    def __init__(self, node_class, name, knobs=None, group=None):
+        """Initiate node.
+
+        :param node_class: Class of the node (e.g. "Write").
+
+        :param name: Name of the node.
+
+        :param knobs: Mapping regrouping knob values saved in the script
+            associated with their name. Default is None.
+
+        :param group: Full name of the group containing the node, or None if
+            the node is in the root graph. Default is None.
+
+        """
+        self._class = node_class
+        self._name = name
+        self._knobs = knobs or {}
+        self._group = group
+
+    def __repr__(self):
+        """Return representation of the node."""
+        return "<Node {}: {}>".format(self._class, self.fullName())
+
+    def __getitem__(self, name):
+        """Return knob from *name*.
+
+        :raise: :exc:`NameError` if the knob does not exist.
+
+        """
+        knob = self.knob(name)
+        if knob is None:
+            raise NameError("Unknown knob: {}".format(name))
+
+        return knob
+
+    def Class(self):
+        """Return class of the node."""
+        return self._class
+
+    def name(self):
+        """Return name of the node."""
+        return self._name
+
+    def fullName(self):
+        """Return name of the node including the group names."""
+        if self._group is None:
+            return self._name
+
+        return "{}.{}".format(self._group, self._name)
+
+    def group(self):
+        """Return full name of the group containing the node or None."""
+        return self._group
+
+    def knob(self, name):
+        """Return knob from *name* or None if the knob does not exist."""
+        if name in self._knobs:
+            return Knob(name, self._knobs[name])
+
+        defaults = DEFAULT_KNOB_VALUES.get(self._class, {})
+        if name in defaults:
+            return Knob(name, defaults[name])
+
+        return None
+
+    def knobs(self):
+        """Return mapping regrouping knob values saved in the script."""
+        return dict(self._knobs)
+
+
+class Knob(object):
+    """Knob extracted from a composition script."""
+
+    def __init__(self, name, value):
+        """Initiate knob from *name* and *value*."""
+        self._name = name
+        self._value = value
+
+    def name(self):
+        """Return name of the knob."""
+        return self._name
+
+    def value(self):
+        """Return value of the knob."""
+        if self._name == "disable" and not isinstance(self._value, bool):
+            return self._value.lower() in ("true", "1")
+
+        return self._value
+
+    def values(self):
+        """Return all values available for the knob.
+
+        Only the current value is known from a composition script.
+
+        """
+        value = self.value()
+        if isinstance(value, bool) or not len(value.strip()):
+            return []
+
+        return [value]
+
+
+def scan(path, classes=OUTPUT_CLASSES, recursive=False):
+    """Yield nodes from composition script *path* without launching Nuke.
+
+    The script is memory-mapped and node blocks are detected without parsing
+    the whole script. Knobs are only extracted from nodes with one of the
+    *classes* requested, while other nodes are skipped regardless of their
+    size and only their name is extracted.
+
+    Nodes within groups are ignored unless *recursive* is True.
+
+    :param path: Path to the composition script.
+
+    :param classes: Node classes to extract knobs from. Default is
+        :data:`~nomenclator.symbol.OUTPUT_CLASSES`.
+
+    :param recursive: Indicate whether nodes within groups should be
+        returned. Default is False.
+
+    :return: Generator of :class:`Node` instances.
+
+    """
+    with open(path, "rb") as stream:
+        try:
+            data = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be memory-mapped.
+            return
+
+        try:
+            for node in _scan(data, classes, recursive):
+                yield node
+        finally:
+            data.close()
+
+
+def fetch_nodes(path):
+    """Fetch all output nodes from composition script *path* with all node names.
+
+    This is the equivalent of :func:`nomenclator.utilities.fetch_nodes` for
+    a script which is not opened in the current session.
+
+    :param path: Path to the composition script.
+
+    :return: tuple with a list of output :class:`Node` instances and a list all
+        available node names.
+
+    """
+    nodes = []
+    all_names = []
+
+    for node in scan(path):
+        if node.Class() in OUTPUT_CLASSES:
+            nodes.append(node)
+
+        all_names.append(node.name())
+
+    return nodes, all_names
+
+
+def _scan(data, classes, recursive):
+    """Yield nodes from composition script *data*."""
+    groups = []
+    position = 0
+
+    while True:
+        match = HEADER_EXPRESSION.search(data, position)
+        if match is None:
+            return
+
+        if match.group("end_group") is not None:
+            if len(groups):
+                groups.pop()
+
+            position = match.end()
+            continue
+
+        node_class = match.group("class").decode("utf-8")
+
+        # The block ends with a closing brace at the same indentation level.
+        closing = b"\n" + match.group("indent") + b"}"
+
+        start = match.end()
+        end = data.find(closing, start)
+        if end < 0:
+            end = len(data)
+
+        position = end + len(closing)
+
+        # The root node does not belong to the graph.
+        if node_class == "Root":
+            continue
+
+        group = ".".join(groups) or None
+
+        if node_class in classes:
+            knobs = parse_knobs(data[start:end].decode("utf-8", "replace"))
+            name = knobs.pop("name", "")
+        else:
+            knobs = None
+            name = _extract_name(data, start, end, match.group("indent"))
+
+        if node_class == "Group":
+            groups.append(name)
+
+        if group is None or recursive:
+            yield Node(node_class, name, knobs=knobs, group=group)
+
+
+def _extract_name(data, start, end, indent=b""):
+    """Return node name from node block within *data*.
+
+    The name knob is searched from the end of the block as it is usually
+    saved after all other knobs. Knobs are indented one level deeper than
+    the block header *indent*.
+
+    """
+    prefix = b"\n" + indent + b" name "
+
+    index = data.rfind(prefix, start, end)
+    if index < 0:
+        return ""
+
+    index += len(prefix)
+    line_end = data.find(b"\n", index, end)
+    if line_end < 0:
+        line_end = end
+
+    value = data[index:line_end].decode("utf-8", "replace").strip()
+    return _parse_value(value, 0)[0]
+
+
+def parse_knobs(block):
+    """Return mapping of knob values from node *block*.
+
+    For instance::
+
+        >>> parse_knobs(' file "/path/my file.####.exr"\\n views {left right}\\n')
+        {"file": "/path/my file.####.exr", "views": "left right"}
+
+    :param block: Content of a node block without the header and the closing
+        brace.
+
+    :return: Mapping regrouping knob values associated with their name.
+
+    """
+    knobs = {}
+    position = 0
+    length = len(block)
+
+    while position < length:
+        # Skip whitespaces before knob name.
+        while position < length and block[position].isspace():
+            position += 1
+
+        if position >= length:
+            break
+
+        start = position
+        while position < length and not block[position].isspace():
+            position += 1
+
+        name = block[start:position]
+
+        # Skip spaces between knob name and value.
+        while position < length and block[position] in " \t":
+            position += 1
+
+        value, position = _parse_value(block, position)
+        knobs[name] = value
+
+    return knobs
+
+
+def _parse_value(text, position):
+    """Return value parsed from *text* at *position* with the next position.
+
+    Values can be quoted, enclosed within braces which can span several lines,
+    or end with the line.
+
+    """
+    length = len(text)
+
+    if position < length and text[position] == "\"":
+        characters = []
+        position += 1
+
+        while position < length and text[position] != "\"":
+            if text[position] == "\\" and position + 1 < length:
+                position += 1
+                characters.append(
+                    {"n": "\n", "t": "\t"}.get(text[position], text[position])
+                )
+            else:
+                characters.append(text[position])
+
+            position += 1
+
+        return "".join(characters), position + 1
+
+    if position < length and text[position] == "{":
+        depth = 0
+        start = position
+
+        while position < length:
+            if text[position] == "\\":
+                position += 2
+                continue
+
+            if text[position] == "{":
+                depth += 1
+
+            elif text[position] == "}":
+                depth -= 1
+                if depth == 0:
+                    break
+
+            position += 1
+
+        return text[start + 1:position].strip(), position + 1
+
+    end = text.find("\n", position)
+    if end < 0:
+        end = length
+
+    return text[position:end].strip(), end
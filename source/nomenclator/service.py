@@ -0,0 +1,532 @@
+# -*- coding: utf-8 -*-
+
+import inspect
+import json
+import multiprocessing.pool
+import os
+import socket
+import threading
+import time
+
+try:
+    import socketserver
+except ImportError:
+    # Python 2
+    import SocketServer as socketserver
+
+import nomenclator.config
+import nomenclator.context
+import nomenclator.utilities
+
+#: Version of the JSON-RPC protocol.
+JSONRPC_VERSION = "2.0"
+
+#: Error code when the request cannot be parsed.
+PARSE_ERROR = -32700
+
+#: Error code when the request is not a valid JSON-RPC request.
+INVALID_REQUEST = -32600
+
+#: Error code when the method requested does not exist.
+METHOD_NOT_FOUND = -32601
+
+#: Error code when the parameters of the method are invalid.
+INVALID_PARAMS = -32602
+
+#: Error code when the method failed.
+INTERNAL_ERROR = -32603
+
+#: Number of seconds after the modification of a directory during which its
+#: listing is not reused, as a file system with coarse timestamps can record
+#: several modifications with the same modification time.
+DIRECTORY_CACHE_DELAY = 2
+
+
+class DirectoryCache(object):
+    """File names of directories kept up-to-date with their modification time.
+
+    Directories are only listed again when their modification time changes,
+    which happens when a file is added, removed or renamed. Directories
+    listed less than :data:`DIRECTORY_CACHE_DELAY` seconds after their
+    modification are listed again on the next call.
+
+    """
+
+    def __init__(self):
+        """Initiate cache."""
+        self._data = {}
+
+    def fetch(self, path):
+        """Return list of file names within *path*."""
+        mtime = os.stat(path).st_mtime
+
+        cached = self._data.get(path)
+        if (
+            cached is not None and cached[0] == mtime
+            and cached[1] - mtime >= DIRECTORY_CACHE_DELAY
+        ):
+            return cached[2]
+
+        # Modification time is fetched before listing the directory so that
+        # a file added while listing invalidates the list on the next call.
+        now = time.time()
+        file_names = os.listdir(path)
+        self._data[path] = (mtime, now, file_names)
+        return file_names
+
+    def clear(self):
+        """Remove all directories from the cache."""
+        self._data.clear()
+
+
+class Handler(socketserver.StreamRequestHandler):
+    """Handler processing JSON-RPC requests from one client connection.
+
+    Requests and responses are encoded as JSON on a single line. Several
+    requests can be sent over the same connection.
+
+    """
+
+    def handle(self):
+        """Process each request received until the connection is closed."""
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+
+            if not line.strip():
+                continue
+
+            response = process_request(
+                line.decode("utf-8"), self.server.directory_cache
+            )
+            if response is None:
+                continue
+
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class _PoolMixIn(object):
+    """Mix-in class to handle each connection in a pool of threads."""
+
+    #: Number of connections handled concurrently.
+    jobs = 4
+
+    def process_request(self, request, client_address):
+        """Handle *request* in a thread from the pool."""
+        if getattr(self, "_pool", None) is None:
+            self._pool = multiprocessing.pool.ThreadPool(self.jobs)
+
+        self._pool.apply_async(
+            self._process_request, (request, client_address)
+        )
+
+    def _process_request(self, request, client_address):
+        """Handle *request* and close it."""
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        """Close the server and stop the pool of threads."""
+        super(_PoolMixIn, self).server_close()
+
+        pool = getattr(self, "_pool", None)
+        if pool is not None:
+            pool.terminate()
+            self._pool = None
+
+
+class TCPServer(_PoolMixIn, socketserver.TCPServer):
+    """Naming service listening on a local port."""
+
+    allow_reuse_address = True
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+    class UnixServer(_PoolMixIn, socketserver.UnixStreamServer):
+        """Naming service listening on a Unix socket."""
+
+        def server_close(self):
+            """Close the server and remove the socket."""
+            _PoolMixIn.server_close(self)
+
+            try:
+                os.remove(self.server_address)
+            except OSError:
+                pass
+
+
+def create_server(address, jobs=4):
+    """Return naming service server listening on *address*.
+
+    The server only accepts local connections. The configuration is watched
+    in the background (see :func:`nomenclator.config.start_watcher`), and
+    compiled templates, template matches and directory listings are kept in
+    memory between requests.
+
+    :param address: Path to a Unix socket, or port number on the local host.
+        Use 0 to pick any available port.
+
+    :param jobs: Number of connections handled concurrently. Default is 4.
+
+    :return: Server instance. Call its ``serve_forever`` method to process
+        requests and its ``server_close`` method to stop it.
+
+    """
+    if isinstance(address, int):
+        server_class = TCPServer
+        address = ("127.0.0.1", address)
+
+    else:
+        server_class = UnixServer
+
+        # Remove socket left by a previous server.
+        if os.path.exists(address):
+            os.remove(address)
+
+    server = server_class(address, Handler, bind_and_activate=False)
+    server.jobs = max(1, jobs)
+    server.directory_cache = DirectoryCache()
+
+    try:
+        server.server_bind()
+        server.server_activate()
+    except Exception:
+        server.server_close()
+        raise
+
+    nomenclator.config.start_watcher()
+    return server
+
+
+def process_request(data, directory_cache=None):
+    """Process JSON-RPC request from *data* and return response mapping.
+
+    :param data: JSON-RPC request encoded as JSON.
+
+    :param directory_cache: :class:`DirectoryCache` instance to fetch file
+        names from. Default is None, which means that directories are listed
+        for each request.
+
+    :return: Response mapping, or None if the request is a notification.
+
+    """
+    try:
+        request = json.loads(data)
+    except ValueError as error:
+        return _error_response(None, PARSE_ERROR, str(error))
+
+    if not isinstance(request, dict) or "method" not in request:
+        return _error_response(None, INVALID_REQUEST, "Invalid request.")
+
+    identifier = request.get("id")
+
+    method = METHODS.get(str(request["method"]))
+    if method is None:
+        return _error_response(
+            identifier, METHOD_NOT_FOUND,
+            "Method not found: {}".format(request["method"])
+        )
+
+    params = request.get("params", {})
+
+    message = _validate_params(method, params)
+    if message is not None:
+        return _error_response(identifier, INVALID_PARAMS, message)
+
+    fetch_file_names = None
+    if directory_cache is not None:
+        fetch_file_names = directory_cache.fetch
+
+    try:
+        result = method(fetch_file_names=fetch_file_names, **params)
+    except Exception as error:
+        return _error_response(identifier, INTERNAL_ERROR, str(error))
+
+    if "id" not in request:
+        return None
+
+    return {"jsonrpc": JSONRPC_VERSION, "id": identifier, "result": result}
+
+
+def _validate_params(method, params):
+    """Return error message if *params* cannot be passed to *method*.
+
+    :param method: Function from :data:`METHODS`.
+
+    :param params: Parameters from the request.
+
+    :return: Error message, or None if *params* are valid.
+
+    """
+    if not isinstance(params, dict):
+        return "Parameters must be a mapping."
+
+    try:
+        spec = inspect.getfullargspec(method)
+    except AttributeError:
+        # Python 2
+        spec = inspect.getargspec(method)
+
+    count = len(spec.args) - len(spec.defaults or [])
+
+    # File names are fetched by the service.
+    names = set(spec.args) - {"fetch_file_names"}
+
+    missing = [name for name in spec.args[:count] if name not in params]
+    if len(missing):
+        return "Missing parameters: {}".format(", ".join(missing))
+
+    unknown = sorted(name for name in params if name not in names)
+    if len(unknown):
+        return "Unexpected parameters: {}".format(", ".join(unknown))
+
+    return None
+
+
+def _error_response(identifier, code, message):
+    """Return JSON-RPC error response mapping."""
+    return {
+        "jsonrpc": JSONRPC_VERSION,
+        "id": identifier,
+        "error": {"code": code, "message": message},
+    }
+
+
+def resolve_scene_name(
+    location_path, description=None, tokens=None, is_project=False,
+    fetch_file_names=None
+):
+    """Return scene path for the next version within *location_path*.
+
+    :param location_path: Path to the folder where the scene would be saved.
+
+    :param description: Description of the scene. Default is None, which means
+        that the default description from the configuration is used.
+
+    :param tokens: Mapping of token values added to the tokens from the
+        configuration. Default is None.
+
+    :param is_project: Indicate whether a project name is requested instead
+        of a composition script name. Default is False.
+
+    :param fetch_file_names: Function returning the list of file names within
+        a location path. Default is None.
+
+    :return: Mapping containing the "path", the "version" and the "error".
+
+    """
+    context = _update(
+        location_path, description, tokens, is_project, fetch_file_names
+    )
+
+    return {
+        "path": context.path,
+        "version": context.version,
+        "error": context.error,
+    }
+
+
+def resolve_output_paths(
+    location_path, outputs, description=None, tokens=None,
+    fetch_file_names=None
+):
+    """Return output paths for the next composition version in *location_path*.
+
+    :param location_path: Path to the folder where the composition script
+        would be saved.
+
+    :param outputs: List of mappings with the keyword arguments of
+        :func:`nomenclator.context.create_output` for each output, except the
+        template configurations.
+
+    :param description: Description of the composition script. Default is
+        None, which means that the default description from the configuration
+        is used.
+
+    :param tokens: Mapping of token values added to the tokens from the
+        configuration. Default is None.
+
+    :param fetch_file_names: Function returning the list of file names within
+        a location path. Default is None.
+
+    :return: Mapping containing the composition script "path", the "version",
+        the "error" and the list of "outputs", each represented by a mapping
+        containing the "name", "path", "destination" and "error".
+
+    """
+    context = _update(
+        location_path, description, tokens, False, fetch_file_names,
+        outputs=outputs
+    )
+
+    return {
+        "path": context.path,
+        "version": context.version,
+        "error": context.error,
+        "outputs": [
+            {
+                "name": output.name,
+                "path": output.path,
+                "destination": output.destination,
+                "error": output.error,
+            }
+            for output in context.outputs
+        ]
+    }
+
+
+def fetch_next_version(
+    location_path, description=None, tokens=None, is_project=False,
+    fetch_file_names=None
+):
+    """Return next version of scenes within *location_path*.
+
+    :param location_path: Path to the folder where scenes are saved.
+
+    :param description: Description of the scene. Default is None, which means
+        that the default description from the configuration is used.
+
+    :param tokens: Mapping of token values added to the tokens from the
+        configuration. Default is None.
+
+    :param is_project: Indicate whether project versions are requested instead
+        of composition script versions. Default is False.
+
+    :param fetch_file_names: Function returning the list of file names within
+        a location path. Default is None.
+
+    :return: Mapping containing the "version" and the "error".
+
+    """
+    context = _update(
+        location_path, description, tokens, is_project, fetch_file_names
+    )
+
+    return {"version": context.version, "error": context.error}
+
+
+def _update(
+    location_path, description, tokens, is_project, fetch_file_names,
+    outputs=None
+):
+    """Return updated context for *location_path*."""
+    config = nomenclator.config.fetch(location_path=location_path)
+
+    context = nomenclator.context.create(
+        config, location_path, description=description, tokens=tokens,
+        is_project=is_project
+    )
+
+    if outputs is not None:
+        _config = nomenclator.utilities.fetch_template_config(
+            location_path, context.template_configs, {}
+        )
+        template_configs = _config.outputs if _config is not None else []
+
+        # noinspection PyProtectedMember
+        context = context._replace(outputs=tuple(
+            nomenclator.context.create_output(template_configs, **output)
+            for output in outputs
+        ))
+
+    contexts = nomenclator.context.update_many(
+        [context], fetch_file_names=fetch_file_names
+    )
+    return next(contexts)
+
+
+#: Methods available associated with their name.
+METHODS = {
+    "scene_name": resolve_scene_name,
+    "output_paths": resolve_output_paths,
+    "next_version": fetch_next_version,
+}
+
+
+class Client(object):
+    """Client sending requests to the naming service.
+
+    For instance::
+
+        >>> with Client("/tmp/nomenclator.sock") as client:
+        ...     client.call("scene_name", location_path="/path/sh001/scripts")
+        {"path": "/path/sh001/scripts/sh001_comp_v002.nk", "version": 2, ...}
+
+    The connection is kept open between calls and shared between threads.
+
+    """
+
+    def __init__(self, address, timeout=None):
+        """Initiate client.
+
+        :param address: Path to a Unix socket, or port number on the local
+            host.
+
+        :param timeout: Number of seconds to wait for a response. Default is
+            None, which means that calls are blocking.
+
+        """
+        if isinstance(address, int):
+            self._socket = socket.create_connection(
+                ("127.0.0.1", address), timeout=timeout
+            )
+
+        else:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.settimeout(timeout)
+            self._socket.connect(address)
+
+        self._stream = self._socket.makefile("rwb")
+        self._lock = threading.Lock()
+        self._identifier = 0
+
+    def __enter__(self):
+        """Return client."""
+        return self
+
+    def __exit__(self, *args):
+        """Close connection."""
+        self.close()
+
+    def call(self, method, **params):
+        """Call *method* with *params* and return result.
+
+        :raise: :exc:`RuntimeError` if the service returns an error.
+
+        """
+        with self._lock:
+            self._identifier += 1
+
+            request = {
+                "jsonrpc": JSONRPC_VERSION,
+                "id": self._identifier,
+                "method": method,
+                "params": params,
+            }
+
+            self._stream.write(json.dumps(request).encode("utf-8") + b"\n")
+            self._stream.flush()
+
+            line = self._stream.readline()
+
+        if not line:
+            raise RuntimeError("Connection closed by the naming service.")
+
+        response = json.loads(line.decode("utf-8"))
+        if "error" in response:
+            raise RuntimeError(
+                "{message} [{code}]".format(**response["error"])
+            )
+
+        return response["result"]
+
+    def close(self):
+        """Close connection."""
+        self._stream.close()
+        self._socket.close()
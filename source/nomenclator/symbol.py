@@ -6,6 +6,25 @@ OUTPUT_CLASSES = ("Write", "DeepWrite")
 #: Name of the configuration file.
 CONFIG_FILE_NAME = "nomenclator.toml"
 
+#: Number of seconds during which a configuration discovered from a folder is
+#: reused without checking the file system again.
+DISCOVERY_CACHE_TIMEOUT = 5
+
+#: Default number of seconds between each check of the configuration files
+#: when they are watched.
+DEFAULT_WATCHER_INTERVAL = 2
+
+#: Maximum number of seconds to wait for a recent path to be checked before it
+#: is considered unreachable.
+RECENT_PATH_TIMEOUT = 1
+
+#: Maximum number of threads used to check whether recent paths exist.
+RECENT_PATH_WORKERS = 4
+
+#: Maximum number of compiled template patterns and template matches kept in
+#: memory before the caches are cleared.
+TEMPLATE_CACHE_SIZE = 1024
+
 #: List of file types used for video formats.
 VIDEO_TYPES = ("mxf", "mov", "mp4", "avi")
 
@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+
+# Telemetry is only enabled when the NOMENCLATOR_TELEMETRY environment
+# variable is set before the package is imported. Records are written by a
+# background thread so that the dialogs are never blocked by the file system.
+
+import atexit
+import contextlib
+import datetime
+import json
+import os
+import sys
+import threading
+import timeit
+
+try:
+    import queue
+except ImportError:
+    # Python 2
+    import Queue as queue
+
+#: Path to the file where a record is appended for each dialog session, or
+#: None if telemetry is disabled.
+TELEMETRY_PATH = os.environ.get("NOMENCLATOR_TELEMETRY") or None
+
+#: Maximum size of the telemetry file in bytes before it is rotated.
+MAX_SIZE = 1024 * 1024
+
+#: Number of rotated telemetry files kept next to the current one.
+BACKUP_COUNT = 3
+
+#: Maximum number of records waiting to be written. Records are dropped when
+#: this number is reached so that the dialogs are never blocked.
+MAX_PENDING_RECORDS = 100
+
+#: Values recorded during the current session, with the time at which the
+#: session started.
+_SESSION = {"data": None, "start": 0.0}
+
+#: Records and flush requests waiting to be processed by the writer.
+_QUEUE = queue.Queue(maxsize=MAX_PENDING_RECORDS)
+
+#: Thread writing records in the background.
+_WRITER = {}
+
+#: Lock protecting the session values and the writer.
+_LOCK = threading.Lock()
+
+#: Prefix added to the keys recorded from each thread.
+_LOCAL = threading.local()
+
+
+def is_enabled():
+    """Indicate whether telemetry is enabled."""
+    return TELEMETRY_PATH is not None
+
+
+@contextlib.contextmanager
+def session(name):
+    """Record values of a dialog session and write them when it is closed.
+
+    Values recorded with :func:`set_value`, :func:`increment`, :func:`mark`
+    and :func:`timer` during the session are appended as one compact JSON
+    line to the file set with :envvar:`NOMENCLATOR_TELEMETRY`. The line is
+    written by a background thread, and the file is rotated when its size
+    exceeds :data:`MAX_SIZE`.
+
+    When telemetry is disabled, nothing is done.
+
+    :param name: Name of the session (e.g. "comp_manager").
+
+    """
+    if not is_enabled():
+        yield
+        return
+
+    start = timeit.default_timer()
+
+    with _LOCK:
+        _SESSION["data"] = {}
+        _SESSION["start"] = start
+
+    try:
+        yield
+
+    finally:
+        with _LOCK:
+            data = _SESSION["data"]
+            _SESSION["data"] = None
+
+        data.update({
+            "session": name,
+            "date": datetime.datetime.now().isoformat(),
+            "duration": timeit.default_timer() - start,
+        })
+
+        _enqueue(("record", json.dumps(
+            data, sort_keys=True, separators=(",", ":")
+        )))
+
+
+@contextlib.contextmanager
+def prefixed(prefix):
+    """Record values from the current thread under keys starting with *prefix*.
+
+    This is used to record work done in the background separately from the
+    work triggered by the user::
+
+        >>> with prefixed("prefetch"):
+        ...     increment("scans")  # Recorded under "prefetch_scans".
+
+    """
+    previous = getattr(_LOCAL, "prefix", None)
+    _LOCAL.prefix = prefix
+
+    try:
+        yield
+
+    finally:
+        _LOCAL.prefix = previous
+
+
+def _key(key):
+    """Return *key* prefixed for the current thread."""
+    prefix = getattr(_LOCAL, "prefix", None)
+    if prefix is None:
+        return key
+
+    return "{}_{}".format(prefix, key)
+
+
+def set_value(key, value):
+    """Record *value* under *key* in the current session.
+
+    Nothing is done outside of a session.
+
+    """
+    key = _key(key)
+
+    with _LOCK:
+        if _SESSION["data"] is not None:
+            _SESSION["data"][key] = value
+
+
+def increment(key, value=1):
+    """Add *value* to the number recorded under *key* in the current session.
+
+    Nothing is done outside of a session.
+
+    """
+    key = _key(key)
+
+    with _LOCK:
+        if _SESSION["data"] is not None:
+            _SESSION["data"][key] = _SESSION["data"].get(key, 0) + value
+
+
+def mark(key):
+    """Record number of seconds since the current session started under *key*.
+
+    Only the first mark is recorded, so that this function can be called on
+    events happening several times, such as paint events. Nothing is done
+    outside of a session.
+
+    """
+    key = _key(key)
+
+    with _LOCK:
+        if _SESSION["data"] is not None:
+            _SESSION["data"].setdefault(
+                key, timeit.default_timer() - _SESSION["start"]
+            )
+
+
+@contextlib.contextmanager
+def timer(key):
+    """Add duration of the block in seconds under *key* in current session.
+
+    For instance::
+
+        >>> with timer("config_load"):
+        ...     config = nomenclator.config.fetch()
+
+    """
+    start = timeit.default_timer()
+
+    try:
+        yield
+
+    finally:
+        increment(key, timeit.default_timer() - start)
+
+
+def flush(timeout=None):
+    """Wait until all pending records are written.
+
+    :param timeout: Maximum number of seconds to wait. Default is None, which
+        means that this function waits until all records are written.
+
+    :return: Boolean indicating whether all records were written.
+
+    """
+    if _WRITER.get("thread") is None:
+        return True
+
+    event = threading.Event()
+
+    try:
+        _QUEUE.put(("flush", event), timeout=timeout)
+    except queue.Full:
+        return False
+
+    event.wait(timeout)
+    return event.is_set()
+
+
+def _enqueue(item):
+    """Add *item* to the queue processed by the writer without blocking."""
+    with _LOCK:
+        if _WRITER.get("thread") is None:
+            thread = threading.Thread(target=_process)
+            thread.daemon = True
+            thread.start()
+
+            _WRITER["thread"] = thread
+
+            # Ensure that the last records are written when the process exits.
+            atexit.register(flush, 1)
+
+    try:
+        _QUEUE.put_nowait(item)
+    except queue.Full:
+        pass
+
+
+def _process():
+    """Write records from the queue until the process exits."""
+    while True:
+        items = [_QUEUE.get()]
+
+        # Records waiting are written together to limit file system access.
+        while True:
+            try:
+                items.append(_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+
+        lines = [value for kind, value in items if kind == "record"]
+        if lines:
+            write(lines)
+
+        for kind, value in items:
+            if kind == "flush":
+                value.set()
+
+
+def write(lines):
+    """Append *lines* to the telemetry file, rotating it if necessary.
+
+    Errors are reported on the standard error as telemetry must never
+    interrupt the user.
+
+    :param lines: List of JSON records.
+
+    """
+    data = "".join(line + "\n" for line in lines)
+
+    try:
+        size = 0
+        if os.path.isfile(TELEMETRY_PATH):
+            size = os.path.getsize(TELEMETRY_PATH)
+
+        if size > 0 and size + len(data) > MAX_SIZE:
+            rotate(TELEMETRY_PATH, BACKUP_COUNT)
+
+        with open(TELEMETRY_PATH, "a") as stream:
+            stream.write(data)
+
+    except (IOError, OSError) as error:
+        sys.stderr.write(
+            "Impossible to write telemetry records: {}\n".format(error)
+        )
+
+
+def rotate(path, backup_count):
+    """Rotate file *path* and keep *backup_count* previous files.
+
+    Previous files are suffixed by their index, starting at 1 for the most
+    recent one (e.g. "telemetry.jsonl.1"). The oldest file is removed.
+
+    :param path: Path to the file to rotate.
+
+    :param backup_count: Number of previous files to keep.
+
+    """
+    if backup_count <= 0:
+        os.remove(path)
+        return
+
+    oldest = "{}.{}".format(path, backup_count)
+    if os.path.isfile(oldest):
+        os.remove(oldest)
+
+    for index in range(backup_count - 1, 0, -1):
+        source = "{}.{}".format(path, index)
+        if os.path.isfile(source):
+            os.rename(source, "{}.{}".format(path, index + 1))
+
+    os.rename(path, "{}.1".format(path))
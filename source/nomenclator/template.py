@@ -3,7 +3,12 @@
 import re
 import os
 
-from nomenclator.symbol import DEFAULT_EXPRESSION, VIDEO_TYPES
+from nomenclator.symbol import (
+    DEFAULT_EXPRESSION, VIDEO_TYPES, TEMPLATE_CACHE_SIZE
+)
+
+#: Compiled regular expressions associated with template pattern arguments.
+_REGEXP_CACHE = {}
 
 
 def fetch_resolved_tokens(
@@ -83,6 +88,9 @@ def construct_regexp(
         >>> construct_regexp("/path/{project}/{episode:ep\\d+}")
         re.compile(r"^/path/(?P<project>[\\w_.-]+)/(?P<episode>ep\\d+)$")
 
+    Compiled regular expressions are cached so that each pattern is only
+    converted once.
+
     :param pattern: String representing a template pattern path,
         with or without tokens.
 
@@ -99,6 +107,22 @@ def construct_regexp(
     :return: Compiled regular expression.
 
     """
+    key = (pattern, default_expression, match_start, match_end)
+
+    regexp = _REGEXP_CACHE.get(key)
+    if regexp is not None:
+        return regexp
+
+    if len(_REGEXP_CACHE) >= TEMPLATE_CACHE_SIZE:
+        _REGEXP_CACHE.clear()
+
+    regexp = _construct_regexp(*key)
+    _REGEXP_CACHE[key] = regexp
+    return regexp
+
+
+def _construct_regexp(pattern, default_expression, match_start, match_end):
+    """Return template pattern converted into a regular expression."""
     pattern = sanitize_pattern(pattern)
 
     def _convert(match):
@@ -2,14 +2,50 @@
 
 import copy
 import os
+import threading
+import timeit
+
+try:
+    import queue
+except ImportError:
+    # Python 2
+    import Queue as queue
+
+from nomenclator.symbol import (
+    OUTPUT_CLASSES, DEFAULT_EXPRESSION, TEMPLATE_CACHE_SIZE,
+    RECENT_PATH_TIMEOUT, RECENT_PATH_WORKERS
+)
+import nomenclator.profiling
+import nomenclator.telemetry
+import nomenclator.template
 
-import nuke
+#: Matching template configurations and tokens associated with paths and
+#: template configuration lists.
+_TEMPLATE_CONFIG_CACHE = {}
 
-from nomenclator.symbol import OUTPUT_CLASSES, DEFAULT_EXPRESSION
-import nomenclator.template
+#: Recent composition and project paths fetched during the session, cleared
+#: when a scene is saved.
+_RECENT_PATHS_CACHE = {}
+
+#: Checks of recent paths waiting to be processed by the path workers.
+_PATH_QUEUE = queue.Queue()
+
+#: Threads checking whether recent paths exist.
+_PATH_WORKERS = []
+
+#: Pending checks associated with each path.
+_PATH_CHECKS = {}
 
+#: Paths which could not be checked within the timeout and which are not
+#: checked again until their pending check is done.
+_UNREACHABLE_PATHS = set()
 
-def fetch_next_version(path, pattern, token_mapping):
+#: Lock protecting the path workers and the pending checks.
+_PATH_LOCK = threading.Lock()
+
+
+@nomenclator.profiling.timed("utilities.fetch_next_version")
+def fetch_next_version(path, pattern, token_mapping, file_names=None):
     """Fetch next version from scene files saved in *path*.
 
     :param path: Path to fetch scene files from.
@@ -19,6 +55,9 @@ def fetch_next_version(path, pattern, token_mapping):
     :param token_mapping: Mapping regrouping resolved token values associated
         with their name.
 
+    :param file_names: List of file names within *path*. Default is None,
+        which means that *path* is listed.
+
     :return: version integer.
 
     """
@@ -31,7 +70,13 @@ def fetch_next_version(path, pattern, token_mapping):
     # Generate expected base name pattern from resolved tokens.
     pattern = nomenclator.template.resolve(pattern, mapping)
 
-    for file_name in os.listdir(path):
+    if file_names is None:
+        file_names = os.listdir(path)
+
+    nomenclator.telemetry.increment("scans")
+    nomenclator.telemetry.increment("entries_scanned", len(file_names))
+
+    for file_name in file_names:
         data = nomenclator.template.fetch_resolved_tokens(
             file_name, pattern, match_start=True, match_end=False
         )
@@ -44,6 +89,84 @@ def fetch_next_version(path, pattern, token_mapping):
     return next_version
 
 
+@nomenclator.profiling.timed("utilities.fetch_next_versions")
+def fetch_next_versions(
+    path, pattern, token_mapping, descriptions=None, file_names=None
+):
+    """Fetch next version of each description from scene files in *path*.
+
+    This is equivalent to calling :func:`fetch_next_version` for each
+    description, but the scene files are only compared once with *pattern*.
+
+    For instance::
+
+        >>> fetch_next_versions(
+        ...     "/path/sh001", "{shot}_{description}_v{version}",
+        ...     {"shot": "sh001"}, descriptions=["comp", "roto"]
+        ... )
+        {"comp": 3, "roto": 1, "precomp": 2}
+
+    :param path: Path to fetch scene files from.
+
+    :param pattern: Pattern to compare scene files with.
+
+    :param token_mapping: Mapping regrouping resolved token values associated
+        with their name. The "description" token is ignored.
+
+    :param descriptions: List of descriptions which should be included in
+        the mapping returned even if no scene files are found. Default is
+        None.
+
+    :param file_names: List of file names within *path*. Default is None,
+        which means that *path* is listed.
+
+    :return: Mapping regrouping next version integer associated with each
+        description from *descriptions* and found in *path*.
+
+    """
+    # Ignore version and description tokens when resolving base pattern.
+    mapping = copy.deepcopy(token_mapping)
+    mapping["version"] = r"{version:\d+}"
+    mapping["description"] = "{{description:{}?}}".format(DEFAULT_EXPRESSION)
+
+    # Generate expected base name pattern from resolved tokens.
+    pattern = nomenclator.template.resolve(pattern, mapping)
+
+    if file_names is None:
+        file_names = os.listdir(path)
+
+    nomenclator.telemetry.increment("scans")
+    nomenclator.telemetry.increment("entries_scanned", len(file_names))
+
+    versions = {description: 1 for description in descriptions or []}
+
+    # All descriptions share the same version if the pattern does not
+    # contain any description token.
+    next_version = 1
+
+    for file_name in file_names:
+        data = nomenclator.template.fetch_resolved_tokens(
+            file_name, pattern, match_start=True, match_end=False
+        )
+        if data is None:
+            continue
+
+        version = int(data.get("version", 0)) + 1
+        description = data.get("description")
+
+        if description is None:
+            next_version = max(next_version, version)
+            continue
+
+        versions[description] = max(versions.get(description, 1), version)
+
+    if "{description:" not in pattern:
+        return {description: next_version for description in versions}
+
+    return versions
+
+
+@nomenclator.profiling.timed("utilities.fetch_version")
 def fetch_version(scene_path, pattern, token_mapping):
     """Fetch version from scene path.
 
@@ -72,6 +195,46 @@ def fetch_version(scene_path, pattern, token_mapping):
         return int(data.get("version", 0)) or None
 
 
+def fetch_scene_tokens(scene_path, pattern, token_mapping):
+    """Fetch version and description from scene path.
+
+    The description is matched with the same expression as in
+    :func:`fetch_next_versions`, so that a scene saved under any description
+    can be analyzed.
+
+    For instance::
+
+        >>> fetch_scene_tokens(
+        ...     "/path/sh001_roto_v003.nk", "{shot}_{description}_v{version}",
+        ...     {"shot": "sh001"}
+        ... )
+        {"description": "roto", "version": "003"}
+
+    :param scene_path: Path to the scene file to analyze.
+
+    :param pattern: Pattern to compare scene file with.
+
+    :param token_mapping: Mapping regrouping resolved token values associated
+        with their name. The "description" token is ignored.
+
+    :return: Mapping regrouping token values extracted from the scene name,
+        or None if the scene name does not match *pattern*.
+
+    """
+    # Ignore version and description tokens when resolving base pattern.
+    mapping = copy.deepcopy(token_mapping)
+    mapping["version"] = r"{version:\d+}"
+    mapping["description"] = "{{description:{}?}}".format(DEFAULT_EXPRESSION)
+
+    # Generate expected base name pattern from resolved tokens.
+    pattern = nomenclator.template.resolve(pattern, mapping)
+    return nomenclator.template.fetch_resolved_tokens(
+        os.path.basename(scene_path), pattern,
+        match_start=True, match_end=False
+    )
+
+
+@nomenclator.profiling.timed("utilities.fetch_template_config")
 def fetch_template_config(path, template_configs, token_mapping):
     """Return template configuration compatible with *path*.
 
@@ -88,6 +251,48 @@ def fetch_template_config(path, template_configs, token_mapping):
 
     :return: :class:`~nomenclator.config.TemplateConfig` Instance or None.
 
+    """
+    try:
+        key = (path, tuple(template_configs))
+        hash(key)
+    except TypeError:
+        key = None
+
+    result = _TEMPLATE_CONFIG_CACHE.get(key) if key is not None else None
+
+    if result is None:
+        result = next(
+            fetch_matching_template_configs(path, template_configs),
+            (None, {})
+        )
+
+        if key is not None:
+            if len(_TEMPLATE_CONFIG_CACHE) >= TEMPLATE_CACHE_SIZE:
+                _TEMPLATE_CONFIG_CACHE.clear()
+
+            _TEMPLATE_CONFIG_CACHE[key] = result
+
+    config, data = result
+    token_mapping.update(data)
+    return config
+
+
+def fetch_matching_template_configs(path, template_configs):
+    """Yield all template configurations compatible with *path*.
+
+    Template configurations are yielded in the same order as
+    *template_configs*, so the first one yielded is the one returned by
+    :func:`fetch_template_config`.
+
+    :param path: Path to extract template configurations from.
+
+    :param template_configs: List of available
+        :class:`~nomenclator.config.TemplateConfig` instances
+
+    :return: Generator of tuples containing the
+        :class:`~nomenclator.config.TemplateConfig` instance and the mapping
+        regrouping token values extracted from *path*.
+
     """
     for config in template_configs:
         data = nomenclator.template.fetch_resolved_tokens(
@@ -98,10 +303,7 @@ def fetch_template_config(path, template_configs, token_mapping):
         )
 
         if data is not None:
-            token_mapping.update(data)
-            return config
-
-    return None
+            yield config, data
 
 
 def fetch_output_template_config(path, template_configs):
@@ -143,6 +345,8 @@ def fetch_nodes():
         available node names.
 
     """
+    import nuke
+
     nodes = []
     all_names = []
 
@@ -158,12 +362,20 @@ def fetch_nodes():
 def fetch_recent_comp_paths(max_values=10):
     """Return list of paths recently used to save a composition.
 
+    Paths are cached until :func:`clear_recent_paths` is called.
+
     :param max_values: Maximum number of recent composition paths to
         return
 
     :return: List of recent composition paths.
 
     """
+    import nuke
+
+    key = ("comp", max_values)
+    if key in _RECENT_PATHS_CACHE:
+        return _RECENT_PATHS_CACHE[key]
+
     paths = []
 
     try:
@@ -174,42 +386,196 @@ def fetch_recent_comp_paths(max_values=10):
     except RuntimeError:
         pass
 
-    return tuple(paths)
+    _RECENT_PATHS_CACHE[key] = tuple(paths)
+    return _RECENT_PATHS_CACHE[key]
 
 
 def fetch_recent_project_paths(max_values=10):
     """Return list of paths recently used to save a project.
 
+    Projects which do not exist or cannot be reached within
+    :data:`~nomenclator.symbol.RECENT_PATH_TIMEOUT` are ignored (see
+    :func:`filter_existing_paths`). Paths are cached until
+    :func:`clear_recent_paths` is called.
+
     :param max_values: Maximum number of recent composition paths to
         return
 
     :return: List of recent composition paths.
 
     """
-    import hiero.ui
+    key = ("project", max_values)
+    if key in _RECENT_PATHS_CACHE:
+        return _RECENT_PATHS_CACHE[key]
+
+    return resolve_recent_project_paths(
+        fetch_recent_project_files(max_values=max_values),
+        max_values=max_values
+    )
 
-    paths = []
+
+def fetch_recent_project_files(max_values=10):
+    """Return list of project files recently saved in the current session.
+
+    The file system is not accessed, so that this function can be called
+    from the main thread before checking the files in another thread with
+    :func:`resolve_recent_project_paths`.
+
+    :param max_values: Maximum number of recent project files to return
+
+    :return: List of recent project files.
+
+    """
+    import hiero.ui
 
     action_name = "foundry.project.recentprojects"
     action = hiero.ui.findMenuAction(action_name)
-    if action is not None:
-        action_menu = action.menu()
+    if action is None:
+        return []
+
+    action_menu = action.menu()
+    if action_menu is None:
+        return []
+
+    items = action_menu.actions()[:max_values]
+    return [item.text() for item in items]
+
+
+def resolve_recent_project_paths(file_paths, max_values=10):
+    """Return list of paths from recent project *file_paths*.
+
+    Projects which do not exist or cannot be reached within
+    :data:`~nomenclator.symbol.RECENT_PATH_TIMEOUT` are ignored (see
+    :func:`filter_existing_paths`). Paths are cached until
+    :func:`clear_recent_paths` is called.
+
+    :param file_paths: List of project files returned by
+        :func:`fetch_recent_project_files`.
+
+    :param max_values: Maximum number of recent project files used to fetch
+        *file_paths*.
+
+    :return: List of recent project paths.
+
+    """
+    key = ("project", max_values)
+    if key in _RECENT_PATHS_CACHE:
+        return _RECENT_PATHS_CACHE[key]
+
+    paths = []
 
-        if action_menu is not None:
-            items = action_menu.actions()
-            for index, item in enumerate(items, 1):
-                if index > max_values:
-                    break
+    for path in filter_existing_paths(file_paths):
+        path = os.path.dirname(path)
+        if path not in paths:
+            paths.append(path)
 
-                path = item.text()
-                if not os.path.isfile(path):
-                    continue
+    _RECENT_PATHS_CACHE[key] = tuple(paths)
+    return _RECENT_PATHS_CACHE[key]
 
-                path = os.path.dirname(path)
-                if path not in paths:
-                    paths.append(path)
 
-    return tuple(paths)
+def clear_recent_paths():
+    """Clear recent composition and project paths cached.
+
+    This is called when a scene is saved, so that the recent paths are
+    fetched again when a dialog is opened.
+
+    """
+    _RECENT_PATHS_CACHE.clear()
+
+
+def filter_existing_paths(paths, timeout=RECENT_PATH_TIMEOUT):
+    """Return tuple of *paths* which are existing files.
+
+    Paths are checked concurrently by a pool of
+    :data:`~nomenclator.symbol.RECENT_PATH_WORKERS` threads shared with
+    other calls. Each path is given *timeout* seconds once its check has
+    started, and paths which cannot be checked in time, such as paths on an
+    unreachable mount, are ignored.
+
+    A path which could not be checked in time is recorded as unreachable and
+    ignored without being checked again until its pending check is done, so
+    that threads blocked by an unreachable mount do not pile up.
+
+    :param paths: List of file paths.
+
+    :param timeout: Maximum number of seconds to wait for each check. Default
+        is :data:`~nomenclator.symbol.RECENT_PATH_TIMEOUT`.
+
+    :return: Tuple of paths in the same order as *paths*.
+
+    """
+    checks = {}
+
+    with _PATH_LOCK:
+        while len(_PATH_WORKERS) < RECENT_PATH_WORKERS:
+            thread = threading.Thread(target=_check_paths)
+            thread.daemon = True
+            thread.start()
+            _PATH_WORKERS.append(thread)
+
+        for path in set(paths):
+            if path in _UNREACHABLE_PATHS:
+                continue
+
+            check = _PATH_CHECKS.get(path)
+            if check is None:
+                check = _PathCheck(path)
+                _PATH_CHECKS[path] = check
+                _PATH_QUEUE.put(check)
+
+            checks[path] = check
+
+    # Checks which are not started within the timeout are kept in the queue
+    # and reused by the next call.
+    deadline = timeit.default_timer() + timeout
+
+    for path, check in checks.items():
+        if not check.started.wait(max(0, deadline - timeit.default_timer())):
+            continue
+
+        _timeout = check.start_time + timeout - timeit.default_timer()
+        if check.done.wait(max(0, _timeout)):
+            continue
+
+        with _PATH_LOCK:
+            if not check.done.is_set():
+                _UNREACHABLE_PATHS.add(path)
+
+    return tuple(
+        path for path in paths
+        if path in checks and checks[path].done.is_set()
+        and checks[path].exists
+    )
+
+
+class _PathCheck(object):
+    """Check whether a path is an existing file."""
+
+    def __init__(self, path):
+        """Initiate check for *path*."""
+        self.path = path
+        self.exists = False
+        self.start_time = None
+        self.started = threading.Event()
+        self.done = threading.Event()
+
+
+def _check_paths():
+    """Process checks from the queue until the process exits."""
+    while True:
+        check = _PATH_QUEUE.get()
+
+        check.start_time = timeit.default_timer()
+        check.started.set()
+
+        exists = os.path.isfile(check.path)
+
+        with _PATH_LOCK:
+            _PATH_CHECKS.pop(check.path, None)
+            _UNREACHABLE_PATHS.discard(check.path)
+
+            check.exists = exists
+            check.done.set()
 
 
 def fetch_paddings(max_value=5):
@@ -232,11 +598,13 @@ def fetch_paddings(max_value=5):
     }
 
     try:
+        import nuke
+
         preferences = nuke.toNode("preferences")
         notation = preferences["UISequenceDisplayMode"].value()
         return available[notation]
 
-    except (TypeError, NameError, KeyError):
+    except (ImportError, TypeError, NameError, KeyError):
         return available["Hashes (#)"]
 
 
@@ -246,6 +614,8 @@ def fetch_current_comp_path():
     :return: Path to current 'nk' file or empty string.
 
     """
+    import nuke
+
     try:
         return nuke.scriptName()
     except RuntimeError:
@@ -354,15 +724,21 @@ def is_enabled(node):
     return not node["disable"].value()
 
 
+@nomenclator.profiling.timed("utilities.save_comp")
 def save_comp(context):
     """Save comp with path from *context*."""
+    import nuke
+
     try:
         nuke.scriptSaveAs(context.path)
     except RuntimeError:
         # thrown if operation is cancelled by user.
         return
 
+    clear_recent_paths()
+
 
+@nomenclator.profiling.timed("utilities.save_project")
 def save_project(context):
     """Save project with path from *context*."""
     import hiero.core
@@ -375,9 +751,14 @@ def save_project(context):
         # thrown if operation is cancelled by user.
         return
 
+    clear_recent_paths()
 
+
+@nomenclator.profiling.timed("utilities.update_nodes")
 def update_nodes(context):
     """Update nodes in graph from *context*."""
+    import nuke
+
     for _context in context.outputs:
         if not _context.enabled:
             continue
@@ -17,6 +17,8 @@ class DescriptionSelector(QtWidgets.QWidget):
     def __init__(self, parent=None):
         """Initiate the widget."""
         super(DescriptionSelector, self).__init__(parent)
+        self._descriptions = []
+
         self._setup_ui()
         self._connect_signals()
 
@@ -28,8 +30,54 @@ class DescriptionSelector(QtWidgets.QWidget):
 
     def set_items(self, descriptions):
         """Initialize values."""
+        self._descriptions = list(descriptions)
+
         self._description.clear()
-        self._description.addItems(list(descriptions) + [self.CUSTOM_LABEL])
+        self._description.addItems(self._descriptions + [self.CUSTOM_LABEL])
+
+    def set_versions(self, versions):
+        """Display latest version saved for each description.
+
+        Descriptions found in *versions* which are not configured are listed
+        after the configured descriptions. The current value is kept.
+
+        :param versions: Mapping regrouping next version integer associated
+            with each description.
+
+        """
+        items = self._descriptions + sorted(
+            description for description in versions
+            if description not in self._descriptions
+        )
+
+        current_items = [
+            self._description.itemText(index)
+            for index in range(self._description.count() - 1)
+        ]
+
+        if items != current_items:
+            value = self.value()
+
+            self._description.blockSignals(True)
+            self._description.clear()
+            self._description.addItems(items + [self.CUSTOM_LABEL])
+            self.set_current(value)
+            self._description.blockSignals(False)
+
+            self._custom_description.setVisible(
+                self._description.currentText() == self.CUSTOM_LABEL
+            )
+
+        for index, description in enumerate(items):
+            version = versions.get(description, 1)
+
+            tooltip = "No version saved"
+            if version > 1:
+                tooltip = "Latest version: v{0:03d}".format(version - 1)
+
+            self._description.setItemData(
+                index, tooltip, QtCore.Qt.ToolTipRole
+            )
 
     def set_current(self, description):
         """Set current description value."""
@@ -4,6 +4,8 @@ import os
 
 from nomenclator.vendor.Qt import QtWidgets, QtCore
 
+import nomenclator.completion
+
 
 class LocationWidget(QtWidgets.QFrame):
     """Widget used to manage location path."""
@@ -11,9 +13,22 @@ class LocationWidget(QtWidgets.QFrame):
     #: :term:`Qt Signal` emitted when location has been updated.
     updated = QtCore.Signal()
 
+    #: :term:`Qt Signal` emitted from the lister thread when a directory has
+    #: been listed.
+    _listed = QtCore.Signal(str, object)
+
     def __init__(self, parent=None):
         """Initiate the widget."""
         super(LocationWidget, self).__init__(parent)
+
+        # Directories are listed in a background thread so that typing is not
+        # blocked by slow storage.
+        self._lister = nomenclator.completion.DirectoryLister(
+            callback=lambda path, names: self._listed.emit(path, names)
+        )
+        self._recent_locations = []
+        self._template_configs = []
+
         self._setup_ui()
         self._connect_signals()
 
@@ -22,15 +37,31 @@ class LocationWidget(QtWidgets.QFrame):
         """Return current location."""
         return self._location.currentText()
 
-    def set_items(self, recent_locations, current_path):
-        """Initialize items."""
+    def set_items(self, recent_locations, current_path, template_configs=None):
+        """Initialize items.
+
+        Recent locations and directories matching one of the *template_configs*
+        are completed first.
+
+        """
         if os.path.isfile(current_path):
             current_path = os.path.dirname(current_path)
 
+        self._recent_locations = list(recent_locations)
+        self._template_configs = list(template_configs or [])
+
+        # Directories may have been created since they were listed.
+        self._lister.clear()
+
         self._location.clear()
         self._location.addItems(recent_locations)
         self._location.setEditText(current_path)
 
+    def hideEvent(self, event):
+        """Stop listing directories when the widget is hidden."""
+        super(LocationWidget, self).hideEvent(event)
+        self._lister.cancel()
+
     def _setup_ui(self):
         """Initialize user interface."""
         self.setObjectName("location-box")
@@ -51,11 +82,10 @@ class LocationWidget(QtWidgets.QFrame):
         self._completer = QtWidgets.QCompleter(self)
         self._completer.setCaseSensitivity(QtCore.Qt.CaseInsensitive)
         self._completer.setCompletionMode(QtWidgets.QCompleter.InlineCompletion)
-        model = QtWidgets.QDirModel(self._completer)
-        model.setFilter(
-            QtCore.QDir.Dirs | QtCore.QDir.NoDot | QtCore.QDir.NoDotDot
-        )
-        self._completer.setModel(model)
+
+        # Completions are sorted by priority.
+        self._completer.setModelSorting(QtWidgets.QCompleter.UnsortedModel)
+        self._completer.setModel(QtCore.QStringListModel(self._completer))
         self._location.setCompleter(self._completer)
 
         self._browse_btn = QtWidgets.QPushButton("Browse", self)
@@ -70,6 +100,35 @@ class LocationWidget(QtWidgets.QFrame):
         self._browse_btn.clicked.connect(self.browse)
         self._location.currentIndexChanged.connect(lambda: self.updated.emit())
         self._location.editTextChanged.connect(lambda: self.updated.emit())
+        self._location.editTextChanged.connect(self._fetch_completions)
+        self._listed.connect(self._update_completions)
+
+    def _fetch_completions(self, text):
+        """Update completions from cached listing of the folder of *text*."""
+        folder = os.path.dirname(text)
+        if not len(folder):
+            return
+
+        names = self._lister.fetch(folder)
+
+        # Completions are updated once the folder is listed otherwise.
+        if names is not None:
+            self._update_completions(folder, names)
+
+    def _update_completions(self, folder, names):
+        """Update completions with sub-directory *names* of *folder*."""
+        text = self._location.currentText()
+
+        # Ignore listing if the user has moved to another folder.
+        if os.path.dirname(text) != folder:
+            return
+
+        completions = nomenclator.completion.fetch_completions(
+            text, names,
+            recent_locations=self._recent_locations,
+            template_configs=self._template_configs
+        )
+        self._completer.model().setStringList(completions)
 
     def browse(self):
         """Open a browsing panel to choose the script location."""
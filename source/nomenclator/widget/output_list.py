@@ -2,15 +2,22 @@
 
 from nomenclator.vendor.Qt import QtWidgets, QtCore
 
-import nomenclator.context
+import nomenclator.instrumentation
 
 from .group_widget import GroupWidget
 from .path_widget import PathWidget
 from .token_editor import TokenEditor
 
 
-class OutputList(QtWidgets.QListWidget):
-    """List of output form settings."""
+class OutputList(QtWidgets.QListView):
+    """List of output form settings.
+
+    Output contexts are stored in a :class:`OutputModel` instance, and a
+    :class:`SettingsForm` editor is only created for visible rows and for the
+    row being edited, so that large scripts can be displayed without creating
+    a form for each output.
+
+    """
 
     #: :term:`Qt Signal` emitted when outputs are updated.
     updated = QtCore.Signal()
@@ -18,108 +25,274 @@ class OutputList(QtWidgets.QListWidget):
     def __init__(self, parent=None):
         """Initiate the widget."""
         super(OutputList, self).__init__(parent)
+
+        self._model = OutputModel(self)
+        self._delegate = OutputDelegate(self)
+
+        # Rows displaying an editor.
+        self._editors = set()
+
         self._setup_ui()
+        self._connect_signals()
 
     def _setup_ui(self):
         """Initialize user interface."""
         self.setObjectName("output-list")
         self.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.setUniformItemSizes(True)
 
-    def outputs_context(self):
-        """Return list of output contexts."""
-        outputs = []
-
-        for index in range(self.count()):
-            item = self.item(index)
-            widget = self.itemWidget(item)
-
-            context = nomenclator.context.OutputContext(
-                name=widget.form.name,
-                new_name=widget.form.new_name,
-                blacklisted_names=widget.form.blacklisted_names,
-                path=widget.form.path,
-                old_path=widget.form.old_path,
-                passname=widget.form.passname,
-                enabled=widget.is_enabled(),
-                destination=widget.form.destination,
-                destinations=widget.form.destinations,
-                file_type=widget.form.file_type,
-                file_types=widget.form.file_types,
-                multi_views=widget.form.multi_views,
-                colorspace=widget.form.colorspace,
-                append_username_to_name=widget.form.append_username_to_name,
-                append_colorspace_to_name=widget.form.append_colorspace_to_name,
-                append_passname_to_name=widget.form.append_passname_to_name,
-                append_passname_to_subfolder=widget.form.append_passname_to_subfolder,
-                error=widget.form.error
-            )
+        self.setModel(self._model)
+        self.setItemDelegate(self._delegate)
 
-            outputs.append(context)
+    def _connect_signals(self):
+        """Initialize signals connection."""
+        self.verticalScrollBar().valueChanged.connect(self._update_editors)
 
-        return tuple(outputs)
+        nomenclator.instrumentation.watch(
+            self.updated, "output_list.OutputList.updated"
+        )
+
+    @nomenclator.instrumentation.counted(
+        "output_list.OutputList.outputs_context"
+    )
+    def outputs_context(self):
+        """Return list of output contexts."""
+        return self._model.outputs()
 
     def set_values(self, outputs_context):
         """Initialize values."""
-        self.clear()
-
-        for context in outputs_context:
-            form = SettingsForm(context, self)
-            widget = SelectableItemWidget(form, context.enabled, self)
-
-            form.updated.connect(self.updated)
-            widget.updated.connect(self.updated)
-
-            item = QtWidgets.QListWidgetItem()
-            item.setSizeHint(widget.sizeHint())
-            self.addItem(item)
-            self.setItemWidget(item, widget)
+        # Editors are removed when the model is reset.
+        self._model.set_outputs(outputs_context)
+        self._editors = set()
+        self._update_editors()
 
+    @nomenclator.instrumentation.counted("output_list.OutputList.update")
     def update(self, outputs_context):
         """Update values from context list."""
-        for index, context in zip(range(self.count()), outputs_context):
-            item = self.item(index)
-            widget = self.itemWidget(item)
-            widget.form.update(context)
+        self._model.update_outputs(outputs_context)
 
     def set_destination(self, destination):
         """Set destination for all outputs"""
-        for index in range(self.count()):
-            item = self.item(index)
-            widget = self.itemWidget(item)
-
-            widget.form.set_destination(destination)
+        # noinspection PyProtectedMember
+        self._replace_outputs(
+            lambda context: (
+                context._replace(destination=destination)
+                if destination in context.destinations else context
+            )
+        )
 
     def set_append_username_to_name(self, value):
         """Indicate whether username should be appended to all base name."""
-        for index in range(self.count()):
-            item = self.item(index)
-            widget = self.itemWidget(item)
-
-            widget.form.set_append_username_to_name(value)
+        # noinspection PyProtectedMember
+        self._replace_outputs(
+            lambda context: context._replace(append_username_to_name=value)
+        )
 
     def set_append_colorspace_to_name(self, value):
         """Indicate whether colorspace should be appended to all base name."""
-        for index in range(self.count()):
-            item = self.item(index)
-            widget = self.itemWidget(item)
-
-            widget.form.set_append_colorspace_to_name(value)
+        # noinspection PyProtectedMember
+        self._replace_outputs(
+            lambda context: context._replace(append_colorspace_to_name=value)
+        )
 
     def set_append_passname_to_name(self, value):
         """Indicate whether passname should be appended to all base name."""
-        for index in range(self.count()):
-            item = self.item(index)
-            widget = self.itemWidget(item)
-
-            widget.form.set_append_passname_to_name(value)
+        # noinspection PyProtectedMember
+        self._replace_outputs(
+            lambda context: context._replace(append_passname_to_name=value)
+        )
 
     def set_append_passname_to_subfolder(self, value):
         """Indicate whether passname should be appended to all subfolder."""
-        for index in range(self.count()):
-            item = self.item(index)
-            widget = self.itemWidget(item)
+        # noinspection PyProtectedMember
+        self._replace_outputs(
+            lambda context: context._replace(append_passname_to_subfolder=value)
+        )
+
+    def commitData(self, editor):
+        """Save values from *editor* into the model."""
+        super(OutputList, self).commitData(editor)
+        self.updated.emit()
+
+    def resizeEvent(self, event):
+        """Update editors displayed when the list is resized."""
+        super(OutputList, self).resizeEvent(event)
+        self._update_editors()
+
+    def _replace_outputs(self, function):
+        """Replace each output context with the result of *function*."""
+        outputs = [function(context) for context in self._model.outputs()]
+
+        if self._model.update_outputs(outputs):
+            self.updated.emit()
+
+    def _update_editors(self):
+        """Create editors for visible rows and remove the others."""
+        rows = self._fetch_visible_rows()
+        focus_widget = QtWidgets.QApplication.focusWidget()
+
+        for row in self._editors - rows:
+            index = self._model.index(row)
+
+            # Keep editor of the row being edited.
+            editor = self.indexWidget(index)
+            if (
+                editor is not None and focus_widget is not None
+                and editor.isAncestorOf(focus_widget)
+            ):
+                rows.add(row)
+                continue
+
+            self.closePersistentEditor(index)
+
+        for row in rows - self._editors:
+            self.openPersistentEditor(self._model.index(row))
+
+        self._editors = rows
+
+    def _fetch_visible_rows(self):
+        """Return set of rows visible within the viewport."""
+        count = self._model.rowCount()
+        if count == 0:
+            return set()
+
+        # All rows have the same height.
+        height = self.sizeHintForRow(0)
+        if height <= 0:
+            return set()
+
+        offset = self.verticalScrollBar().value()
+        first = offset // height
+        last = (offset + self.viewport().height()) // height
+
+        return set(range(first, min(last + 1, count)))
+
+
+class OutputModel(QtCore.QAbstractListModel):
+    """Model storing output contexts."""
+
+    #: Role used to return and set the output context of each row.
+    CONTEXT_ROLE = QtCore.Qt.UserRole
+
+    def __init__(self, parent=None):
+        """Initiate the model."""
+        super(OutputModel, self).__init__(parent)
+        self._outputs = []
+
+    def rowCount(self, parent=None):
+        """Return number of outputs."""
+        if parent is not None and parent.isValid():
+            return 0
+
+        return len(self._outputs)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """Return data of output at *index* for *role*."""
+        if not index.isValid() or index.row() >= len(self._outputs):
+            return None
+
+        context = self._outputs[index.row()]
+
+        if role == self.CONTEXT_ROLE:
+            return context
+
+        if role == QtCore.Qt.DisplayRole:
+            return context.new_name
+
+        return None
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        """Set output context *value* at *index*."""
+        if role != self.CONTEXT_ROLE or not index.isValid():
+            return False
+
+        if self._outputs[index.row()] == value:
+            return False
+
+        self._outputs[index.row()] = value
+        self.dataChanged.emit(index, index)
+        return True
+
+    def flags(self, index):
+        """Return item flags of output at *index*."""
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsEditable
+
+    def outputs(self):
+        """Return tuple of output contexts."""
+        return tuple(self._outputs)
+
+    def set_outputs(self, outputs):
+        """Replace all output contexts and reset the model."""
+        self.beginResetModel()
+        self._outputs = list(outputs)
+        self.endResetModel()
+
+    def update_outputs(self, outputs):
+        """Replace output contexts and notify rows which have changed.
+
+        :param outputs: Tuple of output contexts in the same order as the
+            outputs of the model.
+
+        :return: Number of rows changed.
+
+        """
+        changed = 0
+
+        for row, context in zip(range(len(self._outputs)), outputs):
+            if self._outputs[row] == context:
+                continue
+
+            self._outputs[row] = context
+
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+            changed += 1
+
+        return changed
 
-            widget.form.set_append_passname_to_subfolder(value)
+
+class OutputDelegate(QtWidgets.QStyledItemDelegate):
+    """Delegate creating forms to edit output contexts."""
+
+    def __init__(self, parent=None):
+        """Initiate the delegate."""
+        super(OutputDelegate, self).__init__(parent)
+        self._size_hint = None
+
+    def createEditor(self, parent, option, index):
+        """Return form to edit output at *index*."""
+        context = index.data(OutputModel.CONTEXT_ROLE)
+
+        form = SettingsForm(context)
+        editor = SelectableItemWidget(form, context.enabled, parent)
+        editor.setAutoFillBackground(True)
+        editor.updated.connect(lambda: self.commitData.emit(editor))
+        return editor
+
+    def setEditorData(self, editor, index):
+        """Update *editor* from output at *index*."""
+        editor.set_values(index.data(OutputModel.CONTEXT_ROLE))
+
+    def setModelData(self, editor, model, index):
+        """Update output at *index* from *editor*."""
+        context = index.data(OutputModel.CONTEXT_ROLE)
+        model.setData(index, editor.context(context), OutputModel.CONTEXT_ROLE)
+
+    def updateEditorGeometry(self, editor, option, index):
+        """Fit *editor* within the row."""
+        editor.setGeometry(option.rect)
+
+    def sizeHint(self, option, index):
+        """Return size of each row, measured once from a form."""
+        if self._size_hint is None:
+            context = index.data(OutputModel.CONTEXT_ROLE)
+
+            editor = SelectableItemWidget(SettingsForm(context), context.enabled)
+            self._size_hint = editor.sizeHint()
+            editor.deleteLater()
+
+        return self._size_hint
 
 
 class SelectableItemWidget(QtWidgets.QWidget):
@@ -151,6 +324,39 @@ class SelectableItemWidget(QtWidgets.QWidget):
         """Return whether item is enabled."""
         return self._selection.isChecked()
 
+    def context(self, context):
+        """Return output *context* updated with values from the form."""
+        # noinspection PyProtectedMember
+        return context._replace(
+            new_name=self._form_widget.new_name,
+            passname=self._form_widget.passname,
+            enabled=self.is_enabled(),
+            destination=self._form_widget.destination,
+            file_type=self._form_widget.file_type,
+            append_username_to_name=self._form_widget.append_username_to_name,
+            append_colorspace_to_name=self._form_widget.append_colorspace_to_name,
+            append_passname_to_name=self._form_widget.append_passname_to_name,
+            append_passname_to_subfolder=(
+                self._form_widget.append_passname_to_subfolder
+            ),
+        )
+
+    def set_values(self, context):
+        """Initialize values.
+
+        Only widgets displaying a different value are updated.
+
+        """
+        if self.is_enabled() != context.enabled:
+            update_check_box(
+                self._selection,
+                QtCore.Qt.Checked if context.enabled else QtCore.Qt.Unchecked
+            )
+            self._main_frame.setEnabled(context.enabled)
+
+        self._form_widget.set_values(context)
+        self._form_widget.update(context)
+
     def _setup_ui(self):
         """Initialize user interface."""
 
@@ -181,6 +387,11 @@ class SelectableItemWidget(QtWidgets.QWidget):
     def _connect_signals(self):
         """Initialize signals connection."""
         self._selection.stateChanged.connect(self._toggle_enable)
+        self._form_widget.updated.connect(self.updated.emit)
+
+        nomenclator.instrumentation.watch(
+            self.updated, "output_list.SelectableItemWidget.updated"
+        )
 
     def _toggle_enable(self):
         """Toggle the enabling state of the output widget."""
@@ -302,66 +513,44 @@ class SettingsForm(QtWidgets.QWidget):
         """Return output error value."""
         return self._error
 
-    def set_destination(self, destination):
-        """Set destination for all outputs"""
-        self._destination.blockSignals(True)
-        index = self._destination.findText(destination)
-        if index >= 0:
-            self._destination.setCurrentIndex(index)
-        self._destination.blockSignals(False)
-
-    def set_append_username_to_name(self, value):
-        """Indicate whether username should be appended to all base name."""
-        self._file_name_form.set_append_username(value)
+    def set_values(self, context):
+        """Initialize values.
 
-    def set_append_colorspace_to_name(self, value):
-        """Indicate whether colorspace should be appended to all base name."""
-        self._file_name_form.set_append_colorspace(value)
+        Only widgets displaying a different value are updated, so that
+        refreshing all outputs after an edit does not touch unchanged forms.
 
-    def set_append_passname_to_name(self, value):
-        """Indicate whether passname should be appended to all base name."""
-        self._file_name_form.set_append_passname(value)
+        """
+        if self._node_name.text() != context.new_name:
+            self._node_name.blockSignals(True)
+            self._node_name.setText(context.new_name)
+            self._node_name.blockSignals(False)
 
-    def set_append_passname_to_subfolder(self, value):
-        """Indicate whether passname should be appended to all subfolder."""
-        self._sub_folder_form.set_append_passname(value)
+        if self._passname.text() != context.passname:
+            self._passname.blockSignals(True)
+            self._passname.setText(context.passname)
+            self._passname.blockSignals(False)
 
-    def set_values(self, context):
-        """Initialize values."""
-        self._node_name.blockSignals(True)
-        self._node_name.setText(context.name)
-        self._node_name.blockSignals(False)
-
-        self._passname.blockSignals(True)
-        self._passname.setText(context.passname)
-        self._passname.blockSignals(False)
-
-        self._file_type.blockSignals(True)
-        self._file_type.clear()
-        self._file_type.addItems(context.file_types)
-        index = self._file_type.findText(context.file_type)
-        if index >= 0:
-            self._file_type.setCurrentIndex(index)
-        self._file_type.blockSignals(False)
+        update_combo_box(self._file_type, context.file_types, context.file_type)
 
         self._sub_folder_form.set_values(context)
         self._file_name_form.set_values(context)
 
+    @nomenclator.instrumentation.counted("output_list.SettingsForm.update")
     def update(self, context):
-        """Update values from context list."""
-        self._destination.blockSignals(True)
-        self._destination.clear()
-        self._destination.addItems(context.destinations)
-        index = self._destination.findText(context.destination)
-        if index >= 0:
-            self._destination.setCurrentIndex(index)
-        self._destination.blockSignals(False)
+        """Update values from context list.
 
-        self._output_path.blockSignals(True)
-        self._output_path.set_path(
-            context.path if context.enabled else context.old_path
+        Only widgets displaying a different value are updated.
+
+        """
+        update_combo_box(
+            self._destination, context.destinations, context.destination
         )
-        self._output_path.blockSignals(False)
+
+        path = context.path if context.enabled else context.old_path
+        if self._output_path.path() != path:
+            self._output_path.blockSignals(True)
+            self._output_path.set_path(path)
+            self._output_path.blockSignals(False)
 
     def _setup_ui(self):
         """Initialize user interface."""
@@ -422,6 +611,10 @@ class SettingsForm(QtWidgets.QWidget):
         self._sub_folder_form.updated.connect(lambda: self.updated.emit())
         self._file_name_form.updated.connect(lambda: self.updated.emit())
 
+        nomenclator.instrumentation.watch(
+            self.updated, "output_list.SettingsForm.updated"
+        )
+
 
 class SubFolderForm(QtWidgets.QWidget):
     """Form to manage sub-folder settings."""
@@ -440,22 +633,13 @@ class SubFolderForm(QtWidgets.QWidget):
         """Return whether passname should be appended to subfolder."""
         return self._append_passname.isChecked()
 
-    def set_append_passname(self, value):
-        """Indicate whether passname should be appended to base name."""
-        self._append_passname.blockSignals(True)
-        state = QtCore.Qt.Checked if value else QtCore.Qt.Unchecked
-        self._append_passname.setCheckState(state)
-        self._append_passname.blockSignals(False)
-
     def set_values(self, context):
         """Initialize values."""
-        self._append_passname.blockSignals(True)
-        state = (
+        update_check_box(
+            self._append_passname,
             QtCore.Qt.Checked if context.append_passname_to_subfolder
             else QtCore.Qt.Unchecked
         )
-        self._append_passname.setCheckState(state)
-        self._append_passname.blockSignals(False)
 
     def _setup_ui(self):
         """Initialize user interface."""
@@ -470,6 +654,10 @@ class SubFolderForm(QtWidgets.QWidget):
         """Initialize signals connection."""
         self._append_passname.stateChanged.connect(lambda: self.updated.emit())
 
+        nomenclator.instrumentation.watch(
+            self.updated, "output_list.SubFolderForm.updated"
+        )
+
 
 class FileNameForm(QtWidgets.QWidget):
     """Form to manage output file name settings."""
@@ -498,52 +686,23 @@ class FileNameForm(QtWidgets.QWidget):
         """Return whether username should be appended to base name."""
         return self._append_username.isChecked()
 
-    def set_append_username(self, value):
-        """Indicate whether username should be appended to base name."""
-        self._append_username.blockSignals(True)
-        state = QtCore.Qt.Checked if value else QtCore.Qt.Unchecked
-        self._append_username.setCheckState(state)
-        self._append_username.blockSignals(False)
-
-    def set_append_colorspace(self, value):
-        """Indicate whether colorspace should be appended to base name."""
-        self._append_colorspace.blockSignals(True)
-        state = QtCore.Qt.Checked if value else QtCore.Qt.Unchecked
-        self._append_colorspace.setCheckState(state)
-        self._append_colorspace.blockSignals(False)
-
-    def set_append_passname(self, value):
-        """Indicate whether passname should be appended to base name."""
-        self._append_passname.blockSignals(True)
-        state = QtCore.Qt.Checked if value else QtCore.Qt.Unchecked
-        self._append_passname.setCheckState(state)
-        self._append_passname.blockSignals(False)
-
     def set_values(self, context):
         """Initialize values."""
-        self._append_passname.blockSignals(True)
-        state = (
+        update_check_box(
+            self._append_passname,
             QtCore.Qt.Checked if context.append_passname_to_name
             else QtCore.Qt.Unchecked
         )
-        self._append_passname.setCheckState(state)
-        self._append_passname.blockSignals(False)
-
-        self._append_colorspace.blockSignals(True)
-        state = (
+        update_check_box(
+            self._append_colorspace,
             QtCore.Qt.Checked if context.append_colorspace_to_name
             else QtCore.Qt.Unchecked
         )
-        self._append_colorspace.setCheckState(state)
-        self._append_colorspace.blockSignals(False)
-
-        self._append_username.blockSignals(True)
-        state = (
+        update_check_box(
+            self._append_username,
             QtCore.Qt.Checked if context.append_username_to_name
             else QtCore.Qt.Unchecked
         )
-        self._append_username.setCheckState(state)
-        self._append_username.blockSignals(False)
 
     def _setup_ui(self):
         """Initialize user interface."""
@@ -565,3 +724,53 @@ class FileNameForm(QtWidgets.QWidget):
         self._append_passname.stateChanged.connect(lambda: self.updated.emit())
         self._append_colorspace.stateChanged.connect(lambda: self.updated.emit())
         self._append_username.stateChanged.connect(lambda: self.updated.emit())
+
+        nomenclator.instrumentation.watch(
+            self.updated, "output_list.FileNameForm.updated"
+        )
+
+
+def update_combo_box(combo_box, items, current):
+    """Display *items* and *current* item in *combo_box* if they differ.
+
+    Items are only replaced when they differ from the items displayed, and
+    signals are blocked so that the update is not mistaken for a user edit.
+
+    :param combo_box: Instance of :class:`QtWidgets.QComboBox`.
+
+    :param items: Sequence of item labels to display.
+
+    :param current: Label of the item to select.
+
+    """
+    combo_box.blockSignals(True)
+
+    labels = tuple(
+        combo_box.itemText(index) for index in range(combo_box.count())
+    )
+    if labels != tuple(items):
+        combo_box.clear()
+        combo_box.addItems(list(items))
+
+    if combo_box.currentText() != current:
+        index = combo_box.findText(current)
+        if index >= 0:
+            combo_box.setCurrentIndex(index)
+
+    combo_box.blockSignals(False)
+
+
+def update_check_box(check_box, state):
+    """Set *state* of *check_box* if it differs, without emitting signals.
+
+    :param check_box: Instance of :class:`QtWidgets.QCheckBox`.
+
+    :param state: :class:`QtCore.Qt.CheckState` value to display.
+
+    """
+    if check_box.checkState() == state:
+        return
+
+    check_box.blockSignals(True)
+    check_box.setCheckState(state)
+    check_box.blockSignals(False)
@@ -2,8 +2,10 @@
 
 from nomenclator.vendor.Qt import QtWidgets, QtCore
 
+import nomenclator.instrumentation
+
 from .group_widget import GroupWidget
-from .output_list import OutputList
+from .output_list import OutputList, update_check_box, update_combo_box
 
 
 class OutputSettingsForm(QtWidgets.QWidget):
@@ -33,6 +35,9 @@ class OutputSettingsForm(QtWidgets.QWidget):
 
         self._context = context
 
+    @nomenclator.instrumentation.counted(
+        "output_settings_form.OutputSettingsForm.update"
+    )
     def update(self, context):
         """Update values from context."""
         self._file_path_form.update(context)
@@ -74,6 +79,10 @@ class OutputSettingsForm(QtWidgets.QWidget):
         self._file_name_form.updated.connect(self._update_context)
         self._file_path_form.updated.connect(self._update_context)
 
+        nomenclator.instrumentation.watch(
+            self.updated, "output_settings_form.OutputSettingsForm.updated"
+        )
+
     def _handle_output_update(self):
         """Handle changes to output list"""
         outputs = self._output_list.outputs_context()
@@ -86,10 +95,10 @@ class OutputSettingsForm(QtWidgets.QWidget):
         """Handle global changes to options"""
         method_name = "set_{}".format(key)
         setter = getattr(self._output_list, method_name, None)
-        setter(value)
 
-        outputs = self._output_list.outputs_context()
-        self._update_context("outputs", outputs)
+        # Output list emits one update signal if at least one output changed,
+        # which is handled by '_handle_output_update'.
+        setter(value)
 
     def _update_context(self, key, value):
         """Update context object from *key* and *value*."""
@@ -124,39 +133,38 @@ class FilePathForm(QtWidgets.QWidget):
 
     def set_values(self, context):
         """Initialize values."""
-        self._create_subfolders.blockSignals(True)
-        state = QtCore.Qt.Checked if context.create_subfolders else QtCore.Qt.Unchecked
-        self._create_subfolders.setCheckState(state)
-        self._create_subfolders.blockSignals(False)
-
-        self._append_passname.blockSignals(True)
-        state = _compute_check_state({
-            output.append_passname_to_subfolder for output in context.outputs
-        })
-        self._append_passname.setCheckState(state)
-        self._append_passname.blockSignals(False)
+        update_check_box(
+            self._create_subfolders,
+            QtCore.Qt.Checked if context.create_subfolders else QtCore.Qt.Unchecked
+        )
+        update_check_box(
+            self._append_passname,
+            _compute_check_state({
+                output.append_passname_to_subfolder for output in context.outputs
+            })
+        )
 
     def update(self, context):
-        """Update values from context."""
-        self._destinations.blockSignals(True)
-        self._destinations.clear()
+        """Update values from context.
+
+        Destinations are only replaced when they differ from the items
+        displayed.
 
+        """
         items = []
         if len(context.outputs):
             items = list(context.outputs[0].destinations)
 
-        if len(items):
-            items += [self.DESTINATION_PER_OUTPUT]
-            self._destinations.addItems(items)
-
-            targets = set([output.destination for output in context.outputs])
-            value = list(targets)[0] if len(targets) == 1 else self.DESTINATION_PER_OUTPUT
+        if not len(items):
+            update_combo_box(self._destinations, [], "")
+            return
 
-            index = self._destinations.findText(value)
-            if index >= 0:
-                self._destinations.setCurrentIndex(index)
+        targets = set([output.destination for output in context.outputs])
+        value = list(targets)[0] if len(targets) == 1 else self.DESTINATION_PER_OUTPUT
 
-        self._destinations.blockSignals(False)
+        update_combo_box(
+            self._destinations, items + [self.DESTINATION_PER_OUTPUT], value
+        )
 
     def _setup_ui(self):
         """Initialize user interface."""
@@ -203,6 +211,13 @@ class FilePathForm(QtWidgets.QWidget):
             )
         )
 
+        nomenclator.instrumentation.watch(
+            self.updated, "output_settings_form.FilePathForm.updated"
+        )
+        nomenclator.instrumentation.watch(
+            self.output_updated, "output_settings_form.FilePathForm.output_updated"
+        )
+
     def _emit_output_signal(self):
         """Emit signal to indicate that output items must be updated."""
         knob = self.sender()
@@ -266,34 +281,26 @@ class FileNameForm(QtWidgets.QWidget):
 
     def set_values(self, context):
         """Initialize values."""
-        self._padding.blockSignals(True)
-        self._padding.clear()
-        self._padding.addItems(context.paddings)
-        index = self._padding.findText(context.padding)
-        if index >= 0:
-            self._padding.setCurrentIndex(index)
-        self._padding.blockSignals(False)
-
-        self._append_passname.blockSignals(True)
-        state = _compute_check_state({
-            output.append_passname_to_name for output in context.outputs
-        })
-        self._append_passname.setCheckState(state)
-        self._append_passname.blockSignals(False)
-
-        self._append_colorspace.blockSignals(True)
-        state = _compute_check_state({
-            output.append_colorspace_to_name for output in context.outputs
-        })
-        self._append_colorspace.setCheckState(state)
-        self._append_colorspace.blockSignals(False)
-
-        self._append_username.blockSignals(True)
-        state = _compute_check_state({
-            output.append_username_to_name for output in context.outputs
-        })
-        self._append_username.setCheckState(state)
-        self._append_username.blockSignals(False)
+        update_combo_box(self._padding, context.paddings, context.padding)
+
+        update_check_box(
+            self._append_passname,
+            _compute_check_state({
+                output.append_passname_to_name for output in context.outputs
+            })
+        )
+        update_check_box(
+            self._append_colorspace,
+            _compute_check_state({
+                output.append_colorspace_to_name for output in context.outputs
+            })
+        )
+        update_check_box(
+            self._append_username,
+            _compute_check_state({
+                output.append_username_to_name for output in context.outputs
+            })
+        )
 
     def _setup_ui(self):
         """Initialize user interface."""
@@ -333,6 +340,13 @@ class FileNameForm(QtWidgets.QWidget):
             lambda value: self.updated.emit("padding", value)
         )
 
+        nomenclator.instrumentation.watch(
+            self.updated, "output_settings_form.FileNameForm.updated"
+        )
+        nomenclator.instrumentation.watch(
+            self.output_updated, "output_settings_form.FileNameForm.output_updated"
+        )
+
     def _emit_output_signal(self):
         """Emit corresponding signals"""
         knob = self.sender()
@@ -0,0 +1,14 @@
+"""
+Benchmark suites measuring the performance of the package.
+
+Each suite can be executed with the standard library only, from the root of
+the repository::
+
+    python -m test.benchmark.bench_template --save baseline.json
+    python -m test.benchmark.bench_template --compare baseline.json
+
+The suites are also executed by :mod:`pytest`, which measures them with
+`pytest-benchmark <https://pytest-benchmark.readthedocs.io>`_ when it is
+installed, or only calls each case once otherwise.
+
+"""
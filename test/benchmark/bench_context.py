@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+import atexit
+import functools
+import os
+import re
+import shutil
+import sys
+import tempfile
+
+import nomenclator.config
+import nomenclator.context
+import nomenclator.template
+import nomenclator.utilities
+from test.benchmark import graph, harness
+
+#: Numbers of output nodes within the graph.
+OUTPUT_COUNTS = [10, 100, 1000, 10000]
+
+#: Numbers of composition template configurations.
+TEMPLATE_COUNTS = [1, 10, 100, 500]
+
+#: Number of output nodes when measuring template configurations.
+DEFAULT_OUTPUTS = 10
+
+#: Number of template configurations when measuring output nodes.
+DEFAULT_TEMPLATES = 10
+
+#: Number of composition scripts saved in the location path.
+SCRIPT_COUNT = 20
+
+
+def create_root():
+    """Return temporary root folder with composition scripts.
+
+    The folder is removed when the process exits.
+
+    """
+    root = tempfile.mkdtemp()
+    atexit.register(shutil.rmtree, root, True)
+
+    path = os.path.join(root, "proj", "sh001", "scripts")
+    os.makedirs(path)
+
+    for index in range(SCRIPT_COUNT):
+        name = "proj_sh001_comp_v{:03d}.nk".format(index + 1)
+        with open(os.path.join(path, name), "w") as stream:
+            stream.write("")
+
+    return root
+
+
+def create_config(root, templates=1):
+    """Return configuration with *templates* composition templates.
+
+    Only the last template matches the location path, so all templates are
+    compared when resolving a context.
+
+    """
+    items = [
+        {
+            "id": "Other{}".format(index),
+            "pattern-path": (
+                root + "/other{}/{{project}}/{{shot:sh\\d+}}/scripts".format(index)
+            ),
+            "pattern-base": "{project}_{shot}_{description}_v{version}",
+        }
+        for index in range(templates - 1)
+    ]
+
+    items.append({
+        "id": "Shot",
+        "pattern-path": root + "/{project}/{shot:sh\\d+}/scripts",
+        "pattern-base": "{project}_{shot}_{description}_v{version}",
+        "outputs": [
+            {
+                "id": name,
+                "pattern-path": root + "/{project}/{shot}/" + name,
+                "pattern-base": "{project}_{shot}_" + name + "_v{version}",
+                "append-passname-to-name": True,
+            }
+            for name in ["comps", "precomps", "roto"]
+        ]
+    })
+
+    return nomenclator.config.load({"comp-templates": items})
+
+
+def fetch_cases(namespace=None):
+    """Yield name and function of each context benchmark case."""
+    max_outputs = getattr(namespace, "max_outputs", max(OUTPUT_COUNTS))
+    max_templates = getattr(namespace, "max_templates", max(TEMPLATE_COUNTS))
+
+    root = create_root()
+    path = os.path.join(root, "proj", "sh001", "scripts", "proj_sh001_comp_v001.nk")
+    output_path = root + "/proj/sh001/comps/{name}.####.exr"
+
+    parameters = [
+        ("outputs={}".format(count), count, DEFAULT_TEMPLATES)
+        for count in OUTPUT_COUNTS if count <= max_outputs
+    ] + [
+        ("templates={}".format(count), DEFAULT_OUTPUTS, count)
+        for count in TEMPLATE_COUNTS if count <= max_templates
+    ]
+
+    for parameter, outputs, templates in parameters:
+        _graph = graph.create(
+            outputs=outputs, path=path, output_path=output_path
+        )
+        config = create_config(root, templates=templates)
+        context = _graph(nomenclator.context.fetch, config)
+
+        yield "context.fetch[{}]".format(parameter), functools.partial(
+            _graph, nomenclator.context.fetch, config
+        )
+        yield "context.fetch[cache=cold,{}]".format(parameter), (
+            functools.partial(_cold, _graph, nomenclator.context.fetch, config)
+        )
+        yield "context.update[{}]".format(parameter), functools.partial(
+            nomenclator.context.update, context
+        )
+        yield "context.update[cache=cold,{}]".format(parameter), (
+            functools.partial(_cold, nomenclator.context.update, context)
+        )
+
+
+def _cold(function, *args):
+    """Return result of *function* called after clearing template caches."""
+    # noinspection PyProtectedMember
+    nomenclator.utilities._TEMPLATE_CONFIG_CACHE.clear()
+    # noinspection PyProtectedMember
+    nomenclator.template._REGEXP_CACHE.clear()
+    re.purge()
+
+    return function(*args)
+
+
+def main(arguments=None):
+    """Execute context benchmark suite from *arguments*."""
+    parser = harness.construct_parser(
+        "Measure how context.fetch and context.update scale with the number "
+        "of output nodes and template configurations."
+    )
+    parser.add_argument(
+        "--max-outputs", type=int, default=max(OUTPUT_COUNTS),
+        help="Maximum number of output nodes (default: %(default)s)."
+    )
+    parser.add_argument(
+        "--max-templates", type=int, default=max(TEMPLATE_COUNTS),
+        help="Maximum number of template configurations (default: %(default)s)."
+    )
+    return harness.main(fetch_cases, parser, arguments=arguments)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
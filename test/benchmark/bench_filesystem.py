@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+
+import atexit
+import functools
+import math
+import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+import nomenclator.template
+import nomenclator.utilities
+from test.benchmark import harness
+
+#: Numbers of files within the location path.
+FILE_COUNTS = [1000, 10000, 100000, 1000000]
+
+#: Default maximum number of files, as creating larger directories is slow.
+DEFAULT_MAX_FILES = 100000
+
+#: Ratio of files matching the pattern of the scene requested.
+MATCHING_RATIO = 0.25
+
+#: Pattern and token values of the scene requested.
+PATTERN = "{project}_{shot}_{description}_v{version}"
+TOKEN_MAPPING = {"project": "proj", "shot": "sh001", "description": "comp"}
+
+#: Templates of other file names. Backups and autosaves share the prefix of
+#: the scene requested, so their versions are also discovered.
+OTHER_NAMES = [
+    "proj_sh001_roto_v{:03d}.nk",
+    "proj_sh001_comp_v{:03d}.nk~",
+    "proj_sh002_comp_v{:03d}.nk",
+    "proj_sh001_comp_v{:03d}.autosave",
+    "render_{:07d}.exr",
+    "notes_{}.txt",
+]
+
+
+class Filesystem(object):
+    """Shim adding latency to directory listings.
+
+    Network filesystems such as NFS list directories in several requests of
+    a limited number of entries, each one adding a round trip::
+
+        >>> filesystem = Filesystem(latency=0.001, entries_per_call=1024)
+        >>> filesystem(fetch_next_version, path, pattern, token_mapping)
+
+    """
+
+    def __init__(self, latency=0.0, entries_per_call=1024):
+        """Initiate shim.
+
+        :param latency: Number of seconds added for each request. Default is
+            0, which means that no latency is added.
+
+        :param entries_per_call: Number of entries returned by each request.
+            Default is 1024.
+
+        """
+        self.latency = latency
+        self.entries_per_call = entries_per_call
+        self.calls = 0
+
+    def listdir(self, path, _listdir=os.listdir):
+        """Return list of file names within *path* with latency."""
+        names = _listdir(path)
+
+        calls = max(1, int(math.ceil(len(names) / float(self.entries_per_call))))
+        self.calls += calls
+
+        if self.latency > 0:
+            time.sleep(self.latency * calls)
+
+        return names
+
+    def __call__(self, function, *args, **kwargs):
+        """Return result of *function* called with the shim installed."""
+        listdir = os.listdir
+        os.listdir = self.listdir
+
+        try:
+            return function(*args, **kwargs)
+
+        finally:
+            os.listdir = listdir
+
+
+def create_file_names(count, seed=0):
+    """Return *count* file names with a deterministic mix of names.
+
+    A quarter of the names are versions of the scene requested, with a version
+    history as deep as the number of these names. Other names are either
+    scenes with another description or shot, backups, autosaves or unrelated
+    files.
+
+    """
+    generator = random.Random(seed)
+    matching = int(count * MATCHING_RATIO)
+
+    versions = list(range(1, matching + 1))
+    generator.shuffle(versions)
+
+    names = [
+        "proj_sh001_comp_v{:03d}.nk".format(version) for version in versions
+    ]
+
+    for index in range(count - matching):
+        template = OTHER_NAMES[index % len(OTHER_NAMES)]
+        names.append(template.format(index + 1))
+
+    generator.shuffle(names)
+    return names
+
+
+def create_directory(count, root=None):
+    """Return temporary directory containing *count* files.
+
+    The directory is removed when the process exits.
+
+    :param count: Number of files to create.
+
+    :param root: Folder to create the directory in. Default is None, which
+        means that the default temporary folder is used.
+
+    """
+    path = tempfile.mkdtemp(dir=root)
+    atexit.register(shutil.rmtree, path, True)
+
+    for name in create_file_names(count):
+        with open(os.path.join(path, name), "w"):
+            pass
+
+    return path
+
+
+def fetch_cases(namespace=None):
+    """Yield name and function of each filesystem benchmark case."""
+    max_files = getattr(namespace, "max_files", DEFAULT_MAX_FILES)
+    root = getattr(namespace, "directory", None)
+
+    filesystem = Filesystem(
+        latency=getattr(namespace, "latency", 0.0),
+        entries_per_call=getattr(namespace, "entries_per_call", 1024),
+    )
+
+    for count in FILE_COUNTS:
+        if count > max_files:
+            continue
+
+        path = create_directory(count, root=root)
+        file_names = os.listdir(path)
+
+        yield "fetch_next_version[mode=cold,files={}]".format(count), (
+            functools.partial(
+                _cold, filesystem, nomenclator.utilities.fetch_next_version,
+                path, PATTERN, TOKEN_MAPPING
+            )
+        )
+        yield "fetch_next_version[mode=warm,files={}]".format(count), (
+            functools.partial(
+                filesystem, nomenclator.utilities.fetch_next_version,
+                path, PATTERN, TOKEN_MAPPING
+            )
+        )
+        yield "fetch_next_version[mode=listed,files={}]".format(count), (
+            functools.partial(
+                nomenclator.utilities.fetch_next_version,
+                path, PATTERN, TOKEN_MAPPING, file_names=file_names
+            )
+        )
+
+    scene_path = "/path/proj_sh001_comp_v12345.nk"
+
+    yield "fetch_version[mode=cold]", functools.partial(
+        _cold, filesystem, nomenclator.utilities.fetch_version,
+        scene_path, PATTERN, TOKEN_MAPPING
+    )
+    yield "fetch_version[mode=warm]", functools.partial(
+        filesystem, nomenclator.utilities.fetch_version,
+        scene_path, PATTERN, TOKEN_MAPPING
+    )
+
+
+def _cold(filesystem, function, *args):
+    """Return result of *function* called after clearing template caches."""
+    # noinspection PyProtectedMember
+    nomenclator.template._REGEXP_CACHE.clear()
+    re.purge()
+
+    return filesystem(function, *args)
+
+
+def main(arguments=None):
+    """Execute filesystem benchmark suite from *arguments*."""
+    parser = harness.construct_parser(
+        "Measure version discovery in large directories."
+    )
+    parser.add_argument(
+        "--max-files", type=int, default=DEFAULT_MAX_FILES,
+        help="Maximum number of files per directory (default: %(default)s)."
+    )
+    parser.add_argument(
+        "--directory", metavar="PATH",
+        help=(
+            "Folder to create directories in, such as a network mount. "
+            "Default is the temporary folder."
+        )
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0,
+        help="Seconds added to each directory listing request."
+    )
+    parser.add_argument(
+        "--entries-per-call", type=int, default=1024,
+        help=(
+            "Number of entries returned by each directory listing request "
+            "(default: %(default)s)."
+        )
+    )
+    return harness.main(fetch_cases, parser, arguments=arguments)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+import functools
+import re
+import sys
+
+import nomenclator.template
+from test.benchmark import harness
+
+#: Numbers of tokens within synthetic patterns.
+TOKEN_COUNTS = [1, 5, 10, 20]
+
+#: Numbers of tokens with a custom expression within synthetic patterns.
+EXPRESSION_COUNTS = [0, 5, 10]
+
+#: Numbers of folders within synthetic patterns.
+DEPTHS = [1, 10, 50]
+
+#: Path pattern and base pattern representative of a production configuration.
+PATH_PATTERN = "/path/{project}/{episode:ep\\d+}/{shot:sh\\d+}/scripts"
+BASE_PATTERN = "{project}_{episode}_{shot}_{description}_v{version}"
+
+#: Token values resolving patterns above.
+TOKEN_MAPPING = {
+    "project": "my_project",
+    "episode": "ep002",
+    "shot": "sh003",
+    "description": "comp",
+    "version": "012",
+    "padding": "####",
+    "passname": "beauty",
+    "colorspace": "linear",
+    "username": "john-doe",
+}
+
+
+def create_pattern(tokens=1, expressions=0, depth=1):
+    """Return synthetic pattern and a path matching it.
+
+    :param tokens: Number of tokens within the pattern. Default is 1.
+
+    :param expressions: Number of tokens with a custom expression. Default
+        is 0.
+
+    :param depth: Number of folders before the tokens. Default is 1.
+
+    :return: Tuple containing the pattern, the path and the mapping of token
+        values.
+
+    """
+    folders = ["folder{}".format(index) for index in range(depth)]
+    pattern_elements = list(folders)
+    path_elements = list(folders)
+    mapping = {}
+
+    for index in range(tokens):
+        name = "token{}".format(index)
+        mapping[name] = "t{}_001".format(index)
+        path_elements.append(mapping[name])
+
+        if index < expressions:
+            pattern_elements.append("{{{}:t{}_\\d+}}".format(name, index))
+        else:
+            pattern_elements.append("{{{}}}".format(name))
+
+    pattern = "/" + "/".join(pattern_elements)
+    path = "/" + "/".join(path_elements)
+    return pattern, path, mapping
+
+
+def fetch_cases(_=None):
+    """Yield name and function of each template benchmark case."""
+    patterns = [
+        ("tokens={}".format(count), create_pattern(tokens=count))
+        for count in TOKEN_COUNTS
+    ] + [
+        ("expressions={}".format(count), create_pattern(
+            tokens=max(EXPRESSION_COUNTS), expressions=count
+        ))
+        for count in EXPRESSION_COUNTS
+    ] + [
+        ("depth={}".format(count), create_pattern(depth=count))
+        for count in DEPTHS
+    ]
+
+    for parameter, (pattern, path, mapping) in patterns:
+        yield "construct_regexp[cache=cold,{}]".format(parameter), (
+            functools.partial(_construct_regexp_cold, pattern)
+        )
+        yield "construct_regexp[cache=warm,{}]".format(parameter), (
+            functools.partial(nomenclator.template.construct_regexp, pattern)
+        )
+        yield "fetch_resolved_tokens[cache=cold,{}]".format(parameter), (
+            functools.partial(_fetch_resolved_tokens_cold, path, pattern)
+        )
+        yield "fetch_resolved_tokens[cache=warm,{}]".format(parameter), (
+            functools.partial(
+                nomenclator.template.fetch_resolved_tokens, path, pattern
+            )
+        )
+        yield "resolve[{}]".format(parameter), (
+            functools.partial(nomenclator.template.resolve, pattern, mapping)
+        )
+
+    yield "fetch_resolved_tokens[production]", functools.partial(
+        nomenclator.template.fetch_resolved_tokens,
+        "/path/my_project/ep002/sh003/scripts", PATH_PATTERN
+    )
+
+    yield "generate_scene_name[production]", functools.partial(
+        nomenclator.template.generate_scene_name,
+        BASE_PATTERN, "nk", token_mapping=TOKEN_MAPPING
+    )
+
+    yield "generate_scene_name[production,username]", functools.partial(
+        nomenclator.template.generate_scene_name,
+        BASE_PATTERN, "nk", append_username=True, token_mapping=TOKEN_MAPPING
+    )
+
+    yield "generate_output_name[production]", functools.partial(
+        nomenclator.template.generate_output_name,
+        BASE_PATTERN, "exr", token_mapping=TOKEN_MAPPING
+    )
+
+    yield "generate_output_name[production,all-options]", functools.partial(
+        nomenclator.template.generate_output_name,
+        "{shot}_{description}/" + BASE_PATTERN, "exr",
+        append_passname_to_subfolder=True, append_passname=True,
+        append_colorspace=True, append_username=True, multi_views=True,
+        token_mapping=TOKEN_MAPPING
+    )
+
+
+def _construct_regexp_cold(pattern):
+    """Convert *pattern* into a regular expression without cache."""
+    # noinspection PyProtectedMember
+    nomenclator.template._REGEXP_CACHE.clear()
+    re.purge()
+    return nomenclator.template.construct_regexp(pattern)
+
+
+def _fetch_resolved_tokens_cold(path, pattern):
+    """Resolve tokens from *path* and *pattern* without cache."""
+    # noinspection PyProtectedMember
+    nomenclator.template._REGEXP_CACHE.clear()
+    re.purge()
+    return nomenclator.template.fetch_resolved_tokens(path, pattern)
+
+
+def main(arguments=None):
+    """Execute template benchmark suite from *arguments*."""
+    parser = harness.construct_parser(
+        "Measure the template engine (nomenclator.template)."
+    )
+    return harness.main(fetch_cases, parser, arguments=arguments)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+import sys
+import types
+
+#: File types available for output nodes.
+FILE_TYPES = (" ", "cin", "dpx", "exr", "jpeg", "mov\t\t\tffmpeg", "png", "tiff")
+
+
+class Knob(object):
+    """In-memory knob mimicking :class:`nuke.Knob`."""
+
+    def __init__(self, value, values=None):
+        """Initiate knob with *value* and optional list of *values*."""
+        self._value = value
+        self._values = values or []
+
+    def value(self):
+        """Return value."""
+        return self._value
+
+    def values(self):
+        """Return available values."""
+        return self._values
+
+    def setValue(self, value):
+        """Set value."""
+        self._value = value
+
+
+class Node(object):
+    """In-memory node mimicking :class:`nuke.Node`."""
+
+    def __init__(self, graph, name, node_class, knobs=None):
+        """Initiate node within *graph*."""
+        self._graph = graph
+        self._name = name
+        self._class = node_class
+        self._knobs = knobs or {}
+
+    def __getitem__(self, name):
+        """Return knob *name*."""
+        return self._knobs[name]
+
+    def Class(self):
+        """Return node class."""
+        return self._class
+
+    def name(self):
+        """Return node name."""
+        return self._name
+
+    def setName(self, name):
+        """Rename node."""
+        self._graph.rename(self._name, name)
+        self._name = name
+
+    def knob(self, name):
+        """Return knob *name* or None if the node does not have this knob."""
+        return self._knobs.get(name)
+
+
+class Graph(object):
+    """In-memory node graph exposed as a fake :mod:`nuke` module.
+
+    Output nodes carry the "file", "file_type", "views", "colorspace" and
+    "disable" knobs read by :mod:`nomenclator.utilities`. "DeepWrite" nodes
+    have no "colorspace" knob, as in :term:`Nuke`.
+
+    """
+
+    def __init__(self, path="", recent_paths=None):
+        """Initiate graph for script *path* and list of *recent_paths*."""
+        self._nodes = {}
+        self._path = path
+        self._recent_paths = recent_paths or []
+        self._preferences = Node(self, "preferences", "Preferences", {
+            "UISequenceDisplayMode": Knob("Hashes (#)")
+        })
+        self.module = self._create_module()
+
+    def _create_module(self):
+        """Return fake :mod:`nuke` module querying the graph."""
+        module = types.ModuleType("nuke")
+        module.allNodes = lambda group=None: list(self._nodes.values())
+        module.root = lambda: None
+        module.toNode = self._fetch_node
+        module.scriptName = lambda: self._path
+        module.recentFile = self._fetch_recent_file
+        return module
+
+    def _fetch_node(self, name):
+        """Return node *name* or None if it does not exist."""
+        if name == "preferences":
+            return self._preferences
+
+        return self._nodes.get(name)
+
+    def _fetch_recent_file(self, index):
+        """Return recent file at *index*, starting at 1."""
+        if index > len(self._recent_paths):
+            raise RuntimeError("No recent file at index {}".format(index))
+
+        return self._recent_paths[index - 1]
+
+    def create_node(self, node_class, name, **knobs):
+        """Create node and return it."""
+        node = Node(self, name, node_class, {
+            key: Knob(value) for key, value in knobs.items()
+        })
+        self._nodes[name] = node
+        return node
+
+    def create_output(self, name, path="", deep=False, views="main"):
+        """Create "Write" or "DeepWrite" output node and return it."""
+        node = self.create_node(
+            "DeepWrite" if deep else "Write", name,
+            file=path, views=views, disable=False
+        )
+        node._knobs["file_type"] = Knob("exr", list(FILE_TYPES))
+
+        if not deep:
+            node._knobs["colorspace"] = Knob("default")
+
+        return node
+
+    def rename(self, name, new_name):
+        """Rename node *name* to *new_name*."""
+        self._nodes[new_name] = self._nodes.pop(name)
+
+    def __call__(self, function, *args, **kwargs):
+        """Return result of *function* called with the graph installed."""
+        previous = sys.modules.get("nuke")
+        sys.modules["nuke"] = self.module
+
+        try:
+            return function(*args, **kwargs)
+
+        finally:
+            if previous is None:
+                del sys.modules["nuke"]
+            else:
+                sys.modules["nuke"] = previous
+
+
+def create(
+    outputs=10, nodes_per_output=3, path="", output_path="",
+    deep_ratio=0.1
+):
+    """Return graph with *outputs* nodes among other nodes.
+
+    :param outputs: Number of output nodes. Default is 10.
+
+    :param nodes_per_output: Number of other nodes created for each output
+        node. Default is 3.
+
+    :param path: Path to the script opened in the graph. Default is an empty
+        string.
+
+    :param output_path: Pattern used to set the path of each output node,
+        which can contain the "{name}" token. Default is an empty string.
+
+    :param deep_ratio: Ratio of "DeepWrite" output nodes. Default is 0.1.
+
+    :return: :class:`Graph` instance.
+
+    """
+    graph = Graph(path=path, recent_paths=[path] if path else [])
+    deep_outputs = int(outputs * deep_ratio)
+
+    for index in range(outputs * nodes_per_output):
+        graph.create_node("Blur", "Blur{}".format(index + 1))
+
+    for index in range(outputs):
+        name = "Write{}".format(index + 1)
+        graph.create_output(
+            name, path=output_path.format(name=name),
+            deep=index < deep_outputs
+        )
+
+    return graph
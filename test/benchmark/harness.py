@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+
+import argparse
+import json
+import math
+import platform
+import re
+import sys
+import timeit
+
+#: Default minimum duration in seconds of each measurement.
+DEFAULT_DURATION = 0.2
+
+#: Default number of measurements for each benchmark case.
+DEFAULT_REPEAT = 5
+
+#: Default ratio of operations per second which can be lost compared to the
+#: baseline before a benchmark case is considered as a regression.
+DEFAULT_THRESHOLD = 0.1
+
+
+def measure(function, duration=DEFAULT_DURATION, repeat=DEFAULT_REPEAT):
+    """Return number of times *function* can be called per second.
+
+    *function* is called in a loop long enough to last at least *duration*
+    seconds, and the best of *repeat* measurements is returned to reduce the
+    noise from other processes.
+
+    :param function: Function to call without arguments.
+
+    :param duration: Minimum duration in seconds of each measurement. Default
+        is :data:`DEFAULT_DURATION`.
+
+    :param repeat: Number of measurements. Default is :data:`DEFAULT_REPEAT`.
+
+    :return: Operations per second.
+
+    """
+    timer = timeit.Timer(function)
+
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= duration:
+            break
+
+        # Estimate number of loops required from the last measurement.
+        number = max(number * 2, int(number * duration / max(elapsed, 1e-9)))
+
+    best = min([elapsed] + timer.repeat(repeat - 1, number))
+    return number / best
+
+
+def run(
+    cases, duration=DEFAULT_DURATION, repeat=DEFAULT_REPEAT, pattern=None,
+    stream=None
+):
+    """Measure benchmark *cases* and return results.
+
+    :param cases: Iterable of tuples containing the name of each benchmark
+        case and the function to measure.
+
+    :param duration: Minimum duration in seconds of each measurement. Default
+        is :data:`DEFAULT_DURATION`.
+
+    :param repeat: Number of measurements. Default is :data:`DEFAULT_REPEAT`.
+
+    :param pattern: Regular expression to filter case names with. Default is
+        None, which means that all cases are measured.
+
+    :param stream: Stream to report each result to as soon as it is measured.
+        Default is None, which means that results are not reported.
+
+    :return: Mapping of operations per second associated with case names.
+
+    """
+    results = {}
+
+    for name, function in cases:
+        if pattern is not None and not re.search(pattern, name):
+            continue
+
+        results[name] = measure(function, duration=duration, repeat=repeat)
+
+        if stream is not None:
+            stream.write("{:<60} {:>14,.1f} ops/sec\n".format(
+                name, results[name]
+            ))
+            stream.flush()
+
+    return results
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Return regressions from *results* compared to *baseline*.
+
+    :param results: Mapping of operations per second associated with case
+        names.
+
+    :param baseline: Mapping of operations per second associated with case
+        names used as a reference. Cases missing from *results* or from
+        *baseline* are ignored.
+
+    :param threshold: Ratio of operations per second which can be lost before
+        a case is considered as a regression. Default is
+        :data:`DEFAULT_THRESHOLD`.
+
+    :return: List of tuples containing the case name, the operations per
+        second from the *baseline* and from the *results*, sorted per name.
+
+    """
+    return [
+        (name, baseline[name], results[name])
+        for name in sorted(results)
+        if name in baseline
+        and results[name] < baseline[name] * (1 - threshold)
+    ]
+
+
+def scaling(results):
+    """Return how results scale with the size parameter of each case.
+
+    Cases are grouped when their names only differ by the value of one integer
+    parameter, such as "fetch[outputs=10]" and "fetch[outputs=100]". The
+    exponent *k* is computed between each pair of successive sizes, so that
+    the duration of one operation grows as O(n^k). An exponent close to 1
+    indicates a linear growth, and an exponent close to 2 a quadratic growth.
+
+    :param results: Mapping of operations per second associated with case
+        names.
+
+    :return: Mapping of lists of tuples containing the smaller size, the larger
+        size and the exponent, associated with the group name where the size
+        parameter is replaced by "*". Groups are ordered by sizes.
+
+    """
+    groups = {}
+
+    for name, value in results.items():
+        match = re.match(r"^(.+?)\[(.*)\]$", name)
+        if match is None:
+            continue
+
+        parameters = match.group(2).split(",")
+        indices = [
+            index for index, parameter in enumerate(parameters)
+            if re.match(r"^[\w-]+=\d+$", parameter)
+        ]
+        if len(indices) != 1:
+            continue
+
+        key, size = parameters[indices[0]].split("=")
+        parameters[indices[0]] = "{}=*".format(key)
+
+        group = "{}[{}]".format(match.group(1), ",".join(parameters))
+        groups.setdefault(group, []).append((int(size), value))
+
+    mapping = {}
+
+    for group, items in groups.items():
+        items = sorted(items)
+        mapping[group] = [
+            (
+                size1, size2,
+                math.log(value1 / value2) / math.log(float(size2) / size1)
+            )
+            for (size1, value1), (size2, value2) in zip(items, items[1:])
+            if size1 > 0
+        ]
+
+    return {group: items for group, items in mapping.items() if len(items)}
+
+
+def save(path, results):
+    """Save *results* as a JSON baseline in *path*."""
+    data = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+    with open(path, "w") as stream:
+        json.dump(data, stream, indent=4, sort_keys=True)
+
+
+def load(path):
+    """Return results from JSON baseline saved in *path*."""
+    with open(path, "r") as stream:
+        return json.load(stream)["results"]
+
+
+def construct_parser(description):
+    """Return argument parser for a benchmark suite."""
+    parser = argparse.ArgumentParser(description=description)
+
+    parser.add_argument(
+        "-k", "--filter", dest="pattern", metavar="PATTERN",
+        help="Only measure cases whose name match this regular expression."
+    )
+    parser.add_argument(
+        "--duration", type=float, default=DEFAULT_DURATION,
+        help="Minimum duration in seconds of each measurement."
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=DEFAULT_REPEAT,
+        help="Number of measurements for each case."
+    )
+    parser.add_argument(
+        "--save", metavar="PATH",
+        help="Save results to a JSON baseline."
+    )
+    parser.add_argument(
+        "--compare", metavar="PATH",
+        help="Compare results with a JSON baseline and fail on regressions."
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help=(
+            "Ratio of operations per second which can be lost compared to the "
+            "baseline before failing (default: %(default)s)."
+        )
+    )
+
+    return parser
+
+
+def main(fetch_cases, parser, arguments=None, stream=None):
+    """Execute benchmark suite from *arguments*.
+
+    :param fetch_cases: Function returning an iterable of tuples containing
+        the name of each benchmark case and the function to measure. The
+        parsed :class:`argparse.Namespace` instance is passed as argument.
+
+    :param parser: Argument parser returned by :func:`construct_parser`,
+        possibly extended with options specific to the suite.
+
+    :param arguments: List of command line arguments. Default is None, which
+        means that :data:`sys.argv` is used.
+
+    :param stream: Stream to report results to. Default is None, which means
+        that :data:`sys.stdout` is used.
+
+    :return: Exit code, which is 1 if a regression is detected.
+
+    """
+    namespace = parser.parse_args(arguments)
+    stream = stream or sys.stdout
+
+    results = run(
+        fetch_cases(namespace), duration=namespace.duration,
+        repeat=namespace.repeat, pattern=namespace.pattern, stream=stream
+    )
+
+    mapping = scaling(results)
+    if len(mapping):
+        stream.write("\nScaling (duration of one operation):\n")
+
+    for group in sorted(mapping):
+        stream.write("{:<60} {}\n".format(group, "  ".join(
+            "{}->{}: O(n^{:.2f})".format(*item) for item in mapping[group]
+        )))
+
+    if namespace.save:
+        save(namespace.save, results)
+
+    if namespace.compare:
+        regressions = compare(
+            results, load(namespace.compare), threshold=namespace.threshold
+        )
+
+        for name, reference, value in regressions:
+            stream.write(
+                "Regression: {} ({:,.1f} -> {:,.1f} ops/sec, {:+.1%})\n".format(
+                    name, reference, value, value / reference - 1
+                )
+            )
+
+        if regressions:
+            return 1
+
+    return 0
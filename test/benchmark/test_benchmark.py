@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+import argparse
+import importlib
+import io
+import json
+import os
+import sys
+
+import pytest
+
+from test.benchmark import graph, harness
+
+try:
+    import pytest_benchmark
+except ImportError:
+    pytest_benchmark = None
+
+
+#: Options limiting the size of context benchmark cases.
+CONTEXT_OPTIONS = argparse.Namespace(max_outputs=100, max_templates=10)
+
+#: Options limiting the size of filesystem benchmark cases.
+FILESYSTEM_OPTIONS = argparse.Namespace(max_files=1000)
+
+
+def _fetch_case_names(module_name, namespace=None):
+    """Return names of benchmark cases from suite *module_name*.
+
+    Modules imported to create the cases are removed afterwards, so that
+    each test imports the package again with mocked host APIs.
+
+    """
+    modules = set(sys.modules.keys())
+
+    try:
+        module = importlib.import_module(module_name)
+        return [name for name, _ in module.fetch_cases(namespace)]
+
+    finally:
+        for name in set(sys.modules.keys()) - modules:
+            del sys.modules[name]
+
+
+def _fetch_case(module_name, name, namespace=None):
+    """Return function of benchmark case *name* from suite *module_name*."""
+    module = importlib.import_module(module_name)
+    return dict(module.fetch_cases(namespace))[name]
+
+
+if pytest_benchmark is None:
+    @pytest.fixture()
+    def benchmark():
+        """Return function calling benchmark case once without measuring it."""
+        return lambda function, *args, **kwargs: function(*args, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "name", _fetch_case_names("test.benchmark.bench_template")
+)
+def test_template(benchmark, name):
+    """Measure template benchmark case."""
+    function = _fetch_case("test.benchmark.bench_template", name)
+    assert benchmark(function) is not None
+
+
+@pytest.mark.parametrize(
+    "name", _fetch_case_names("test.benchmark.bench_context", CONTEXT_OPTIONS)
+)
+def test_context(benchmark, name):
+    """Measure context benchmark case."""
+    function = _fetch_case(
+        "test.benchmark.bench_context", name, CONTEXT_OPTIONS
+    )
+    assert benchmark(function) is not None
+
+
+def test_context_graph():
+    """Fetch and update context from synthetic graph."""
+    import nomenclator.context
+    from test.benchmark import bench_context
+
+    root = bench_context.create_root()
+    config = bench_context.create_config(root, templates=3)
+    path = os.path.join(root, "proj", "sh001", "scripts", "proj_sh001_comp_v001.nk")
+
+    _graph = graph.create(
+        outputs=10, path=path,
+        output_path=root + "/proj/sh001/precomps/{name}.####.exr"
+    )
+
+    context = _graph(nomenclator.context.fetch, config)
+    assert context.recent_locations == (os.path.dirname(path),)
+    assert context.padding == "#"
+    assert len(context.outputs) == 10
+    assert context.outputs[0].colorspace == "none"
+    assert context.outputs[-1].colorspace == "default"
+    assert context.outputs[0].file_types == (
+        "cin", "dpx", "exr", "jpeg", "mov", "png", "tiff"
+    )
+    assert len(context.outputs[0].blacklisted_names) == 39
+
+    context = nomenclator.context.update(context)
+    assert context.version == bench_context.SCRIPT_COUNT + 1
+    assert context.outputs[0].path == os.path.join(
+        root, "proj", "sh001", "precomps",
+        "proj_sh001_precomps_v021_Write1.#.exr"
+    )
+
+
+@pytest.mark.parametrize(
+    "name", _fetch_case_names(
+        "test.benchmark.bench_filesystem", FILESYSTEM_OPTIONS
+    )
+)
+def test_filesystem(benchmark, name):
+    """Measure filesystem benchmark case."""
+    function = _fetch_case(
+        "test.benchmark.bench_filesystem", name, FILESYSTEM_OPTIONS
+    )
+    assert benchmark(function) is not None
+
+
+def test_filesystem_directory(mocker, temporary_directory):
+    """Discover next version from directory with latency."""
+    import nomenclator.utilities
+    from test.benchmark import bench_filesystem
+
+    path = bench_filesystem.create_directory(3000, root=temporary_directory)
+    assert len(os.listdir(path)) == 3000
+
+    mocked_sleep = mocker.patch.object(bench_filesystem.time, "sleep")
+    filesystem = bench_filesystem.Filesystem(latency=0.5)
+
+    version = filesystem(
+        nomenclator.utilities.fetch_next_version, path,
+        bench_filesystem.PATTERN, bench_filesystem.TOKEN_MAPPING
+    )
+
+    # Versions of backups and autosaves are higher than the 750 versions
+    # of the scene.
+    assert version == 2249
+    assert filesystem.calls == 3
+    mocked_sleep.assert_called_once_with(1.5)
+
+
+def test_template_pattern():
+    """Create synthetic pattern matching synthetic path."""
+    import nomenclator.template
+    from test.benchmark import bench_template
+
+    pattern, path, mapping = bench_template.create_pattern(
+        tokens=3, expressions=2, depth=2
+    )
+    assert pattern == (
+        "/folder0/folder1/{token0:t0_\\d+}/{token1:t1_\\d+}/{token2}"
+    )
+    assert path == "/folder0/folder1/t0_001/t1_001/t2_001"
+    assert nomenclator.template.fetch_resolved_tokens(path, pattern) == mapping
+    assert nomenclator.template.resolve(pattern, mapping) == path
+
+
+def test_harness_measure():
+    """Return operations per second of function."""
+    calls = []
+
+    result = harness.measure(lambda: calls.append(1), duration=0.01, repeat=2)
+    assert result > 0
+    assert len(calls) > 1
+
+
+def test_harness_compare():
+    """Return regressions beyond threshold."""
+    results = {"A": 80.0, "B": 95.0, "C": 10.0}
+    baseline = {"A": 100.0, "B": 100.0, "D": 100.0}
+
+    assert harness.compare(results, baseline, threshold=0.1) == [
+        ("A", 100.0, 80.0)
+    ]
+    assert harness.compare(results, baseline, threshold=0.3) == []
+
+
+def test_harness_scaling():
+    """Return exponent of growth for each group of cases."""
+    results = {
+        "fetch[outputs=10]": 1000.0,
+        "fetch[outputs=100]": 100.0,
+        "fetch[outputs=1000]": 1.0,
+        "fetch[cache=cold,outputs=10]": 10.0,
+        "fetch[cache=cold,outputs=100]": 10.0,
+        "fetch[cache=cold,templates=10]": 10.0,
+        "fetch[production]": 10.0,
+    }
+
+    mapping = harness.scaling(results)
+    assert sorted(mapping.keys()) == [
+        "fetch[cache=cold,outputs=*]", "fetch[outputs=*]"
+    ]
+    assert [
+        (size1, size2, round(exponent, 3))
+        for size1, size2, exponent in mapping["fetch[outputs=*]"]
+    ] == [(10, 100, 1.0), (100, 1000, 2.0)]
+    assert [
+        (size1, size2, round(exponent, 3))
+        for size1, size2, exponent in mapping["fetch[cache=cold,outputs=*]"]
+    ] == [(10, 100, 0.0)]
+
+
+def test_harness_main(mocker, temporary_directory):
+    """Save baseline and fail on regression."""
+    path = os.path.join(temporary_directory, "baseline.json")
+    cases = [("A", None), ("B", None)]
+
+    mocker.patch.object(harness, "measure", side_effect=[100.0, 100.0])
+
+    stream = io.StringIO() if str is not bytes else io.BytesIO()
+    parser = harness.construct_parser("Test")
+    assert harness.main(
+        lambda _: cases, parser, arguments=["--save", path], stream=stream
+    ) == 0
+
+    with open(path) as _stream:
+        assert json.load(_stream)["results"] == {"A": 100.0, "B": 100.0}
+
+    mocker.patch.object(harness, "measure", side_effect=[50.0, 95.0])
+
+    assert harness.main(
+        lambda _: cases, parser, arguments=["--compare", path], stream=stream
+    ) == 1
+    assert stream.getvalue().splitlines()[-1] == (
+        "Regression: A (100.0 -> 50.0 ops/sec, -50.0%)"
+    )
+
+    mocker.patch.object(harness, "measure", side_effect=[50.0])
+
+    assert harness.main(
+        lambda _: cases, parser, stream=stream,
+        arguments=["--compare", path, "--threshold", "0.6", "-k", "A"]
+    ) == 0
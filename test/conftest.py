@@ -1,5 +1,10 @@
 # -*- coding: utf-8 -*-
 
+# Modules relying on multiprocessing primitives are imported once, as
+# re-importing them after they are removed from 'sys.modules' at the end of a
+# test can crash the interpreter.
+import multiprocessing.pool
+import multiprocessing.synchronize
 import os
 import shutil
 import sys
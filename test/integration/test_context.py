@@ -53,6 +53,7 @@ def test_update_comp_scenario1():
                 file_types=("exr", "dpx", "mov"),
                 multi_views=False,
                 colorspace="rec709",
+                node_colorspace="rec709",
                 append_username_to_name=False,
                 append_colorspace_to_name=False,
                 append_passname_to_name=False,
@@ -127,6 +128,7 @@ def test_update_comp_scenario2():
                 file_types=("exr", "dpx", "mov"),
                 multi_views=False,
                 colorspace="rec709",
+                node_colorspace="rec709",
                 append_username_to_name=False,
                 append_colorspace_to_name=False,
                 append_passname_to_name=False,
@@ -200,6 +202,7 @@ def test_update_comp_scenario3():
                 file_types=("exr", "dpx", "mov"),
                 multi_views=False,
                 colorspace="rec709",
+                node_colorspace="rec709",
                 append_username_to_name=False,
                 append_colorspace_to_name=False,
                 append_passname_to_name=False,
@@ -286,6 +289,7 @@ def test_update_comp_scenario4():
                 file_types=("exr", "dpx", "mov"),
                 multi_views=False,
                 colorspace="rec709",
+                node_colorspace="rec709",
                 append_username_to_name=False,
                 append_colorspace_to_name=False,
                 append_passname_to_name=False,
@@ -385,6 +389,7 @@ def test_update_comp_scenario5():
                 file_types=("exr", "dpx", "mov"),
                 multi_views=True,
                 colorspace="rec709",
+                node_colorspace="rec709",
                 append_username_to_name=True,
                 append_colorspace_to_name=True,
                 append_passname_to_name=True,
@@ -479,6 +484,7 @@ def test_update_comp_scenario6():
                 file_types=("exr", "dpx", "mov"),
                 multi_views=True,
                 colorspace="rec709",
+                node_colorspace="rec709",
                 append_username_to_name=True,
                 append_colorspace_to_name=True,
                 append_passname_to_name=True,
@@ -558,6 +564,7 @@ def test_update_comp_scenario7():
                 file_types=("exr", "dpx", "mov"),
                 multi_views=False,
                 colorspace="rec709",
+                node_colorspace="rec709",
                 append_username_to_name=False,
                 append_colorspace_to_name=False,
                 append_passname_to_name=False,
@@ -630,6 +637,7 @@ def test_update_comp_scenario8():
                 file_types=("exr", "dpx", "mov"),
                 multi_views=False,
                 colorspace="rec709",
+                node_colorspace="rec709",
                 append_username_to_name=False,
                 append_colorspace_to_name=False,
                 append_passname_to_name=False,
@@ -715,6 +723,7 @@ def test_update_comp_scenario9():
                 file_types=("exr", "dpx", "mov"),
                 multi_views=False,
                 colorspace="rec709",
+                node_colorspace="rec709",
                 append_username_to_name=False,
                 append_colorspace_to_name=False,
                 append_passname_to_name=False,
@@ -802,6 +811,7 @@ def test_update_comp_scenario10():
                 file_types=("exr", "dpx", "mov"),
                 multi_views=False,
                 colorspace="rec709",
+                node_colorspace="rec709",
                 append_username_to_name=False,
                 append_colorspace_to_name=False,
                 append_passname_to_name=False,
@@ -826,3 +836,94 @@ def test_update_comp_scenario10():
     assert _context.outputs[0].destination == "comps"
     assert _context.outputs[0].destinations == ("comps",)
     assert _context.outputs[0].error is None
+
+
+def test_update_with_versions(mock_fetch_next_version, temporary_directory):
+    """Return updated context objects from versions discovered at once."""
+    import nomenclator.config
+    import nomenclator.context
+
+    for name in [
+        "sh001_comp_v001.nk", "sh001_comp_v002.nk", "sh001_bg_v004.nk"
+    ]:
+        with open(os.path.join(temporary_directory, name), "w"):
+            pass
+
+    config = nomenclator.config.load({
+        "descriptions": ["comp", "roto"],
+        "comp-templates": [{
+            "id": "Shot",
+            "pattern-path": temporary_directory,
+            "pattern-base": "sh001_{description}_v{version}",
+        }]
+    })
+
+    context = nomenclator.context.create(config, temporary_directory)
+
+    versions = nomenclator.context.fetch_next_versions(context)
+    assert versions == {"comp": 3, "roto": 1, "bg": 5}
+
+    results = [
+        nomenclator.context.update(
+            context._replace(description=description), versions=versions
+        )
+        for description in ["comp", "roto", "bg", "custom"]
+    ]
+
+    assert [result.version for result in results] == [3, 1, 5, 1]
+    assert results[0].path == os.path.join(
+        temporary_directory, "sh001_comp_v003.nk"
+    )
+
+    # Location is not listed again.
+    mock_fetch_next_version.assert_not_called()
+
+
+def test_update_with_versions_without_description(
+    mocker, mock_fetch_next_version, temporary_directory
+):
+    """Return updated context with custom description from pattern version."""
+    import nomenclator.config
+    import nomenclator.context
+
+    mock_fetch_next_version.return_value = 3
+
+    for name in ["sh001_v001.nk", "sh001_v002.nk"]:
+        with open(os.path.join(temporary_directory, name), "w"):
+            pass
+
+    config = nomenclator.config.load({
+        "descriptions": ["comp"],
+        "comp-templates": [{
+            "id": "Shot",
+            "pattern-path": temporary_directory,
+            "pattern-base": "sh001_v{version}",
+        }]
+    })
+
+    context = nomenclator.context.create(config, temporary_directory)
+
+    versions = nomenclator.context.fetch_next_versions(context)
+    assert versions == {"comp": 3}
+
+    # noinspection PyProtectedMember
+    result = nomenclator.context.update(
+        context._replace(description="custom"), versions=versions
+    )
+    assert result.version == 3
+    assert result.path == os.path.join(temporary_directory, "sh001_v003.nk")
+
+    mock_fetch_next_version.assert_called_once_with(
+        temporary_directory, "sh001_v{version}", mocker.ANY, file_names=None
+    )
+
+
+def test_fetch_next_versions_unmatched(temporary_directory):
+    """Return empty mapping when no template configuration matches."""
+    import nomenclator.config
+    import nomenclator.context
+
+    config = nomenclator.config.load({})
+    context = nomenclator.context.create(config, temporary_directory)
+
+    assert nomenclator.context.fetch_next_versions(context) == {}
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+#: Modules from the standard library imported after the package to measure a
+#: reference import duration in the same process.
+REFERENCE_MODULES = (
+    "argparse", "decimal", "email.parser", "logging", "xml.dom.minidom"
+)
+
+#: Maximum ratio between the import duration of the package and the reference
+#: import duration, so that the check does not depend on the machine speed.
+IMPORT_TIME_RATIO = 2
+
+#: Prefixes of host and Qt modules.
+HOST_MODULES = (
+    "nuke",
+    "hiero",
+    "PySide",
+    "PySide2",
+    "PyQt4",
+    "PyQt5",
+    "nomenclator.vendor.Qt",
+    "nomenclator.dialog",
+    "nomenclator.widget",
+)
+
+#: Prefixes of modules which must not be imported with the package.
+FORBIDDEN_MODULES = HOST_MODULES + ("nomenclator.vendor.toml",)
+
+
+def _import_module(name):
+    """Import module *name* in a new process.
+
+    Modules from :data:`REFERENCE_MODULES` are imported afterwards in the same
+    process to measure a reference duration.
+
+    :return: Tuple with the import duration in seconds, the reference import
+        duration in seconds and the list of new modules imported.
+
+    """
+    import nomenclator
+
+    script = (
+        "import json, sys, time\n"
+        "modules = set(sys.modules)\n"
+        "start = time.time()\n"
+        "import {0}\n"
+        "duration = time.time() - start\n"
+        "new_modules = sorted(set(sys.modules) - modules)\n"
+        "start = time.time()\n"
+        "import {1}\n"
+        "reference = time.time() - start\n"
+        "print(json.dumps([duration, reference, new_modules]))\n"
+    ).format(name, ", ".join(REFERENCE_MODULES))
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([
+        os.path.dirname(os.path.dirname(nomenclator.__file__)),
+        env.get("PYTHONPATH", "")
+    ])
+
+    output = subprocess.check_output([sys.executable, "-c", script], env=env)
+    return json.loads(output.decode("utf-8").strip().splitlines()[-1])
+
+
+def _filter(modules, names):
+    """Return modules from *modules* which start with one of *names*."""
+    return [
+        module for module in modules
+        if any(
+            module == name or module.startswith(name + ".")
+            for name in names
+        )
+    ]
+
+
+def test_import_package():
+    """Import package without loading host or Qt modules."""
+    duration, reference, modules = _import_module("nomenclator")
+
+    assert _filter(modules, FORBIDDEN_MODULES) == []
+    assert duration < reference * IMPORT_TIME_RATIO
+
+
+@pytest.mark.parametrize("name", [
+    "nomenclator.completion",
+    "nomenclator.config",
+    "nomenclator.context",
+    "nomenclator.instrumentation",
+    "nomenclator.prefetch",
+    "nomenclator.profiling",
+    "nomenclator.scanner",
+    "nomenclator.symbol",
+    "nomenclator.telemetry",
+    "nomenclator.template",
+    "nomenclator.utilities",
+])
+def test_import_core_module(name):
+    """Import core module without loading host or Qt modules."""
+    _, _, modules = _import_module(name)
+
+    assert _filter(modules, HOST_MODULES) == []
@@ -152,6 +152,88 @@ def test_fetch_next_version_scenario5(scene_path):
     assert version == 3
 
 
+def test_fetch_next_version_from_file_names(mocker, scene_path):
+    """Fetch next version from list of file names without listing path."""
+    import nomenclator.utilities
+
+    mocked_listdir = mocker.patch.object(os, "listdir")
+
+    pattern = "{project}_{shot}_{description}_v{version}"
+
+    token_mapping = {
+        "project": "project2",
+        "shot": "sh003",
+        "description": "comp",
+    }
+    version = nomenclator.utilities.fetch_next_version(
+        scene_path, pattern, token_mapping,
+        file_names=["project2_sh003_comp_v004.nk", "project2_sh003_roto_v009.nk"]
+    )
+    assert version == 5
+
+    mocked_listdir.assert_not_called()
+
+
+def test_fetch_next_versions(scene_path):
+    """Fetch next version of each description from scene paths."""
+    import nomenclator.utilities
+
+    pattern = "{project}_{shot}_{description}_v{version}"
+
+    token_mapping = {
+        "project": "project2",
+        "shot": "sh003",
+        "description": "ignored",
+    }
+    versions = nomenclator.utilities.fetch_next_versions(
+        scene_path, pattern, token_mapping,
+        descriptions=["comp", "precomp", "roto"]
+    )
+    assert versions == {"comp": 3, "precomp": 1, "roto": 1}
+
+    token_mapping["shot"] = "sh002"
+    versions = nomenclator.utilities.fetch_next_versions(
+        scene_path, pattern, token_mapping
+    )
+    assert versions == {"comp": 2, "precomp": 3}
+
+
+def test_fetch_next_versions_from_file_names(mocker, scene_path):
+    """Fetch next versions from list of file names without listing path."""
+    import nomenclator.utilities
+
+    mocked_listdir = mocker.patch.object(os, "listdir")
+
+    pattern = "{project}_{shot}_{description}_v{version}"
+
+    versions = nomenclator.utilities.fetch_next_versions(
+        scene_path, pattern, {"project": "project2", "shot": "sh003"},
+        file_names=[
+            "project2_sh003_comp_v004.nk",
+            "project2_sh003_bg_cleanup_v009_steve.nk",
+            "project2_sh004_roto_v002.nk",
+        ]
+    )
+    assert versions == {"comp": 5, "bg_cleanup": 10}
+
+    mocked_listdir.assert_not_called()
+
+
+def test_fetch_next_versions_without_description(scene_path):
+    """Fetch same next version for all descriptions.
+
+    The incoming pattern does not contain any description token.
+
+    """
+    import nomenclator.utilities
+
+    versions = nomenclator.utilities.fetch_next_versions(
+        scene_path, "{project}_sh001_v{version}", {"project": "project1"},
+        descriptions=["comp", "roto"]
+    )
+    assert versions == {"comp": 2, "roto": 2}
+
+
 def test_fetch_template_config_scenario1():
     """Return template configuration compatible.
 
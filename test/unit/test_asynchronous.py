@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+
+import copy
+import os
+import threading
+
+import pytest
+
+# Asynchronous API requires Python 3.
+asyncio = pytest.importorskip("asyncio")
+
+#: Configuration used to resolve names.
+CONFIG = {
+    "comp-templates": [{
+        "id": "Shot",
+        "pattern-path": "{root}/{{project}}/{{shot}}/scripts",
+        "pattern-base": "{{project}}_{{shot}}_{{description}}_v{{version}}",
+        "outputs": [{
+            "id": "comps",
+            "pattern-path": "{root}/{{project}}/{{shot}}/comps",
+            "pattern-base": "{{project}}_{{shot}}_comp_v{{version}}",
+        }]
+    }],
+}
+
+
+def _run(coroutine):
+    """Return result of *coroutine* executed in a new event loop."""
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def _resolve(template, root):
+    """Return copy of *template* mapping with patterns under *root*."""
+    template = copy.deepcopy(template)
+
+    for key in ["pattern-path", "pattern-base"]:
+        template[key] = template[key].format(root=root)
+
+    return template
+
+
+@pytest.fixture()
+def config(temporary_directory):
+    """Return configuration object."""
+    import nomenclator.config
+
+    templates = []
+
+    for template in CONFIG["comp-templates"]:
+        template = _resolve(template, temporary_directory)
+        template["outputs"] = [
+            _resolve(output, temporary_directory)
+            for output in template["outputs"]
+        ]
+        templates.append(template)
+
+    return nomenclator.config.load({"comp-templates": templates})
+
+
+@pytest.fixture()
+def script_path(temporary_directory):
+    """Return path to composition script with one output node."""
+    path = os.path.join(temporary_directory, "proj", "sh001", "scripts")
+    os.makedirs(path)
+
+    for name in ["proj_sh001_comp_v001.nk", "proj_sh001_comp_v004.nk"]:
+        with open(os.path.join(path, name), "w") as stream:
+            stream.write("")
+
+    path = os.path.join(path, "proj_sh001_comp_v001.nk")
+    with open(path, "w") as stream:
+        stream.write("Write {\n file /path/to/file.exr\n name Write1\n}\n")
+
+    return path
+
+
+@pytest.fixture()
+def threads(mocker):
+    """Return mapping recording threads listing directories."""
+    import nomenclator.scanner
+
+    mapping = {"listdir": [], "fetch_nodes": []}
+
+    listdir = os.listdir
+    fetch_nodes = nomenclator.scanner.fetch_nodes
+
+    def _listdir(path):
+        mapping["listdir"].append(threading.current_thread())
+        return listdir(path)
+
+    def _fetch_nodes(path):
+        mapping["fetch_nodes"].append(threading.current_thread())
+        return fetch_nodes(path)
+
+    mocker.patch.object(os, "listdir", side_effect=_listdir)
+    mocker.patch.object(
+        nomenclator.scanner, "fetch_nodes", side_effect=_fetch_nodes
+    )
+
+    return mapping
+
+
+def test_fetch_config(mocker):
+    """Fetch configuration in executor."""
+    import nomenclator.asynchronous
+    import nomenclator.config
+
+    thread = []
+
+    mocker.patch.object(
+        nomenclator.config, "fetch",
+        side_effect=lambda **_: thread.append(threading.current_thread())
+    )
+
+    _run(nomenclator.asynchronous.fetch_config(location_path="/path"))
+
+    nomenclator.config.fetch.assert_called_once_with(location_path="/path")
+    assert thread != [threading.current_thread()]
+
+
+def test_fetch_and_update(config, script_path, threads):
+    """Fetch and update context in executor."""
+    import nomenclator.asynchronous
+    import nomenclator.context
+
+    context = _run(
+        nomenclator.asynchronous.fetch(config, path=script_path)
+    )
+    assert context == nomenclator.context.fetch(
+        config, path=script_path,
+        nodes=nomenclator.scanner.fetch_nodes(script_path)
+    )
+    assert [output.old_path for output in context.outputs] == [
+        "/path/to/file.exr"
+    ]
+
+    _context = _run(nomenclator.asynchronous.update(context))
+    assert _context == nomenclator.context.update(context)
+    assert _context.version == 5
+
+    assert threading.current_thread() not in threads["listdir"][:1]
+    assert threading.current_thread() not in threads["fetch_nodes"][:1]
+
+
+def test_fetch_current_session(mocker, config):
+    """Fetch context from current session in event loop thread."""
+    import nomenclator.asynchronous
+    import nomenclator.context
+
+    mocked_fetch = mocker.patch.object(nomenclator.context, "fetch")
+
+    context = _run(nomenclator.asynchronous.fetch(config))
+    assert context == mocked_fetch.return_value
+
+    mocked_fetch.assert_called_once_with(
+        config, is_project=False, path=None, nodes=None,
+        recent_locations=None
+    )
+
+
+def test_fetch_current_project(mocker, config):
+    """Check recent projects from current session in executor."""
+    import nomenclator.asynchronous
+    import nomenclator.context
+    import nomenclator.utilities
+
+    thread = []
+
+    mocked_fetch = mocker.patch.object(nomenclator.context, "fetch")
+    mocked_fetch_files = mocker.patch.object(
+        nomenclator.utilities, "fetch_recent_project_files",
+        side_effect=lambda **_: thread.append(threading.current_thread())
+    )
+    mocked_resolve = mocker.patch.object(
+        nomenclator.utilities, "resolve_recent_project_paths",
+        side_effect=lambda *_, **__: (
+            thread.append(threading.current_thread()) or ("/path",)
+        )
+    )
+
+    context = _run(nomenclator.asynchronous.fetch(config, is_project=True))
+    assert context == mocked_fetch.return_value
+
+    mocked_fetch_files.assert_called_once_with(max_values=config.max_locations)
+    mocked_resolve.assert_called_once_with(
+        None, max_values=config.max_locations
+    )
+    mocked_fetch.assert_called_once_with(
+        config, is_project=True, path=None, nodes=None,
+        recent_locations=("/path",)
+    )
+
+    assert thread[0] == threading.current_thread()
+    assert thread[1] != threading.current_thread()
+
+
+def test_update_unmatched(mocker, threads):
+    """Update context without listing location path if unmatched."""
+    import nomenclator.asynchronous
+    import nomenclator.context
+
+    context = mocker.Mock(
+        location_path="/path", template_configs=tuple(), tokens=tuple(),
+        outputs=tuple()
+    )
+
+    result = _run(nomenclator.asynchronous.update(context))
+    assert result == context._replace.return_value
+    assert threads["listdir"] == []
+
+
+def test_fetch_next_version(script_path, threads):
+    """Fetch next version in executor."""
+    import nomenclator.asynchronous
+
+    version = _run(
+        nomenclator.asynchronous.fetch_next_version(
+            os.path.dirname(script_path),
+            "{project}_{shot}_{description}_v{version}",
+            {"project": "proj", "shot": "sh001", "description": "comp"}
+        )
+    )
+    assert version == 5
+    assert threads["listdir"] != [threading.current_thread()]
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+import pytest
+
+
+@pytest.fixture()
+def tree(temporary_directory):
+    """Return root of a show tree."""
+    for path in [
+        "ep001/sh001/scripts",
+        "ep001/sh002/scripts",
+        "ep001/sh002/renders",
+        "edit/hiero",
+    ]:
+        os.makedirs(os.path.join(temporary_directory, *path.split("/")))
+
+    # Symbolic links to directories must be ignored.
+    os.symlink(
+        os.path.join(temporary_directory, "ep001"),
+        os.path.join(temporary_directory, "edit", "link")
+    )
+
+    return temporary_directory
+
+
+def _template_config(_id, pattern_path):
+    """Return template config."""
+    import nomenclator.config
+
+    return nomenclator.config.TemplateConfig(
+        id=_id,
+        pattern_path=pattern_path,
+        pattern_base="{description}_v{version}",
+        default_expression=r"[\w_.-]+",
+        match_start=True,
+        match_end=True,
+        append_username_to_name=False,
+        outputs=tuple(),
+    )
+
+
+@pytest.mark.parametrize("options, expected", [
+    ({}, [
+        "", "edit", "edit/hiero", "ep001", "ep001/sh001",
+        "ep001/sh001/scripts", "ep001/sh002", "ep001/sh002/renders",
+        "ep001/sh002/scripts",
+    ]),
+    ({"jobs": 4}, [
+        "", "edit", "edit/hiero", "ep001", "ep001/sh001",
+        "ep001/sh001/scripts", "ep001/sh002", "ep001/sh002/renders",
+        "ep001/sh002/scripts",
+    ]),
+    ({"max_depth": 1}, ["", "edit", "ep001"]),
+    ({"max_depth": 0}, [""]),
+], ids=[
+    "default",
+    "parallel",
+    "max-depth",
+    "root-only",
+])
+def test_walk(tree, options, expected):
+    """Yield all directory paths."""
+    import nomenclator.audit
+
+    paths = nomenclator.audit.walk(tree, **options)
+    assert sorted(paths) == sorted(
+        os.path.join(tree, *path.split("/")) if path else tree
+        for path in expected
+    )
+
+
+def test_walk_interrupted(tree):
+    """Stop walking when the generator is closed."""
+    import nomenclator.audit
+
+    paths = nomenclator.audit.walk(tree, jobs=2)
+    assert next(paths) == tree
+    paths.close()
+
+
+def test_classify():
+    """Return classification records."""
+    import nomenclator.audit
+
+    comp_configs = [
+        _template_config("Episodic", "/root/{episode:ep\\d+}/{shot}/scripts"),
+        _template_config("Shot", "/root/{episode}/{shot:sh\\d+}/scripts"),
+        _template_config("Other", "/root/{episode}/{shot}/comps"),
+    ]
+    project_configs = [
+        _template_config("Conform", "/root/edit/hiero"),
+    ]
+
+    assert nomenclator.audit.classify(
+        "/root/ep001/sh001/scripts", comp_configs, project_configs
+    ) == {
+        "path": "/root/ep001/sh001/scripts",
+        "status": "ambiguous",
+        "comp": [
+            {"id": "Episodic", "tokens": {"episode": "ep001", "shot": "sh001"}},
+            {"id": "Shot", "tokens": {"episode": "ep001", "shot": "sh001"}},
+        ],
+        "project": [],
+    }
+
+    assert nomenclator.audit.classify(
+        "/root/ep001/shot/scripts", comp_configs, project_configs
+    ) == {
+        "path": "/root/ep001/shot/scripts",
+        "status": "matched",
+        "comp": [
+            {"id": "Episodic", "tokens": {"episode": "ep001", "shot": "shot"}},
+        ],
+        "project": [],
+    }
+
+    assert nomenclator.audit.classify(
+        "/root/edit/hiero", comp_configs, project_configs
+    ) == {
+        "path": "/root/edit/hiero",
+        "status": "matched",
+        "comp": [],
+        "project": [{"id": "Conform", "tokens": {}}],
+    }
+
+    assert nomenclator.audit.classify(
+        "/root/edit", comp_configs, project_configs
+    ) == {
+        "path": "/root/edit",
+        "status": "unmatched",
+        "comp": [],
+        "project": [],
+    }
+
+
+def test_audit(mocker, tree):
+    """Yield classification records for all directories."""
+    import nomenclator.audit
+
+    config = mocker.Mock(
+        comp_template_configs=[
+            _template_config("Episodic", tree + "/{episode}/{shot}/scripts"),
+        ],
+        project_template_configs=[
+            _template_config("Conform", tree + "/edit/hiero"),
+        ],
+    )
+
+    records = sorted(
+        nomenclator.audit.audit(tree, config, jobs=2),
+        key=lambda record: record["path"]
+    )
+
+    assert [
+        (os.path.relpath(record["path"], tree), record["status"])
+        for record in records
+    ] == [
+        (".", "unmatched"),
+        ("edit", "unmatched"),
+        (os.path.join("edit", "hiero"), "matched"),
+        ("ep001", "unmatched"),
+        (os.path.join("ep001", "sh001"), "unmatched"),
+        (os.path.join("ep001", "sh001", "scripts"), "matched"),
+        (os.path.join("ep001", "sh002"), "unmatched"),
+        (os.path.join("ep001", "sh002", "renders"), "unmatched"),
+        (os.path.join("ep001", "sh002", "scripts"), "matched"),
+    ]
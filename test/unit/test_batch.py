@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+
+
+@pytest.fixture()
+def mocked_config_fetch(mocker):
+    """Return mocked 'nomenclator.config.fetch' function."""
+    import nomenclator.config
+    return mocker.patch.object(nomenclator.config, "fetch")
+
+
+@pytest.fixture()
+def mocked_context_fetch(mocker):
+    """Return mocked 'nomenclator.context.fetch' function."""
+    import nomenclator.context
+    return mocker.patch.object(nomenclator.context, "fetch")
+
+
+@pytest.fixture()
+def mocked_context_update(mocker):
+    """Return mocked 'nomenclator.context.update' function."""
+    import nomenclator.context
+    return mocker.patch.object(nomenclator.context, "update")
+
+
+@pytest.fixture()
+def mocked_update_nodes(mocker):
+    """Return mocked 'nomenclator.utilities.update_nodes' function."""
+    import nomenclator.utilities
+    return mocker.patch.object(nomenclator.utilities, "update_nodes")
+
+
+def _output(mocker, **kwargs):
+    """Return mocked output context."""
+    options = dict(
+        name="Write1", new_name="Write1", enabled=True,
+        old_path="/old/path.exr", path="/new/path.exr", error=None
+    )
+    options.update(kwargs)
+
+    # Name must be set after creation as it is a reserved keyword for mocks.
+    name = options.pop("name")
+    output = mocker.Mock(**options)
+    output.name = name
+    return output
+
+
+def test_process_script(
+    mocker, mocked_config_fetch, mocked_context_fetch, mocked_context_update,
+    mocked_update_nodes
+):
+    """Update render outputs and save script."""
+    import nuke
+    import nomenclator.batch
+
+    context = mocker.Mock(
+        error=None,
+        outputs=(
+            _output(mocker),
+            _output(mocker, name="Write2", new_name="Write2", path="/old/path.exr"),
+        )
+    )
+    mocked_context_update.return_value = context
+
+    result = nomenclator.batch.process_script("/path/script.nk")
+    assert result == {
+        "path": "/path/script.nk",
+        "changes": [{
+            "name": "Write1",
+            "new_name": "Write1",
+            "old_path": "/old/path.exr",
+            "path": "/new/path.exr",
+        }],
+        "error": None,
+    }
+
+    nuke.scriptOpen.assert_called_once_with("/path/script.nk")
+    mocked_config_fetch.assert_called_once_with(location_path="/path")
+    mocked_context_fetch.assert_called_once_with(mocked_config_fetch.return_value)
+    mocked_context_update.assert_called_once_with(
+        mocked_context_fetch.return_value, discover_next_version=False
+    )
+    mocked_update_nodes.assert_called_once_with(context)
+    nuke.scriptSave.assert_called_once()
+
+
+def test_process_script_dry_run(
+    mocker, mocked_config_fetch, mocked_context_fetch, mocked_context_update,
+    mocked_update_nodes
+):
+    """Return changes without updating script."""
+    import nuke
+    import nomenclator.batch
+
+    mocked_context_update.return_value = mocker.Mock(
+        error=None, outputs=(_output(mocker),)
+    )
+
+    result = nomenclator.batch.process_script("/path/script.nk", dry_run=True)
+    assert len(result["changes"]) == 1
+    assert result["error"] is None
+
+    mocked_update_nodes.assert_not_called()
+    nuke.scriptSave.assert_not_called()
+
+
+def test_process_script_error(
+    mocker, mocked_config_fetch, mocked_context_fetch, mocked_context_update,
+    mocked_update_nodes
+):
+    """Return error without updating script."""
+    import nuke
+    import nomenclator.batch
+
+    mocked_context_update.return_value = mocker.Mock(
+        error=None, outputs=(
+            _output(mocker, path="", error={"message": "__ERROR__"}),
+        )
+    )
+
+    result = nomenclator.batch.process_script("/path/script.nk")
+    assert result["error"] == "Write1: __ERROR__"
+
+    mocked_update_nodes.assert_not_called()
+    nuke.scriptSave.assert_not_called()
+
+
+def test_preview_script(
+    mocker, mocked_config_fetch, mocked_context_fetch, mocked_context_update,
+    mocked_update_nodes
+):
+    """Return changes from script read without Nuke."""
+    import nuke
+    import nomenclator.batch
+    import nomenclator.scanner
+
+    mocked_fetch_nodes = mocker.patch.object(nomenclator.scanner, "fetch_nodes")
+
+    mocked_context_update.return_value = mocker.Mock(
+        error=None, outputs=(_output(mocker),)
+    )
+
+    result = nomenclator.batch.preview_script("/path/script.nk")
+    assert len(result["changes"]) == 1
+    assert result["error"] is None
+
+    mocked_fetch_nodes.assert_called_once_with("/path/script.nk")
+    mocked_config_fetch.assert_called_once_with(location_path="/path")
+    mocked_context_fetch.assert_called_once_with(
+        mocked_config_fetch.return_value, path="/path/script.nk",
+        nodes=mocked_fetch_nodes.return_value
+    )
+    mocked_context_update.assert_called_once_with(
+        mocked_context_fetch.return_value, discover_next_version=False
+    )
+    mocked_update_nodes.assert_not_called()
+    nuke.scriptOpen.assert_not_called()
+
+
+def test_preview_script_error(mocker):
+    """Return error when script cannot be read."""
+    import nomenclator.batch
+    import nomenclator.scanner
+
+    mocker.patch.object(
+        nomenclator.scanner, "fetch_nodes", side_effect=IOError("__ERROR__")
+    )
+
+    assert nomenclator.batch.preview_script("/path/script.nk") == {
+        "path": "/path/script.nk", "changes": [], "error": "__ERROR__"
+    }
+
+
+def test_fetch_changes(mocker):
+    """Return changes from enabled outputs."""
+    import nomenclator.batch
+
+    context = mocker.Mock(outputs=(
+        _output(mocker),
+        _output(mocker, name="Write2", new_name="Write3", path="/old/path.exr"),
+        _output(mocker, name="Write4", enabled=False),
+        _output(mocker, name="Write5", new_name="Write5", path="/old/path.exr"),
+    ))
+
+    assert nomenclator.batch.fetch_changes(context) == [
+        {
+            "name": "Write1",
+            "new_name": "Write1",
+            "old_path": "/old/path.exr",
+            "path": "/new/path.exr",
+        },
+        {
+            "name": "Write2",
+            "new_name": "Write3",
+            "old_path": "/old/path.exr",
+            "path": "/old/path.exr",
+        },
+    ]
+
+
+def test_fetch_error(mocker):
+    """Return error message from context."""
+    import nomenclator.batch
+
+    context = mocker.Mock(error=None, outputs=(_output(mocker),))
+    assert nomenclator.batch.fetch_error(context) is None
+
+    context = mocker.Mock(
+        error={"message": "__ERROR__"}, outputs=(_output(mocker),)
+    )
+    assert nomenclator.batch.fetch_error(context) == "__ERROR__"
+
+    context = mocker.Mock(error=None, outputs=(
+        _output(mocker, error={"message": "__ERROR__"}, enabled=False),
+    ))
+    assert nomenclator.batch.fetch_error(context) is None
+
+
+def test_main(mocker, capsys):
+    """Print result from processed script."""
+    import nomenclator.batch
+
+    mocker.patch.object(
+        nomenclator.batch, "process_script", return_value={"path": "/path"}
+    )
+
+    nomenclator.batch.main(["/path/script.nk", "--dry-run"])
+    nomenclator.batch.process_script.assert_called_once_with(
+        "/path/script.nk", dry_run=True
+    )
+
+    output = capsys.readouterr().out.strip()
+    assert output == nomenclator.batch.RESULT_PREFIX + json.dumps({"path": "/path"})
+
+
+def test_main_error(mocker, capsys):
+    """Print error from processed script."""
+    import nomenclator.batch
+
+    mocker.patch.object(
+        nomenclator.batch, "process_script", side_effect=RuntimeError("Oops")
+    )
+
+    nomenclator.batch.main(["/path/script.nk"])
+
+    output = capsys.readouterr().out.strip()
+    assert json.loads(output[len(nomenclator.batch.RESULT_PREFIX):]) == {
+        "path": "/path/script.nk",
+        "changes": [],
+        "error": "Oops",
+    }
+
+
+@pytest.fixture()
+def script_config(mocker, mocked_config_fetch):
+    """Return configuration with composition template for scripts."""
+    import nomenclator.config
+    import nomenclator.scanner
+
+    mocker.patch.object(
+        nomenclator.scanner, "fetch_nodes", return_value=([], [])
+    )
+
+    mocked_config_fetch.return_value = nomenclator.config.load({
+        "descriptions": ["comp", "roto"],
+        "comp-templates": [{
+            "id": "Episodic",
+            "pattern-path": "/path/{shot}",
+            "pattern-base": "{shot}_{description}_v{version}",
+        }]
+    })
+    return mocked_config_fetch.return_value
+
+
+def test_update(script_config):
+    """Update context with description and version from script name."""
+    import nomenclator.batch
+    import nomenclator.context
+
+    context = nomenclator.context.fetch(
+        script_config, path="/path/sh001/sh001_roto_v003.nk", nodes=([], [])
+    )
+    assert context.description == "comp"
+
+    context = nomenclator.batch.update(context)
+    assert context.description == "roto"
+    assert context.version == 3
+    assert context.path == "/path/sh001/sh001_roto_v003.nk"
+    assert context.error is None
+
+
+def test_update_unmatched_name(script_config):
+    """Raise an error when script name does not match template."""
+    import nomenclator.batch
+    import nomenclator.context
+
+    context = nomenclator.context.fetch(
+        script_config, path="/path/sh001/script.nk", nodes=([], [])
+    )
+
+    with pytest.raises(ValueError) as error:
+        nomenclator.batch.update(context)
+
+    assert str(error.value) == (
+        "Script name does not match template configuration [Episodic]: "
+        "script.nk"
+    )
+
+
+def test_preview_script_with_description(script_config):
+    """Return changes from script saved under another description."""
+    import nomenclator.batch
+
+    path = "/path/sh001/sh001_roto_v003.nk"
+    assert nomenclator.batch.preview_script(path) == {
+        "path": path, "changes": [], "error": None
+    }
+
+
+def test_preview_script_unmatched_name(script_config):
+    """Return error when script name does not match template."""
+    import nomenclator.batch
+
+    path = "/path/sh001/script.nk"
+    assert nomenclator.batch.preview_script(path) == {
+        "path": path, "changes": [], "error": (
+            "Script name does not match template configuration [Episodic]: "
+            "script.nk"
+        )
+    }
@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+
+import pytest
+
+
+@pytest.fixture()
+def scripts(temporary_directory):
+    """Return paths to composition scripts."""
+    paths = []
+
+    for name in ["shot1.nk", "shot2.nk", "shot3.nk~", "notes.txt"]:
+        path = os.path.join(temporary_directory, name)
+        with open(path, "w") as stream:
+            stream.write("")
+
+        paths.append(path)
+
+    return paths
+
+
+@pytest.fixture()
+def mocked_popen(mocker):
+    """Return mocked 'subprocess.Popen' class."""
+    import subprocess
+    return mocker.patch.object(subprocess, "Popen")
+
+
+def _result(path, changes=None, error=None):
+    """Return result mapping."""
+    return {"path": path, "changes": changes or [], "error": error}
+
+
+def test_fetch_script_paths(scripts, temporary_directory):
+    """Return composition script paths from patterns."""
+    import nomenclator.command
+
+    paths = nomenclator.command.fetch_script_paths([
+        os.path.join(temporary_directory, "shot2.nk"),
+        os.path.join(temporary_directory, "*"),
+        os.path.join(temporary_directory, "unknown.nk"),
+    ])
+    assert paths == [scripts[1], scripts[0]]
+
+
+def test_process_script(mocker, mocked_popen):
+    """Return result from Nuke process."""
+    import nomenclator.batch
+    import nomenclator.command
+
+    result = _result("/path/script.nk", error="__ERROR__")
+
+    mocked_popen.return_value.communicate.return_value = (
+        "Nuke 13.0v1\n{}{}\n".format(
+            nomenclator.batch.RESULT_PREFIX, json.dumps(result)
+        ).encode("utf-8"),
+        None
+    )
+
+    assert nomenclator.command.process_script(
+        "/path/script.nk", "/bootstrap.py", dry_run=True,
+        nuke_executable="/nuke"
+    ) == result
+
+    mocked_popen.assert_called_once_with(
+        ["/nuke", "-t", "/bootstrap.py", "/path/script.nk", "--dry-run"],
+        stdout=mocker.ANY, stderr=mocker.ANY, env=mocker.ANY
+    )
+
+    env = mocked_popen.call_args[1]["env"]
+    root = os.path.dirname(os.path.dirname(nomenclator.batch.__file__))
+    assert env["PYTHONPATH"].split(os.pathsep)[0] == root
+
+
+def test_process_script_failed(mocked_popen):
+    """Return error when Nuke process does not return any result."""
+    import nomenclator.command
+
+    mocked_popen.return_value.returncode = 1
+    mocked_popen.return_value.communicate.return_value = (
+        b"Nuke 13.0v1\nLicense not found\n", None
+    )
+
+    assert nomenclator.command.process_script(
+        "/path/script.nk", "/bootstrap.py"
+    ) == _result(
+        "/path/script.nk",
+        error="Nuke exited with code 1: License not found"
+    )
+
+
+def test_process_script_not_found(mocked_popen):
+    """Return error when Nuke executable is not found."""
+    import nomenclator.command
+
+    mocked_popen.side_effect = OSError("No such file")
+
+    assert nomenclator.command.process_script(
+        "/path/script.nk", "/bootstrap.py"
+    ) == _result("/path/script.nk", error="No such file")
+
+
+def test_rename(mocker):
+    """Process all composition scripts and write report."""
+    import nomenclator.command
+
+    change = {
+        "name": "Write1",
+        "new_name": "Write2",
+        "old_path": "/old/path.exr",
+        "path": "/new/path.exr",
+    }
+
+    results = [
+        _result("/path/script1.nk", changes=[change]),
+        _result("/path/script2.nk"),
+        _result("/path/script3.nk", error="__ERROR__"),
+    ]
+
+    mocked_process_script = mocker.patch.object(
+        nomenclator.command, "process_script", side_effect=results
+    )
+
+    stream = mocker.Mock()
+
+    assert nomenclator.command.rename(
+        ["/path/script1.nk", "/path/script2.nk", "/path/script3.nk"],
+        dry_run=True, jobs=1, stream=stream
+    ) == results
+
+    assert mocked_process_script.call_count == 3
+
+    bootstrap_path = mocked_process_script.call_args[0][1]
+    assert not os.path.exists(bootstrap_path)
+
+    report = "".join(call[0][0] for call in stream.write.call_args_list)
+    assert report == (
+        "[would update] /path/script1.nk\n"
+        "    Write1 -> Write2\n"
+        "    - /old/path.exr\n"
+        "    + /new/path.exr\n"
+        "[unchanged] /path/script2.nk\n"
+        "[error] /path/script3.nk\n"
+        "    __ERROR__\n"
+        "\n3 script(s) processed: 1 would be updated, 1 unchanged, 1 failed.\n"
+    )
+
+
+def test_rename_headless(mocker):
+    """Preview all composition scripts without launching Nuke."""
+    import multiprocessing.pool
+    import nomenclator.batch
+    import nomenclator.command
+
+    # Process scripts in threads as mocks cannot be shared with processes.
+    mocker.patch.object(
+        multiprocessing, "Pool", multiprocessing.pool.ThreadPool
+    )
+
+    results = [
+        _result("/path/script1.nk"),
+        _result("/path/script2.nk", error="__ERROR__"),
+    ]
+
+    mocked_preview_script = mocker.patch.object(
+        nomenclator.batch, "preview_script", side_effect=results
+    )
+    mocked_process_script = mocker.patch.object(
+        nomenclator.command, "process_script"
+    )
+
+    stream = mocker.Mock()
+
+    assert nomenclator.command.rename(
+        ["/path/script1.nk", "/path/script2.nk"], jobs=2, headless=True,
+        stream=stream
+    ) == results
+
+    assert mocked_preview_script.call_count == 2
+    mocked_process_script.assert_not_called()
+
+    report = "".join(call[0][0] for call in stream.write.call_args_list)
+    assert report == (
+        "[unchanged] /path/script1.nk\n"
+        "[error] /path/script2.nk\n"
+        "    __ERROR__\n"
+        "\n2 script(s) processed: 0 would be updated, 1 unchanged, 1 failed.\n"
+    )
+
+
+@pytest.mark.parametrize("error, expected", [
+    (None, 0),
+    ("__ERROR__", 1),
+], ids=[
+    "success",
+    "failure",
+])
+def test_main_rename(mocker, scripts, temporary_directory, error, expected):
+    """Execute rename command."""
+    import nomenclator.command
+
+    mocked_rename = mocker.patch.object(
+        nomenclator.command, "rename",
+        return_value=[_result(scripts[0], error=error)]
+    )
+
+    assert nomenclator.command.main([
+        "rename", os.path.join(temporary_directory, "*.nk"),
+        "--dry-run", "--jobs", "4", "--nuke", "/nuke"
+    ]) == expected
+
+    mocked_rename.assert_called_once_with(
+        [scripts[0], scripts[1]], dry_run=True, jobs=4,
+        nuke_executable="/nuke", headless=False
+    )
+
+
+def test_main_rename_headless(mocker, scripts, temporary_directory):
+    """Execute rename command without launching Nuke."""
+    import nomenclator.command
+
+    mocked_rename = mocker.patch.object(
+        nomenclator.command, "rename", return_value=[_result(scripts[0])]
+    )
+
+    assert nomenclator.command.main([
+        "rename", os.path.join(temporary_directory, "*.nk"),
+        "--headless", "--jobs", "4"
+    ]) == 0
+
+    mocked_rename.assert_called_once_with(
+        [scripts[0], scripts[1]], dry_run=True, jobs=4,
+        nuke_executable="nuke", headless=True
+    )
+
+
+def test_main_rename_without_scripts(temporary_directory):
+    """Fail to execute rename command without scripts."""
+    import nomenclator.command
+
+    with pytest.raises(SystemExit):
+        nomenclator.command.main([
+            "rename", os.path.join(temporary_directory, "*.nk"),
+        ])
+
+
+@pytest.mark.parametrize("ambiguous, expected", [
+    (0, 0),
+    (2, 1),
+], ids=[
+    "success",
+    "ambiguous",
+])
+def test_main_audit(mocker, temporary_directory, ambiguous, expected):
+    """Execute audit command."""
+    import nomenclator.command
+
+    mocked_audit = mocker.patch.object(
+        nomenclator.command, "audit",
+        return_value={"matched": 1, "unmatched": 3, "ambiguous": ambiguous}
+    )
+
+    assert nomenclator.command.main([
+        "audit", temporary_directory, "--jobs", "8", "--max-depth", "3",
+        "--status", "unmatched", "--status", "ambiguous",
+    ]) == expected
+
+    mocked_audit.assert_called_once_with(
+        temporary_directory, jobs=8, max_depth=3,
+        statuses=["unmatched", "ambiguous"]
+    )
+
+
+def test_main_audit_without_directory(temporary_directory):
+    """Fail to execute audit command without root directory."""
+    import nomenclator.command
+
+    with pytest.raises(SystemExit):
+        nomenclator.command.main([
+            "audit", os.path.join(temporary_directory, "missing"),
+        ])
+
+
+def test_audit(mocker, capsys):
+    """Write classification records as JSON lines."""
+    import nomenclator.audit
+    import nomenclator.command
+    import nomenclator.config
+
+    mocked_config_fetch = mocker.patch.object(nomenclator.config, "fetch")
+
+    records = [
+        {"path": "/root", "status": "unmatched", "comp": [], "project": []},
+        {
+            "path": "/root/sh001", "status": "matched",
+            "comp": [{"id": "Shot", "tokens": {"shot": "sh001"}}],
+            "project": []
+        },
+        {"path": "/root/sh002", "status": "unmatched", "comp": [], "project": []},
+    ]
+
+    mocked_audit = mocker.patch.object(
+        nomenclator.audit, "audit", return_value=iter(records)
+    )
+
+    stream = mocker.Mock()
+
+    assert nomenclator.command.audit(
+        "/root", jobs=4, max_depth=2, statuses=["matched"], stream=stream
+    ) == {"matched": 1, "unmatched": 2, "ambiguous": 0}
+
+    mocked_config_fetch.assert_called_once_with(location_path="/root")
+    mocked_audit.assert_called_once_with(
+        "/root", mocked_config_fetch.return_value, jobs=4, max_depth=2
+    )
+
+    lines = [call[0][0] for call in stream.write.call_args_list]
+    assert [json.loads(line) for line in lines] == [records[1]]
+
+    _, error = capsys.readouterr()
+    assert error == (
+        "3 directories audited: 1 matched, 2 unmatched, 0 ambiguous.\n"
+    )
+
+
+@pytest.mark.parametrize("options, expected", [
+    (["--socket", "/tmp/service.sock"], "/tmp/service.sock"),
+    (["--port", "8000"], 8000),
+], ids=[
+    "socket",
+    "port",
+])
+def test_main_serve(mocker, options, expected):
+    """Execute serve command."""
+    import nomenclator.command
+
+    mocked_serve = mocker.patch.object(nomenclator.command, "serve")
+
+    assert nomenclator.command.main(["serve", "--jobs", "2"] + options) == 0
+    mocked_serve.assert_called_once_with(expected, jobs=2)
+
+
+def test_serve(mocker):
+    """Serve requests until interrupted."""
+    import nomenclator.command
+    import nomenclator.service
+
+    server = mocker.Mock(server_address="/tmp/service.sock")
+    server.serve_forever.side_effect = KeyboardInterrupt
+
+    mocked_create_server = mocker.patch.object(
+        nomenclator.service, "create_server", return_value=server
+    )
+
+    nomenclator.command.serve("/tmp/service.sock", jobs=2)
+
+    mocked_create_server.assert_called_once_with("/tmp/service.sock", jobs=2)
+    server.serve_forever.assert_called_once()
+    server.server_close.assert_called_once()
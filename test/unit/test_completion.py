@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+
+import os
+import threading
+
+import pytest
+
+
+@pytest.fixture()
+def tree(temporary_directory):
+    """Return root of a show tree."""
+    for path in ["shots/sh001", "shots/sh002", "Shared", "scripts"]:
+        os.makedirs(os.path.join(temporary_directory, *path.split("/")))
+
+    # Files must be ignored.
+    with open(os.path.join(temporary_directory, "scene.nk"), "w"):
+        pass
+
+    return temporary_directory
+
+
+def _template_config(pattern_path):
+    """Return template config."""
+    import nomenclator.config
+
+    return nomenclator.config.TemplateConfig(
+        id="Shot",
+        pattern_path=pattern_path,
+        pattern_base="{description}_v{version}",
+        default_expression=r"[\w_.-]+",
+        match_start=True,
+        match_end=True,
+        append_username_to_name=False,
+        outputs=tuple(),
+    )
+
+
+def test_list_directories(tree):
+    """List sub-directory names sorted case insensitively."""
+    import nomenclator.completion
+
+    assert nomenclator.completion.list_directories(tree) == (
+        "scripts", "Shared", "shots"
+    )
+    assert nomenclator.completion.list_directories(
+        os.path.join(tree, "shots")
+    ) == ("sh001", "sh002")
+
+
+def test_list_directories_error(temporary_directory):
+    """Return empty tuple when directory cannot be listed."""
+    import nomenclator.completion
+
+    path = os.path.join(temporary_directory, "missing")
+    assert nomenclator.completion.list_directories(path) == tuple()
+
+
+def test_lister(tree):
+    """List directories in background and cache listings."""
+    import nomenclator.completion
+
+    listings = []
+    lister = nomenclator.completion.DirectoryLister(
+        callback=lambda path, names: listings.append((path, names))
+    )
+
+    assert lister.fetch(tree) is None
+    assert lister.wait(timeout=1) is True
+    assert listings == [(tree, ("scripts", "Shared", "shots"))]
+
+    # Cached listing is returned without listing the directory again.
+    os.makedirs(os.path.join(tree, "new"))
+    assert lister.fetch(tree) == ("scripts", "Shared", "shots")
+    assert lister.wait(timeout=1) is True
+    assert len(listings) == 1
+
+    lister.clear()
+    assert lister.fetch(tree) is None
+    assert lister.wait(timeout=1) is True
+    assert listings[-1] == (tree, ("new", "scripts", "Shared", "shots"))
+
+
+@pytest.fixture()
+def blocked_lister(mocker):
+    """Return events to wait for a listing to start and to release it."""
+    import nomenclator.completion
+
+    started, released = threading.Event(), threading.Event()
+    list_directories = nomenclator.completion.list_directories
+
+    def _list_directories(path):
+        """Block listing until released."""
+        started.set()
+        released.wait(1)
+        return list_directories(path)
+
+    mocker.patch.object(
+        nomenclator.completion, "list_directories", _list_directories
+    )
+
+    return started, released
+
+
+def test_lister_order(tree, blocked_lister):
+    """List directory requested last first."""
+    import nomenclator.completion
+
+    started, released = blocked_lister
+    paths = [os.path.join(tree, name) for name in ("scripts", "shots")]
+
+    listed = []
+    lister = nomenclator.completion.DirectoryLister(
+        callback=lambda path, names: listed.append(path)
+    )
+
+    assert lister.fetch(tree) is None
+    assert started.wait(1) is True
+
+    for path in paths:
+        assert lister.fetch(path) is None
+
+    released.set()
+    assert lister.wait(timeout=1) is True
+    assert listed == [tree] + paths[::-1]
+
+
+def test_lister_cancel(mocker, tree, blocked_lister):
+    """Ignore listings when cancelled."""
+    import nomenclator.completion
+
+    started, released = blocked_lister
+
+    callback = mocker.Mock()
+    lister = nomenclator.completion.DirectoryLister(callback=callback)
+
+    lister.fetch(os.path.join(tree, "shots"))
+    assert started.wait(1) is True
+
+    lister.fetch(tree)
+    lister.cancel()
+
+    released.set()
+    assert lister.wait(timeout=1) is True
+    callback.assert_not_called()
+
+    # Listing in progress is still cached, but not pending listings.
+    assert lister.fetch(os.path.join(tree, "shots")) == ("sh001", "sh002")
+    assert lister.fetch(tree) is None
+
+
+def test_fetch_completions(tree):
+    """Return completions sorted by priority."""
+    import nomenclator.completion
+
+    names = nomenclator.completion.list_directories(tree)
+    recent_locations = [
+        os.path.join(tree, "shots", "sh002"),
+        os.path.join(tree, "other"),
+    ]
+    template_configs = [
+        _template_config(os.path.join(tree, "shots"))
+    ]
+
+    text = os.path.join(tree, "s")
+
+    assert nomenclator.completion.fetch_completions(
+        text, names
+    ) == [
+        os.path.join(tree, "scripts"),
+        os.path.join(tree, "Shared"),
+        os.path.join(tree, "shots"),
+    ]
+
+    assert nomenclator.completion.fetch_completions(
+        text, names, recent_locations=recent_locations,
+        template_configs=template_configs,
+    ) == [
+        os.path.join(tree, "shots", "sh002"),
+        os.path.join(tree, "shots"),
+        os.path.join(tree, "scripts"),
+        os.path.join(tree, "Shared"),
+    ]
+
+    # Comparisons are case insensitive.
+    assert nomenclator.completion.fetch_completions(
+        os.path.join(tree, "SH"), names
+    ) == [
+        os.path.join(tree, "Shared"),
+        os.path.join(tree, "shots"),
+    ]
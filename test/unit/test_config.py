@@ -3,6 +3,7 @@
 import collections
 import getpass
 import os
+import time
 
 import pytest
 
@@ -40,6 +41,13 @@ def mocked_path(mocker, temporary_directory):
     return mocker.patch.object(nomenclator.config, "path")
 
 
+@pytest.fixture()
+def mocked_paths(mocker, temporary_directory):
+    """Return mocked 'nomenclator.config.paths' function."""
+    import nomenclator.config
+    return mocker.patch.object(nomenclator.config, "paths")
+
+
 @pytest.fixture()
 def mocked_load(mocker, temporary_directory):
     """Return mocked 'nomenclator.config.load' function."""
@@ -106,11 +114,60 @@ def test_path_from_env(mocked_expanduser, monkeypatch):
     mocked_expanduser.assert_called_once_with("~")
 
 
-def test_fetch_empty(mocked_path, mocked_load):
+def test_path_from_env_with_several_folders(mocked_expanduser, monkeypatch):
+    """Return path to configuration file with highest priority."""
+    monkeypatch.setenv(
+        "NOMENCLATOR_CONFIG_PATH", os.pathsep.join(["__STUDIO__", "__USER__"])
+    )
+
+    import nomenclator.config
+
+    path = nomenclator.config.path()
+    assert path == os.path.join("__USER__", "nomenclator.toml")
+
+
+def test_paths(mocked_expanduser, monkeypatch):
+    """Return paths to configuration files."""
+    monkeypatch.delenv("NOMENCLATOR_CONFIG_PATH", raising=False)
+
+    import nomenclator.config
+
+    paths = nomenclator.config.paths()
+    assert paths == [os.path.join("__HOME__", ".nuke", "nomenclator.toml")]
+
+
+def test_paths_from_env(mocked_expanduser, monkeypatch):
+    """Return paths to configuration files fetched from environment."""
+    monkeypatch.setenv(
+        "NOMENCLATOR_CONFIG_PATH",
+        os.pathsep.join(["__STUDIO__", "__SHOW__", "", "__USER__"])
+    )
+
+    import nomenclator.config
+
+    paths = nomenclator.config.paths()
+    assert paths == [
+        os.path.join("__STUDIO__", "nomenclator.toml"),
+        os.path.join("__SHOW__", "nomenclator.toml"),
+        os.path.join("__USER__", "nomenclator.toml"),
+    ]
+
+
+def test_paths_from_empty_env(mocked_expanduser, monkeypatch):
+    """Return personal path to configuration file when environment is empty."""
+    monkeypatch.setenv("NOMENCLATOR_CONFIG_PATH", "")
+
+    import nomenclator.config
+
+    paths = nomenclator.config.paths()
+    assert paths == [os.path.join("__HOME__", ".nuke", "nomenclator.toml")]
+
+
+def test_fetch_empty(mocked_paths, mocked_load):
     """Return empty configuration object."""
     import nomenclator.config
 
-    mocked_path.return_value = "/path"
+    mocked_paths.return_value = ["/path"]
 
     config = nomenclator.config.fetch()
     assert config == mocked_load.return_value
@@ -118,28 +175,425 @@ def test_fetch_empty(mocked_path, mocked_load):
     mocked_load.assert_called_once_with({})
 
 
-def test_fetch(mocked_path, mocked_load, temporary_file, mocked_toml_load):
+def test_fetch(mocked_paths, mocked_load, temporary_file, mocked_toml_load):
     """Return configuration object."""
     import nomenclator.config
 
-    mocked_path.return_value = temporary_file
+    mocked_paths.return_value = [temporary_file]
+    mocked_toml_load.return_value = {"descriptions": ["comp"]}
 
     config = nomenclator.config.fetch()
     assert config == mocked_load.return_value
 
-    mocked_load.assert_called_once_with(mocked_toml_load.return_value)
-    mocked_path.assert_called_once()
+    mocked_load.assert_called_once_with({"descriptions": ["comp"]})
+    mocked_paths.assert_called_once()
 
     stream = mocked_toml_load.call_args_list[0][0][0]
     assert stream.mode == "r"
     assert stream.name == temporary_file
 
 
-def test_save(mocker, mocked_path, mocked_dump, temporary_file, mocked_toml_dump):
+def test_fetch_cached(mocked_paths, mocked_load, temporary_file, mocked_toml_load):
+    """Return cached configuration object when files are unchanged."""
+    import nomenclator.config
+
+    mocked_paths.return_value = [temporary_file]
+    mocked_toml_load.return_value = {}
+
+    config1 = nomenclator.config.fetch()
+    config2 = nomenclator.config.fetch()
+    assert config1 == config2
+
+    mocked_toml_load.assert_called_once()
+    mocked_load.assert_called_once()
+
+
+def test_fetch_layers(mocked_paths, temporary_directory):
+    """Return configuration object merged from several files."""
+    import nomenclator.config
+
+    studio_path = os.path.join(temporary_directory, "studio.toml")
+    user_path = os.path.join(temporary_directory, "user.toml")
+    mocked_paths.return_value = [studio_path, user_path]
+
+    with open(studio_path, "w") as stream:
+        stream.write(
+            "max-locations = 10\n"
+            "descriptions = [\"comp\"]\n"
+            "[tokens]\n"
+            "key1 = \"value1\"\n"
+            "key2 = \"value2\"\n"
+        )
+
+    with open(user_path, "w") as stream:
+        stream.write(
+            "descriptions = [\"roto\"]\n"
+            "[tokens]\n"
+            "key2 = \"value3\"\n"
+        )
+
+    config = nomenclator.config.fetch()
+    assert config.max_locations == 10
+    assert config.descriptions == ("roto",)
+    assert config.tokens == (("key1", "value1"), ("key2", "value3"))
+
+
+def test_fetch_layers_modified(mocker, mocked_paths, temporary_directory):
+    """Only read modified configuration file."""
+    import nomenclator.config
+    import nomenclator.vendor.toml
+
+    studio_path = os.path.join(temporary_directory, "studio.toml")
+    user_path = os.path.join(temporary_directory, "user.toml")
+    mocked_paths.return_value = [studio_path, user_path]
+
+    with open(studio_path, "w") as stream:
+        stream.write("max-locations = 10\n")
+
+    with open(user_path, "w") as stream:
+        stream.write("max-padding = 3\n")
+
+    spy = mocker.spy(nomenclator.vendor.toml, "load")
+
+    config = nomenclator.config.fetch()
+    assert config.max_locations == 10
+    assert config.max_padding == 3
+    assert spy.call_count == 2
+
+    with open(user_path, "w") as stream:
+        stream.write("max-padding = 10\n")
+
+    config = nomenclator.config.fetch()
+    assert config.max_locations == 10
+    assert config.max_padding == 10
+    assert spy.call_count == 3
+
+    stream = spy.call_args_list[-1][0][0]
+    assert stream.name == user_path
+
+
+def test_fetch_location(mocked_paths, temporary_directory):
+    """Return configuration object merged with configuration from location."""
+    import nomenclator.config
+
+    user_path = os.path.join(temporary_directory, "user.toml")
+    mocked_paths.return_value = [user_path]
+
+    with open(user_path, "w") as stream:
+        stream.write("max-locations = 10\nmax-padding = 3\n")
+
+    location_path = os.path.join(temporary_directory, "show", "shot", "comp")
+    os.makedirs(location_path)
+
+    with open(os.path.join(temporary_directory, "show", "nomenclator.toml"), "w") as stream:
+        stream.write("max-padding = 8\n")
+
+    config = nomenclator.config.fetch(location_path=location_path)
+    assert config.max_locations == 10
+    assert config.max_padding == 8
+
+    config = nomenclator.config.fetch()
+    assert config.max_locations == 10
+    assert config.max_padding == 3
+
+
+@pytest.fixture()
+def watcher(request):
+    """Stop configuration watcher after test."""
+    import nomenclator.config
+    request.addfinalizer(nomenclator.config.stop_watcher)
+
+
+def test_watcher(mocker, mocked_paths, temporary_directory, watcher):
+    """Return watched configuration without checking files."""
+    import nomenclator.config
+
+    path = os.path.join(temporary_directory, "user.toml")
+    mocked_paths.return_value = [path]
+
+    with open(path, "w") as stream:
+        stream.write("max-padding = 3\n")
+
+    assert nomenclator.config.is_watching() is False
+
+    nomenclator.config.start_watcher(interval=60)
+    assert nomenclator.config.is_watching() is True
+
+    spy = mocker.spy(os, "stat")
+
+    config = nomenclator.config.fetch()
+    assert config.max_padding == 3
+    spy.assert_not_called()
+
+    nomenclator.config.stop_watcher()
+    assert nomenclator.config.is_watching() is False
+
+
+def test_watcher_location(mocker, mocked_paths, temporary_directory, watcher):
+    """Return watched configuration merged with configuration from location."""
+    import nomenclator.config
+
+    path = os.path.join(temporary_directory, "user.toml")
+    mocked_paths.return_value = [path]
+
+    with open(path, "w") as stream:
+        stream.write("max-locations = 10\nmax-padding = 3\n")
+
+    location_path = os.path.join(temporary_directory, "show", "shot")
+    os.makedirs(location_path)
+
+    location_config_path = os.path.join(
+        temporary_directory, "show", "nomenclator.toml"
+    )
+
+    with open(location_config_path, "w") as stream:
+        stream.write("max-padding = 8\n")
+
+    nomenclator.config.start_watcher(interval=60)
+    nomenclator.config.discover(location_path)
+
+    spy = mocker.spy(os, "stat")
+
+    config = nomenclator.config.fetch(location_path=location_path)
+    assert config.max_locations == 10
+    assert config.max_padding == 8
+
+    # Only the configuration file discovered is checked.
+    spy.assert_called_once_with(location_config_path)
+
+
+def test_watcher_refresh(mocked_paths, temporary_directory, watcher):
+    """Re-create watched configuration when files are modified."""
+    import nomenclator.config
+
+    path = os.path.join(temporary_directory, "user.toml")
+    mocked_paths.return_value = [path]
+
+    with open(path, "w") as stream:
+        stream.write("max-padding = 3\n")
+
+    nomenclator.config.start_watcher(interval=0.01)
+    assert nomenclator.config.fetch().max_padding == 3
+
+    with open(path, "w") as stream:
+        stream.write("max-padding = 10\n")
+
+    for _ in range(500):
+        if nomenclator.config.fetch().max_padding == 10:
+            break
+        time.sleep(0.01)
+
+    assert nomenclator.config.fetch().max_padding == 10
+
+
+def test_watcher_refresh_error(mocked_paths, temporary_directory, watcher):
+    """Keep watched configuration when a file cannot be read."""
+    import nomenclator.config
+
+    path = os.path.join(temporary_directory, "user.toml")
+    mocked_paths.return_value = [path]
+
+    with open(path, "w") as stream:
+        stream.write("max-padding = 3\n")
+
+    nomenclator.config.start_watcher(interval=60)
+
+    with open(path, "w") as stream:
+        stream.write("max-padding = \n")
+
+    nomenclator.config._refresh()
+    assert nomenclator.config.fetch().max_padding == 3
+
+
+def test_discover(temporary_directory):
+    """Return nearest configuration file path from location."""
+    import nomenclator.config
+
+    location_path = os.path.join(temporary_directory, "show", "shot", "comp")
+    os.makedirs(location_path)
+
+    assert nomenclator.config.discover(location_path) is None
+    assert nomenclator.config.discover("") is None
+
+    path = os.path.join(temporary_directory, "show", "nomenclator.toml")
+    with open(path, "w") as stream:
+        stream.write("")
+
+    nomenclator.config._DISCOVERY_CACHE.clear()
+    assert nomenclator.config.discover(location_path) == path
+
+    path = os.path.join(temporary_directory, "show", "shot", "nomenclator.toml")
+    with open(path, "w") as stream:
+        stream.write("")
+
+    nomenclator.config._DISCOVERY_CACHE.clear()
+    assert nomenclator.config.discover(location_path) == path
+
+
+def test_discover_cached(mocker, temporary_directory):
+    """Return cached configuration file path from location."""
+    import nomenclator.config
+
+    location_path = os.path.join(temporary_directory, "show", "shot", "comp")
+    os.makedirs(location_path)
+
+    path = os.path.join(temporary_directory, "show", "nomenclator.toml")
+    with open(path, "w") as stream:
+        stream.write("")
+
+    assert nomenclator.config.discover(location_path) == path
+
+    spy = mocker.spy(os, "stat")
+
+    assert nomenclator.config.discover(location_path) == path
+    assert nomenclator.config.discover(os.path.dirname(location_path)) == path
+    spy.assert_not_called()
+
+
+def test_discover_invalidated(mocker, temporary_directory):
+    """Return configuration file path when folder has been modified."""
+    import nomenclator.config
+
+    mocker.patch.object(nomenclator.config, "DISCOVERY_CACHE_TIMEOUT", 0)
+
+    location_path = os.path.join(temporary_directory, "show", "shot", "comp")
+    os.makedirs(location_path)
+
+    spy = mocker.spy(os.path, "isfile")
+
+    assert nomenclator.config.discover(location_path) is None
+    count = spy.call_count
+
+    # Unmodified folders are not checked again.
+    assert nomenclator.config.discover(location_path) is None
+    assert spy.call_count == count
+
+    path = os.path.join(temporary_directory, "show", "nomenclator.toml")
+    with open(path, "w") as stream:
+        stream.write("")
+
+    # Ensure that folder modification time has changed.
+    folder = os.path.dirname(path)
+    status = os.stat(folder)
+    os.utime(folder, (status.st_atime, status.st_mtime + 10))
+
+    assert nomenclator.config.discover(location_path) == path
+
+
+def test_merge_empty():
+    """Return data mapping merged from empty mappings."""
+    import nomenclator.config
+
+    assert nomenclator.config.merge({}, {}) == {}
+
+
+def test_merge_scalars():
+    """Return data mapping with values replaced."""
+    import nomenclator.config
+
+    data = {"max-locations": 10, "descriptions": ["comp", "roto"]}
+    other = {"descriptions": ["precomp"], "max-padding": 3}
+
+    assert nomenclator.config.merge(data, other) == {
+        "max-locations": 10,
+        "descriptions": ["precomp"],
+        "max-padding": 3,
+    }
+
+
+def test_merge_mappings():
+    """Return data mapping with tokens and colorspace aliases merged by key."""
+    import nomenclator.config
+
+    data = {
+        "tokens": {"key1": "value1", "key2": "value2"},
+        "colorspace-aliases": {"linear": "lin"},
+    }
+    other = {
+        "tokens": {"key2": "value3", "key3": "value4"},
+        "colorspace-aliases": {"sRGB": "srgb"},
+    }
+
+    assert nomenclator.config.merge(data, other) == {
+        "tokens": {"key1": "value1", "key2": "value3", "key3": "value4"},
+        "colorspace-aliases": {"linear": "lin", "sRGB": "srgb"},
+    }
+
+    assert data["tokens"] == {"key1": "value1", "key2": "value2"}
+
+
+def test_merge_templates():
+    """Return data mapping with templates merged by identifier."""
+    import nomenclator.config
+
+    data = {
+        "comp-templates": [
+            {"id": "Episodic", "pattern-path": "/path1"},
+            {"id": "Element", "pattern-path": "/path2"},
+        ],
+        "project-templates": [
+            {"id": "Conform", "pattern-path": "/path3"},
+        ]
+    }
+    other = {
+        "comp-templates": [
+            {"id": "Element", "pattern-path": "/path4"},
+            {"id": "Asset", "pattern-path": "/path5"},
+        ],
+    }
+
+    assert nomenclator.config.merge(data, other) == {
+        "comp-templates": [
+            {"id": "Episodic", "pattern-path": "/path1"},
+            {"id": "Element", "pattern-path": "/path4"},
+            {"id": "Asset", "pattern-path": "/path5"},
+        ],
+        "project-templates": [
+            {"id": "Conform", "pattern-path": "/path3"},
+        ]
+    }
+
+
+def test_merge_removed():
+    """Return data mapping with values removed."""
+    import nomenclator.config
+
+    data = {
+        "max-padding": 3,
+        "default-padding": 2,
+        "tokens": {"key1": "value1", "key2": "value2"},
+        "comp-templates": [
+            {"id": "Episodic", "pattern-path": "/path1"},
+            {"id": "Element", "pattern-path": "/path2"},
+        ],
+    }
+    other = {
+        "tokens": {"key1": "value3"},
+        "removed": {
+            "default-padding": True,
+            "tokens": ["key1", "key2"],
+            "comp-templates": ["Episodic"],
+        }
+    }
+
+    assert nomenclator.config.merge(data, other) == {
+        "max-padding": 3,
+        "tokens": {"key1": "value3"},
+        "comp-templates": [
+            {"id": "Element", "pattern-path": "/path2"},
+        ],
+    }
+
+
+def test_save(
+    mocker, mocked_path, mocked_paths, mocked_dump, temporary_file,
+    mocked_toml_dump
+):
     """Save configuration object."""
     import nomenclator.config
 
     mocked_path.return_value = temporary_file
+    mocked_paths.return_value = [temporary_file]
 
     nomenclator.config.save("__CONFIG__")
 
@@ -153,6 +607,172 @@ def test_save(mocker, mocked_path, mocked_dump, temporary_file, mocked_toml_dump
     assert stream.name == temporary_file
 
 
+def test_save_layers(mocked_paths, temporary_directory):
+    """Save configuration object without values from other files."""
+    import nomenclator.config
+    import nomenclator.vendor.toml as toml
+
+    studio_path = os.path.join(temporary_directory, "studio.toml")
+    user_path = os.path.join(temporary_directory, "user.toml")
+    mocked_paths.return_value = [studio_path, user_path]
+
+    with open(studio_path, "w") as stream:
+        stream.write(
+            "max-locations = 10\n"
+            "descriptions = [\"comp\", \"roto\"]\n"
+            "[tokens]\n"
+            "key1 = \"value1\"\n"
+            "[[comp-templates]]\n"
+            "id = \"Episodic\"\n"
+            "pattern-path = \"/path\"\n"
+            "pattern-base = \"{shot}_v{version}\"\n"
+            "outputs = []\n"
+        )
+
+    config = nomenclator.config.fetch()
+
+    # noinspection PyProtectedMember
+    config = config._replace(
+        max_padding=3,
+        tokens=(("key1", "value1"), ("key2", "value2")),
+    )
+    nomenclator.config.save(config)
+
+    with open(user_path, "r") as stream:
+        data = toml.load(stream)
+
+    assert data == {"max-padding": 3, "tokens": {"key2": "value2"}}
+
+    config = nomenclator.config.fetch()
+    assert config.max_locations == 10
+    assert config.max_padding == 3
+    assert config.tokens == (("key1", "value1"), ("key2", "value2"))
+
+
+def test_save_layers_with_sparse_templates(mocked_paths, temporary_directory):
+    """Save configuration object without templates from other files."""
+    import nomenclator.config
+    import nomenclator.vendor.toml as toml
+
+    studio_path = os.path.join(temporary_directory, "studio.toml")
+    user_path = os.path.join(temporary_directory, "user.toml")
+    mocked_paths.return_value = [studio_path, user_path]
+
+    with open(studio_path, "w") as stream:
+        stream.write(
+            "[[comp-templates]]\n"
+            "id = \"Episodic\"\n"
+            "pattern-path = \"/path\"\n"
+            "pattern-base = \"{shot}_v{version}\"\n"
+            "[[project-templates]]\n"
+            "id = \"Conform\"\n"
+            "pattern-path = \"/path\"\n"
+            "pattern-base = \"{show}_v{version}\"\n"
+            "match-start = true\n"
+        )
+
+    config = nomenclator.config.fetch()
+
+    # noinspection PyProtectedMember
+    config = config._replace(max_locations=10)
+    nomenclator.config.save(config)
+
+    with open(user_path, "r") as stream:
+        data = toml.load(stream)
+
+    assert data == {"max-locations": 10}
+
+
+def test_save_layers_with_default_values(mocked_paths, temporary_directory):
+    """Save configuration object with default values overriding other files."""
+    import nomenclator.config
+    import nomenclator.vendor.toml as toml
+
+    studio_path = os.path.join(temporary_directory, "studio.toml")
+    user_path = os.path.join(temporary_directory, "user.toml")
+    mocked_paths.return_value = [studio_path, user_path]
+
+    with open(studio_path, "w") as stream:
+        stream.write(
+            "max-padding = 3\n"
+            "default-padding = 2\n"
+            "[tokens]\n"
+            "x = \"value\"\n"
+        )
+
+    config = nomenclator.config.fetch()
+    assert config.max_padding == 3
+    assert config.tokens == (("x", "value"),)
+
+    # noinspection PyProtectedMember
+    config = config._replace(
+        max_padding=5, default_padding=None, tokens=tuple()
+    )
+    nomenclator.config.save(config)
+
+    with open(user_path, "r") as stream:
+        data = toml.load(stream)
+
+    assert data == {
+        "max-padding": 5,
+        "removed": {"default-padding": True, "tokens": ["x"]}
+    }
+
+    config = nomenclator.config.fetch()
+    assert config.max_padding == 5
+    assert config.default_padding is None
+    assert config.tokens == tuple()
+
+
+def test_save_layers_with_removed_templates(mocked_paths, temporary_directory):
+    """Save configuration object without templates from other files."""
+    import nomenclator.config
+    import nomenclator.vendor.toml as toml
+
+    studio_path = os.path.join(temporary_directory, "studio.toml")
+    user_path = os.path.join(temporary_directory, "user.toml")
+    mocked_paths.return_value = [studio_path, user_path]
+
+    with open(studio_path, "w") as stream:
+        stream.write(
+            "[colorspace-aliases]\n"
+            "linear = \"lin\"\n"
+            "[[comp-templates]]\n"
+            "id = \"Episodic\"\n"
+            "pattern-path = \"/path\"\n"
+            "pattern-base = \"{shot}_v{version}\"\n"
+            "[[comp-templates]]\n"
+            "id = \"Element\"\n"
+            "pattern-path = \"/path\"\n"
+            "pattern-base = \"{element}_v{version}\"\n"
+        )
+
+    config = nomenclator.config.fetch()
+
+    # noinspection PyProtectedMember
+    config = config._replace(
+        colorspace_aliases=tuple(),
+        comp_template_configs=config.comp_template_configs[1:],
+    )
+    nomenclator.config.save(config)
+
+    with open(user_path, "r") as stream:
+        data = toml.load(stream)
+
+    assert data == {
+        "removed": {
+            "colorspace-aliases": ["linear"],
+            "comp-templates": ["Episodic"],
+        }
+    }
+
+    config = nomenclator.config.fetch()
+    assert config.colorspace_aliases == tuple()
+    assert [_config.id for _config in config.comp_template_configs] == [
+        "Element"
+    ]
+
+
 def test_dump_empty():
     """Return data mapping from empty config"""
     import nomenclator.config
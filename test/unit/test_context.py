@@ -191,7 +191,7 @@ def test_fetch_comp(
         "/path/to", config.comp_template_configs, {}
     )
     mocked_fetch_outputs.assert_called_once_with(
-        config, template_config.outputs
+        config, template_config.outputs, nodes=None
     )
     mocked_fetch_paddings.assert_called_once_with(
         max_value=config.max_padding
@@ -204,6 +204,34 @@ def test_fetch_comp(
     mocked_fetch_current_project_path.assert_not_called()
 
 
+def test_fetch_comp_from_path(
+    mocker, mocked_fetch_outputs, mocked_fetch_paddings,
+    mocked_fetch_recent_comp_paths, mocked_fetch_current_comp_path,
+    mocked_fetch_template_config
+):
+    """Return comp context object from path and nodes."""
+    import nomenclator.context
+
+    template_config = mocker.Mock()
+
+    config = mocker.Mock()
+    mocked_fetch_template_config.return_value = template_config
+    context = nomenclator.context.fetch(
+        config, path="/path/to/comp.nk", nodes="__NODES__"
+    )
+
+    assert context.path == "/path/to/comp.nk"
+    assert context.location_path == "/path/to"
+    assert context.recent_locations == tuple()
+    assert context.outputs == mocked_fetch_outputs.return_value
+
+    mocked_fetch_outputs.assert_called_once_with(
+        config, template_config.outputs, nodes="__NODES__"
+    )
+    mocked_fetch_recent_comp_paths.assert_not_called()
+    mocked_fetch_current_comp_path.assert_not_called()
+
+
 @pytest.mark.parametrize("options", [
     {},
     {"is_project": False},
@@ -244,7 +272,7 @@ def test_fetch_comp_empty_path(
     )
 
     mocked_fetch_template_config.assert_not_called()
-    mocked_fetch_outputs.assert_called_once_with(config, [])
+    mocked_fetch_outputs.assert_called_once_with(config, [], nodes=None)
     mocked_fetch_paddings.assert_called_once_with(
         max_value=config.max_padding
     )
@@ -306,6 +334,28 @@ def test_fetch_project(
     mocked_fetch_current_comp_path.assert_not_called()
 
 
+def test_fetch_project_with_recent_locations(
+    mocker, mocked_fetch_outputs, mocked_fetch_paddings,
+    mocked_fetch_recent_comp_paths, mocked_fetch_recent_project_paths,
+    mocked_fetch_current_comp_path, mocked_fetch_current_project_path,
+    mocked_fetch_template_config
+):
+    """Return project context object with recent locations specified."""
+    import nomenclator.context
+
+    config = mocker.Mock()
+    mocked_fetch_current_project_path.return_value = "/path/to/project.hrox"
+
+    context = nomenclator.context.fetch(
+        config, is_project=True, recent_locations=("/path1", "/path2")
+    )
+    assert context.recent_locations == ("/path1", "/path2")
+    assert context.path == "/path/to/project.hrox"
+
+    mocked_fetch_recent_project_paths.assert_not_called()
+    mocked_fetch_current_project_path.assert_called_once()
+
+
 def test_fetch_project_empty_path(
     mocker, mocked_fetch_outputs, mocked_fetch_paddings,
     mocked_fetch_recent_comp_paths, mocked_fetch_recent_project_paths,
@@ -385,6 +435,7 @@ def test_fetch_outputs_without_templates(
             file_types=mocked_fetch_file_types.return_value,
             multi_views=mocked_has_multiple_views.return_value,
             colorspace=mocked_fetch_colorspace.return_value,
+            node_colorspace=mocked_fetch_colorspace.return_value,
             append_username_to_name=False,
             append_colorspace_to_name=False,
             append_passname_to_name=False,
@@ -399,7 +450,7 @@ def test_fetch_outputs_without_templates(
     mocked_is_enabled.assert_called_once_with(nodes[0])
     mocked_fetch_file_type.assert_called_once_with(nodes[0], "exr")
     mocked_fetch_file_types.assert_called_once_with(nodes[0])
-    mocked_fetch_colorspace.assert_called_once_with(nodes[0], {"sRGB": "srgb"})
+    mocked_fetch_colorspace.assert_called_once_with(nodes[0], {})
     mocked_has_multiple_views.assert_called_once_with(nodes[0])
 
 
@@ -443,6 +494,7 @@ def test_fetch_outputs_empty_path(
             file_types=mocked_fetch_file_types.return_value,
             multi_views=mocked_has_multiple_views.return_value,
             colorspace=mocked_fetch_colorspace.return_value,
+            node_colorspace=mocked_fetch_colorspace.return_value,
             append_username_to_name=template_configs[0].append_username_to_name,
             append_colorspace_to_name=template_configs[0].append_colorspace_to_name,
             append_passname_to_name=template_configs[0].append_passname_to_name,
@@ -457,7 +509,7 @@ def test_fetch_outputs_empty_path(
     mocked_is_enabled.assert_called_once_with(nodes[0])
     mocked_fetch_file_type.assert_called_once_with(nodes[0], "exr")
     mocked_fetch_file_types.assert_called_once_with(nodes[0])
-    mocked_fetch_colorspace.assert_called_once_with(nodes[0], {"sRGB": "srgb"})
+    mocked_fetch_colorspace.assert_called_once_with(nodes[0], {})
     mocked_has_multiple_views.assert_called_once_with(nodes[0])
 
 
@@ -502,6 +554,7 @@ def test_fetch_outputs(
             file_types=mocked_fetch_file_types.return_value,
             multi_views=mocked_has_multiple_views.return_value,
             colorspace=mocked_fetch_colorspace.return_value,
+            node_colorspace=mocked_fetch_colorspace.return_value,
             append_username_to_name=template_configs[0].append_username_to_name,
             append_colorspace_to_name=template_configs[0].append_colorspace_to_name,
             append_passname_to_name=template_configs[0].append_passname_to_name,
@@ -518,7 +571,7 @@ def test_fetch_outputs(
     mocked_is_enabled.assert_called_once_with(nodes[0])
     mocked_fetch_file_type.assert_called_once_with(nodes[0], "exr")
     mocked_fetch_file_types.assert_called_once_with(nodes[0])
-    mocked_fetch_colorspace.assert_called_once_with(nodes[0], {"sRGB": "srgb"})
+    mocked_fetch_colorspace.assert_called_once_with(nodes[0], {})
     mocked_has_multiple_views.assert_called_once_with(nodes[0])
 
 
@@ -563,6 +616,7 @@ def test_fetch_outputs_matching_config(
             file_types=mocked_fetch_file_types.return_value,
             multi_views=mocked_has_multiple_views.return_value,
             colorspace=mocked_fetch_colorspace.return_value,
+            node_colorspace=mocked_fetch_colorspace.return_value,
             append_username_to_name=template_configs[2].append_username_to_name,
             append_colorspace_to_name=template_configs[2].append_colorspace_to_name,
             append_passname_to_name=template_configs[2].append_passname_to_name,
@@ -579,10 +633,243 @@ def test_fetch_outputs_matching_config(
     mocked_is_enabled.assert_called_once_with(nodes[0])
     mocked_fetch_file_type.assert_called_once_with(nodes[0], "exr")
     mocked_fetch_file_types.assert_called_once_with(nodes[0])
-    mocked_fetch_colorspace.assert_called_once_with(nodes[0], {"sRGB": "srgb"})
+    mocked_fetch_colorspace.assert_called_once_with(nodes[0], {})
     mocked_has_multiple_views.assert_called_once_with(nodes[0])
 
 
+@pytest.mark.parametrize("options, expected", [
+    (
+        {},
+        {
+            "suffix": "nk", "description": "comp",
+            "tokens": (("key", "value"),), "append_username_to_name": True,
+            "template_configs": "__COMP_CONFIGS__",
+        }
+    ),
+    (
+        {
+            "description": "roto", "tokens": {"key": "other", "key2": "value2"},
+            "is_project": True,
+        },
+        {
+            "suffix": "hrox", "description": "roto",
+            "tokens": (("key", "other"), ("key2", "value2")),
+            "append_username_to_name": True,
+            "template_configs": "__PROJECT_CONFIGS__",
+        }
+    ),
+], ids=[
+    "comp",
+    "project",
+])
+def test_create(
+    mocker, mocked_fetch_paddings, mocked_fetch_template_config, options,
+    expected
+):
+    """Create context from location path."""
+    import nomenclator.context
+
+    mocked_fetch_paddings.return_value = ("#", "##")
+    mocked_fetch_template_config.return_value = mocker.Mock(
+        append_username_to_name=True
+    )
+
+    config = mocker.Mock(
+        max_padding=2,
+        default_padding=None,
+        default_description=None,
+        descriptions=("comp", "precomp"),
+        create_subfolders=True,
+        tokens=(("key", "value"),),
+        username="steve",
+        comp_template_configs="__COMP_CONFIGS__",
+        project_template_configs="__PROJECT_CONFIGS__",
+    )
+
+    context = nomenclator.context.create(config, "/path", **options)
+    assert context == nomenclator.context.Context(
+        location_path="/path",
+        recent_locations=tuple(),
+        path="",
+        version=None,
+        descriptions=("comp", "precomp"),
+        padding="#",
+        paddings=("#", "##"),
+        create_subfolders=True,
+        username="steve",
+        outputs=tuple(),
+        error=None,
+        **expected
+    )
+
+    mocked_fetch_paddings.assert_called_once_with(max_value=2)
+    mocked_fetch_template_config.assert_called_once_with(
+        "/path", expected["template_configs"], {}
+    )
+
+
+@pytest.mark.parametrize("options, expected", [
+    (
+        {},
+        {
+            "passname": "Write1", "destination": "comps", "file_type": "exr",
+            "file_types": ("exr",), "colorspace": "default",
+            "node_colorspace": "default", "multi_views": False, "append_username_to_name": False,
+            "append_colorspace_to_name": True,
+        }
+    ),
+    (
+        {
+            "destination": "precomps", "passname": "beauty",
+            "file_type": "dpx", "colorspace": "linear", "multi_views": True,
+        },
+        {
+            "passname": "beauty", "destination": "precomps",
+            "file_type": "dpx", "file_types": ("dpx",), "colorspace": "linear",
+            "node_colorspace": "linear", "multi_views": True, "append_username_to_name": True,
+            "append_colorspace_to_name": False,
+        }
+    ),
+], ids=[
+    "default",
+    "with-options",
+])
+def test_create_output(mocker, options, expected):
+    """Create output context without output node."""
+    import nomenclator.context
+
+    template_configs = [
+        mocker.Mock(
+            id="precomps",
+            append_username_to_name=True,
+            append_colorspace_to_name=False,
+            append_passname_to_name=False,
+            append_passname_to_subfolder=False,
+        ),
+        mocker.Mock(
+            id="comps",
+            append_username_to_name=False,
+            append_colorspace_to_name=True,
+            append_passname_to_name=False,
+            append_passname_to_subfolder=False,
+        ),
+    ]
+
+    output = nomenclator.context.create_output(
+        template_configs, "Write1", **options
+    )
+    assert output == nomenclator.context.OutputContext(
+        name="Write1",
+        new_name="Write1",
+        blacklisted_names=tuple(),
+        path="",
+        old_path="",
+        enabled=True,
+        destinations=("comps", "precomps"),
+        append_passname_to_name=False,
+        append_passname_to_subfolder=False,
+        error=None,
+        **expected
+    )
+
+
+@pytest.mark.parametrize("suffix, attribute", [
+    ("nk", "comp_template_configs"),
+    ("hrox", "project_template_configs"),
+], ids=[
+    "comp",
+    "project",
+])
+def test_update_from_config(mocker, suffix, attribute):
+    """Return context updated with values from config."""
+    import nomenclator.context
+
+    config = mocker.Mock(
+        descriptions=("comp", "precomp"),
+        default_description=None,
+        create_subfolders=True,
+        colorspace_aliases=(("sRGB", "srgb"),),
+        tokens=(("key", "value"),),
+        max_padding=3,
+        default_padding=None,
+        username="steve",
+    )
+    outputs = (
+        mocker.Mock(node_colorspace="sRGB"),
+        mocker.Mock(node_colorspace="linear"),
+    )
+    context = mocker.Mock(
+        suffix=suffix, description="precomp", padding="##",
+        paddings=("#", "##"), outputs=outputs
+    )
+
+    result = nomenclator.context.update_from_config(context, config)
+    assert result == context._replace.return_value
+
+    context._replace.assert_called_once_with(
+        description="precomp",
+        descriptions=("comp", "precomp"),
+        padding="##",
+        paddings=("#", "##", "###"),
+        create_subfolders=True,
+        tokens=(("key", "value"),),
+        username="steve",
+        template_configs=getattr(config, attribute),
+        outputs=(
+            outputs[0]._replace.return_value,
+            outputs[1]._replace.return_value,
+        ),
+    )
+
+    outputs[0]._replace.assert_called_once_with(colorspace="srgb")
+    outputs[1]._replace.assert_called_once_with(colorspace="linear")
+
+
+@pytest.mark.parametrize("options, expected", [
+    (
+        {"default_description": None, "default_padding": None},
+        {"description": "comp", "padding": "%01d"},
+    ),
+    (
+        {"default_description": "roto", "default_padding": "%03d"},
+        {"description": "roto", "padding": "%03d"},
+    ),
+], ids=[
+    "unavailable",
+    "defaults",
+])
+def test_update_from_config_defaults(mocker, options, expected):
+    """Return context updated with default values from config."""
+    import nomenclator.context
+
+    config = mocker.Mock(
+        descriptions=("comp", "roto"),
+        create_subfolders=False,
+        colorspace_aliases=tuple(),
+        tokens=tuple(),
+        max_padding=3,
+        username="steve",
+        **options
+    )
+    context = mocker.Mock(
+        suffix="nk", description="precomp", padding="%04d",
+        paddings=("%01d", "%02d", "%03d", "%04d"), outputs=tuple()
+    )
+
+    nomenclator.context.update_from_config(context, config)
+
+    context._replace.assert_called_once_with(
+        descriptions=("comp", "roto"),
+        paddings=("%01d", "%02d", "%03d"),
+        create_subfolders=False,
+        tokens=tuple(),
+        username="steve",
+        template_configs=config.comp_template_configs,
+        outputs=tuple(),
+        **expected
+    )
+
+
 def test_update_empty(
     mocker, mocked_fetch_next_version, mocked_fetch_template_config,
     mocked_generate_scene_name, mocked_update_outputs
@@ -660,7 +947,7 @@ def test_update(
     mocked_fetch_next_version.assert_called_once_with(
         context.location_path,
         mocked_fetch_template_config.return_value.pattern_base,
-        token_mapping
+        token_mapping, file_names=None
     )
 
     mocked_generate_scene_name.assert_called_once_with(
@@ -887,3 +1174,46 @@ def test_update_outputs_without_templates(mocker, mocked_generate_output_name, m
             )
         }
     )
+
+
+def test_update_many(
+    mocker, mocked_fetch_next_version, mocked_fetch_template_config,
+    mocked_generate_scene_name, mocked_update_outputs
+):
+    """Return updated contexts listing each location once."""
+    import nomenclator.context
+
+    mocked_listdir = mocker.patch.object(
+        os, "listdir", side_effect=lambda path: ["__FILES__" + path]
+    )
+    mocked_fetch_next_version.side_effect = [1, 2, 3]
+    mocked_generate_scene_name.side_effect = ["name1", "name2", "name3"]
+
+    contexts = [
+        mocker.Mock(tokens=tuple(), location_path=location_path, suffix="nk")
+        for location_path in ["/path1", "/path2", "/path1"]
+    ]
+
+    results = nomenclator.context.update_many(iter(contexts))
+    assert list(results) == [
+        context._replace.return_value for context in contexts
+    ]
+
+    assert mocked_listdir.call_args_list == [
+        mocker.call("/path1"), mocker.call("/path2")
+    ]
+
+    assert [
+        call[1]["file_names"]
+        for call in mocked_fetch_next_version.call_args_list
+    ] == [["__FILES__/path1"], ["__FILES__/path2"], ["__FILES__/path1"]]
+
+    for context, name, version in zip(
+        contexts, ["name1", "name2", "name3"], [1, 2, 3]
+    ):
+        context._replace.assert_called_once_with(
+            path=os.path.join(context.location_path, name),
+            version=version,
+            outputs=mocked_update_outputs.return_value,
+            error=None
+        )
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+
+import pytest
+
+
+class _Signal(object):
+    """Signal calling connected slots synchronously, as Qt does."""
+
+    def __init__(self):
+        """Initiate signal."""
+        self._slots = []
+
+    def connect(self, slot):
+        """Connect *slot*."""
+        self._slots.append(slot)
+
+    def emit(self, *args):
+        """Call connected slots with *args*."""
+        for slot in self._slots:
+            slot(*args)
+
+
+@pytest.fixture()
+def debug_path(mocker, temporary_directory):
+    """Enable instrumentation and return path to counts."""
+    path = os.path.join(temporary_directory, "signals.json")
+    mocker.patch.dict(os.environ, {"NOMENCLATOR_DEBUG_SIGNALS": path})
+    return path
+
+
+def test_disabled(mocker):
+    """Do not watch signals when instrumentation is disabled."""
+    mocker.patch.dict(os.environ, {"NOMENCLATOR_DEBUG_SIGNALS": ""})
+
+    import nomenclator.instrumentation
+    assert nomenclator.instrumentation.is_enabled() is False
+
+    def _function():
+        """Test function."""
+
+    decorator = nomenclator.instrumentation.counted("name")
+    assert decorator(_function) is _function
+
+    signal = _Signal()
+    nomenclator.instrumentation.watch(signal, "signal")
+    assert signal._slots == []
+
+    with nomenclator.instrumentation.action() as counts:
+        signal.emit()
+
+    assert counts == {"emits": {}, "recomputations": {}}
+
+
+def test_action(debug_path):
+    """Count signals emitted and recomputations within action."""
+    import nomenclator.instrumentation
+    assert nomenclator.instrumentation.is_enabled() is True
+
+    # Emulate a global toggle fanning out into one emit per output.
+    recompute = nomenclator.instrumentation.counted("recompute")(
+        lambda: None
+    )
+
+    child, parent = _Signal(), _Signal()
+    child.connect(parent.emit)
+    parent.connect(recompute)
+
+    nomenclator.instrumentation.watch(child, "child.updated")
+    nomenclator.instrumentation.watch(parent, "parent.updated")
+
+    with nomenclator.instrumentation.action() as counts:
+        for _ in range(3):
+            child.emit()
+
+    assert counts == {
+        "emits": {"child.updated": 3, "parent.updated": 3},
+        "recomputations": {"recompute": 3},
+    }
+
+    with open(debug_path) as stream:
+        data = json.loads(stream.readline())
+
+    assert data["emits"] == counts["emits"]
+    assert data["recomputations"] == counts["recomputations"]
+    assert "date" in data
+
+
+def test_action_scheduled(mocker, debug_path):
+    """Report counts of action once pending events are processed."""
+    import nomenclator.instrumentation
+
+    schedule = mocker.patch.object(nomenclator.instrumentation, "_schedule")
+
+    signal = _Signal()
+    nomenclator.instrumentation.watch(signal, "signal")
+
+    signal.emit("value")
+    signal.emit("value")
+
+    # Only the first emission of an action schedules the report.
+    schedule.assert_called_once_with(nomenclator.instrumentation.report)
+    assert nomenclator.instrumentation.fetch_counts() == {
+        "emits": {"signal": 2}, "recomputations": {}
+    }
+
+    assert nomenclator.instrumentation.report() == {
+        "emits": {"signal": 2}, "recomputations": {}
+    }
+    assert nomenclator.instrumentation.report() is None
+    assert nomenclator.instrumentation.fetch_counts() == {
+        "emits": {}, "recomputations": {}
+    }
+
+
+def test_schedule_without_application(mocker):
+    """Call function immediately when no Qt application is running."""
+    import nomenclator.instrumentation
+    from nomenclator.vendor.Qt import QtCore
+
+    QtCore.QCoreApplication.instance.return_value = None
+
+    function = mocker.Mock()
+    nomenclator.instrumentation._schedule(function)
+
+    function.assert_called_once_with()
+    QtCore.QTimer.singleShot.assert_not_called()
+
+
+def test_schedule_from_thread(mocker):
+    """Call function immediately outside of the main thread of Qt."""
+    import nomenclator.instrumentation
+    from nomenclator.vendor.Qt import QtCore
+
+    QtCore.QCoreApplication.instance.return_value = mocker.Mock()
+
+    function = mocker.Mock()
+    nomenclator.instrumentation._schedule(function)
+
+    function.assert_called_once_with()
+    QtCore.QTimer.singleShot.assert_not_called()
+
+
+def test_schedule(mocker):
+    """Call function once pending events are processed in the main thread."""
+    import nomenclator.instrumentation
+    from nomenclator.vendor.Qt import QtCore
+
+    application = mocker.Mock()
+    QtCore.QCoreApplication.instance.return_value = application
+    QtCore.QThread.currentThread.return_value = application.thread.return_value
+
+    function = mocker.Mock()
+    nomenclator.instrumentation._schedule(function)
+
+    function.assert_not_called()
+    QtCore.QTimer.singleShot.assert_called_once_with(0, function)
+
+
+def test_action_reported(mocker, debug_path):
+    """Count signals emitted after action was reported within block."""
+    import nomenclator.instrumentation
+
+    mocker.patch.object(nomenclator.instrumentation, "_schedule")
+
+    signal = _Signal()
+    nomenclator.instrumentation.watch(signal, "signal")
+
+    with nomenclator.instrumentation.action() as counts:
+        signal.emit()
+
+        # Emulate pending report processed within block.
+        nomenclator.instrumentation.report()
+
+    assert counts == {"emits": {}, "recomputations": {}}
+
+    with nomenclator.instrumentation.action() as counts:
+        nomenclator.instrumentation.report()
+        signal.emit()
+
+    assert counts == {"emits": {"signal": 1}, "recomputations": {}}
+
+
+def test_report_stderr(mocker, capsys):
+    """Write counts of action to standard error."""
+    mocker.patch.dict(os.environ, {"NOMENCLATOR_DEBUG_SIGNALS": "-"})
+
+    import nomenclator.instrumentation
+
+    signal = _Signal()
+    nomenclator.instrumentation.watch(signal, "form.updated")
+    recompute = nomenclator.instrumentation.counted("context.update")(
+        lambda: None
+    )
+
+    with nomenclator.instrumentation.action():
+        signal.emit()
+        signal.emit()
+        recompute()
+
+    lines = capsys.readouterr().err.splitlines()
+    assert lines[0] == "Nomenclator action: 2 emits, 1 recomputations"
+    assert lines[1].split() == ["form.updated", "2", "emits"]
+    assert lines[2].split() == ["context.update", "1", "recomputations"]
+
+
+def test_report_error(mocker, capsys):
+    """Report error when counts cannot be written."""
+    mocker.patch.dict(
+        os.environ, {"NOMENCLATOR_DEBUG_SIGNALS": "/does/not/exist.json"}
+    )
+
+    import nomenclator.instrumentation
+
+    with nomenclator.instrumentation.action():
+        pass
+
+    assert capsys.readouterr().err.startswith(
+        "Impossible to write signal counts:"
+    )
+
+
+def test_context_update(debug_path):
+    """Count recomputations of context."""
+    import nomenclator.config
+    import nomenclator.context
+    import nomenclator.instrumentation
+
+    config = nomenclator.config.load({})
+    context = nomenclator.context.fetch(
+        config, path="/path/comp.nk", nodes=([], [])
+    )
+
+    with nomenclator.instrumentation.action() as counts:
+        nomenclator.context.update(context)
+
+    assert counts["recomputations"] == {"context.update": 1}
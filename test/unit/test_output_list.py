@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+
+class _Index(object):
+    """Model index identified by its row."""
+
+    def __init__(self, row, valid=True):
+        """Initiate index."""
+        self._row = row
+        self._valid = valid
+
+    def __eq__(self, other):
+        """Indicate whether *other* is an index to the same row."""
+        return isinstance(other, _Index) and other.row() == self._row
+
+    def __ne__(self, other):
+        """Indicate whether *other* is an index to a different row."""
+        return not self == other
+
+    def row(self):
+        """Return row of index."""
+        return self._row
+
+    def isValid(self):
+        """Indicate whether index is valid."""
+        return self._valid
+
+
+class _ListModel(object):
+    """List model which does not require a display."""
+
+    def __init__(self, parent=None):
+        """Initiate model."""
+        self.dataChanged = None
+        self.modelReset = None
+
+    def index(self, row):
+        """Return index of *row*."""
+        return _Index(row)
+
+    def beginResetModel(self):
+        """Start resetting model."""
+
+    def endResetModel(self):
+        """Notify that the model was reset."""
+        self.modelReset.emit()
+
+
+@pytest.fixture()
+def model(mocker):
+    """Return output model using list model without display."""
+    from nomenclator.vendor.Qt import QtCore
+    QtCore.QAbstractListModel = _ListModel
+
+    import nomenclator.widget.output_list
+    model = nomenclator.widget.output_list.OutputModel()
+    model.dataChanged = mocker.Mock()
+    model.modelReset = mocker.Mock()
+    return model
+
+
+@pytest.fixture()
+def outputs():
+    """Return output contexts."""
+    import nomenclator.context
+
+    return tuple(
+        nomenclator.context.create_output([], name)
+        for name in ("Write1", "Write2", "Write3")
+    )
+
+
+def test_model_set_outputs(model, outputs):
+    """Reset model with output contexts."""
+    from nomenclator.vendor.Qt import QtCore
+
+    model.set_outputs(outputs)
+    model.modelReset.emit.assert_called_once_with()
+
+    assert model.rowCount() == 3
+    assert model.outputs() == outputs
+    assert model.data(_Index(1), model.CONTEXT_ROLE) == outputs[1]
+    assert model.data(_Index(1), QtCore.Qt.DisplayRole) == "Write2"
+    assert model.data(_Index(3), model.CONTEXT_ROLE) is None
+    assert model.data(_Index(0, valid=False), model.CONTEXT_ROLE) is None
+
+
+def test_model_update_outputs(model, outputs):
+    """Replace changed output contexts in place."""
+    model.set_outputs(outputs)
+    model.modelReset.emit.reset_mock()
+
+    # noinspection PyProtectedMember
+    _outputs = (
+        outputs[0],
+        outputs[1]._replace(new_name="Write4"),
+        outputs[2]._replace(passname="beauty"),
+    )
+
+    assert model.update_outputs(_outputs) == 2
+    assert model.outputs() == _outputs
+    assert model.rowCount() == 3
+
+    # Rows are reused rather than reset.
+    model.modelReset.emit.assert_not_called()
+    assert model.dataChanged.emit.call_count == 2
+    model.dataChanged.emit.assert_any_call(_Index(1), _Index(1))
+    model.dataChanged.emit.assert_any_call(_Index(2), _Index(2))
+
+    # Identical contexts do not change any row.
+    model.dataChanged.emit.reset_mock()
+    assert model.update_outputs(_outputs) == 0
+    model.dataChanged.emit.assert_not_called()
+
+
+def test_model_set_data(model, outputs):
+    """Set output context at index when output is enabled or disabled."""
+    model.set_outputs(outputs)
+
+    # noinspection PyProtectedMember
+    context = outputs[1]._replace(enabled=False)
+
+    assert model.setData(_Index(1), context, model.CONTEXT_ROLE) is True
+    assert model.outputs() == (outputs[0], context, outputs[2])
+    model.dataChanged.emit.assert_called_once_with(_Index(1), _Index(1))
+
+    # Setting the same context does not change the row.
+    model.dataChanged.emit.reset_mock()
+    assert model.setData(_Index(1), context, model.CONTEXT_ROLE) is False
+    model.dataChanged.emit.assert_not_called()
+
+    # noinspection PyProtectedMember
+    context = context._replace(enabled=True)
+
+    assert model.setData(_Index(1), context, model.CONTEXT_ROLE) is True
+    assert model.outputs() == outputs
+
+
+def test_model_set_data_invalid(model, outputs):
+    """Do not set output context with other roles or invalid index."""
+    from nomenclator.vendor.Qt import QtCore
+
+    model.set_outputs(outputs)
+
+    # noinspection PyProtectedMember
+    context = outputs[1]._replace(enabled=False)
+
+    assert model.setData(_Index(1), context, QtCore.Qt.EditRole) is False
+    assert model.setData(
+        _Index(1, valid=False), context, model.CONTEXT_ROLE
+    ) is False
+
+    assert model.outputs() == outputs
+    model.dataChanged.emit.assert_not_called()
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+import pytest
+
+
+@pytest.fixture()
+def config(mocker, temporary_directory):
+    """Return configuration with one composition template."""
+    import nomenclator.config
+
+    config = nomenclator.config.load({
+        "comp-templates": [{
+            "id": "Shot",
+            "pattern-path": os.path.join(temporary_directory, "{shot}"),
+            "pattern-base": "{shot}_{description}_v{version}",
+        }]
+    })
+
+    mocker.patch.object(nomenclator.config, "fetch", return_value=config)
+    return config
+
+
+@pytest.fixture()
+def context(config, temporary_directory):
+    """Return context with recent locations."""
+    import nomenclator.context
+
+    paths = []
+
+    for name, file_names in [
+        ("sh001", ["sh001_comp_v001.nk", "sh001_comp_v002.nk"]),
+        ("sh002", []),
+    ]:
+        path = os.path.join(temporary_directory, name)
+        os.makedirs(path)
+        paths.append(path)
+
+        for file_name in file_names:
+            with open(os.path.join(path, file_name), "w"):
+                pass
+
+    context = nomenclator.context.create(config, temporary_directory)
+
+    # noinspection PyProtectedMember
+    return context._replace(recent_locations=tuple(
+        paths + [os.path.join(temporary_directory, "missing")]
+    ))
+
+
+def test_prefetch(context, temporary_directory):
+    """Prefetch location and resolve next version."""
+    import nomenclator.context
+    import nomenclator.prefetch
+
+    path = os.path.join(temporary_directory, "sh001")
+    location = nomenclator.prefetch.prefetch(context, path)
+
+    assert location.path == path
+    assert sorted(location.file_names) == [
+        "sh001_comp_v001.nk", "sh001_comp_v002.nk"
+    ]
+    assert location.context.version == 3
+    assert location.context.path == os.path.join(path, "sh001_comp_v003.nk")
+
+    # noinspection PyProtectedMember
+    assert location.context == nomenclator.context.update(
+        context._replace(location_path=path)
+    )
+
+
+def test_prefetch_unmatched(context, temporary_directory):
+    """Do not list location which does not match any template."""
+    import nomenclator.prefetch
+
+    location = nomenclator.prefetch.prefetch(context, temporary_directory)
+
+    assert location.file_names is None
+    assert location.context.version is None
+    assert location.context.path == ""
+
+
+def test_update(mocker, context, temporary_directory):
+    """Update context from prefetched location without listing it."""
+    import nomenclator.prefetch
+
+    path = os.path.join(temporary_directory, "sh001")
+    location = nomenclator.prefetch.prefetch(context, path)
+
+    listdir = mocker.patch.object(os, "listdir")
+
+    # noinspection PyProtectedMember
+    _context = nomenclator.prefetch.update(
+        context._replace(description="precomp"), location
+    )
+
+    listdir.assert_not_called()
+    assert _context.version == 1
+    assert _context.path == os.path.join(path, "sh001_precomp_v001.nk")
+
+
+def test_prefetcher(context, temporary_directory):
+    """Prefetch recent locations in the background."""
+    import nomenclator.prefetch
+
+    prefetcher = nomenclator.prefetch.Prefetcher(context)
+    assert prefetcher.fetch(context.recent_locations[0]) is None
+
+    prefetcher.start()
+    assert prefetcher.wait(timeout=1) is True
+
+    assert prefetcher.fetch(context.recent_locations[0]).context.version == 3
+    assert prefetcher.fetch(context.recent_locations[1]).context.version == 1
+
+    # Locations which cannot be listed are skipped.
+    assert prefetcher.fetch(context.recent_locations[2]) is None
+
+
+def test_prefetcher_telemetry(mocker, context, temporary_directory):
+    """Record scans of recent locations separately."""
+    import json
+    import nomenclator.prefetch
+    import nomenclator.telemetry
+
+    path = os.path.join(temporary_directory, "telemetry.jsonl")
+    mocker.patch.object(nomenclator.telemetry, "TELEMETRY_PATH", path)
+
+    with nomenclator.telemetry.session("comp_manager"):
+        prefetcher = nomenclator.prefetch.Prefetcher(context)
+        prefetcher.start()
+        assert prefetcher.wait(timeout=1) is True
+
+    nomenclator.telemetry.flush(timeout=1)
+
+    with open(path) as stream:
+        record = json.loads(stream.readline())
+
+    assert record["prefetch_scans"] == 2
+    assert record["prefetch_entries_scanned"] == 2
+    assert "scans" not in record
+    assert "entries_scanned" not in record
+
+
+def test_prefetcher_cancel(context):
+    """Stop prefetching when cancelled."""
+    import nomenclator.prefetch
+
+    prefetcher = nomenclator.prefetch.Prefetcher(context)
+    prefetcher.cancel()
+    prefetcher.start()
+
+    assert prefetcher.wait(timeout=1) is True
+    assert all(
+        prefetcher.fetch(path) is None for path in context.recent_locations
+    )
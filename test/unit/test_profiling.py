@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import pstats
+
+import pytest
+
+
+@pytest.fixture()
+def profile_path(mocker, temporary_directory):
+    """Enable profiling and return path to results."""
+    path = os.path.join(temporary_directory, "profile.json")
+    mocker.patch.dict(
+        os.environ, {"NOMENCLATOR_PROFILE": path, "NOMENCLATOR_TRACE": ""}
+    )
+    return path
+
+
+def test_disabled(mocker):
+    """Return functions unchanged when profiling is disabled."""
+    mocker.patch.dict(
+        os.environ, {"NOMENCLATOR_PROFILE": "", "NOMENCLATOR_TRACE": ""}
+    )
+
+    import nomenclator.profiling
+    assert nomenclator.profiling.is_enabled() is False
+
+    def _function():
+        """Test function."""
+
+    assert nomenclator.profiling.timed("name")(_function) is _function
+
+    with nomenclator.profiling.session("test"):
+        pass
+
+    assert nomenclator.profiling.fetch_timers() == {}
+
+
+def test_timed(profile_path):
+    """Record calls of decorated function."""
+    import nomenclator.profiling
+    assert nomenclator.profiling.is_enabled() is True
+
+    @nomenclator.profiling.timed("function")
+    def _function(value):
+        """Test function."""
+        if value is None:
+            raise ValueError("Invalid value")
+
+        return value
+
+    assert _function(42) == 42
+
+    with pytest.raises(ValueError):
+        _function(None)
+
+    timers = nomenclator.profiling.fetch_timers()
+    assert list(timers.keys()) == ["function"]
+    assert timers["function"]["calls"] == 2
+    assert timers["function"]["total"] >= timers["function"]["max"] > 0
+
+    nomenclator.profiling.reset()
+    assert nomenclator.profiling.fetch_timers() == {}
+
+
+def test_hot_paths(profile_path, mocker):
+    """Record calls of functions in hot paths."""
+    import nomenclator.config
+    import nomenclator.context
+    import nomenclator.profiling
+    import nomenclator.utilities
+
+    config = nomenclator.config.load({})
+
+    with nomenclator.profiling.session("test"):
+        context = nomenclator.context.fetch(
+            config, path="/path/comp.nk", nodes=([], [])
+        )
+        nomenclator.context.update(context)
+
+    with open(profile_path) as stream:
+        data = json.loads(stream.readline())
+
+    assert data["session"] == "test"
+    assert data["duration"] > 0
+    assert sorted(data["timers"].keys()) == [
+        "context.fetch", "context.fetch_outputs", "context.update",
+        "context.update_outputs", "utilities.fetch_template_config",
+    ]
+    assert data["timers"]["context.fetch"]["calls"] == 1
+
+
+def test_session(profile_path):
+    """Append results of each session to file."""
+    import nomenclator.profiling
+
+    record = nomenclator.profiling.record
+
+    with nomenclator.profiling.session("first"):
+        record("function", 0.5)
+        record("function", 1.5)
+
+    with nomenclator.profiling.session("second"):
+        record("other", 0.1)
+
+    with open(profile_path) as stream:
+        lines = [json.loads(line) for line in stream]
+
+    assert [line["session"] for line in lines] == ["first", "second"]
+    assert lines[0]["timers"] == {
+        "function": {"calls": 2, "total": 2.0, "max": 1.5}
+    }
+    assert lines[1]["timers"] == {
+        "other": {"calls": 1, "total": 0.1, "max": 0.1}
+    }
+
+
+def test_session_stderr(mocker, capsys):
+    """Write results of session to standard error."""
+    mocker.patch.dict(os.environ, {"NOMENCLATOR_PROFILE": "-"})
+
+    import nomenclator.profiling
+
+    with nomenclator.profiling.session("test"):
+        nomenclator.profiling.record("function", 0.002)
+
+    lines = capsys.readouterr().err.splitlines()
+    assert lines[0].startswith("Nomenclator session 'test' (")
+    assert lines[1].split() == [
+        "function", "1", "calls", "2.000ms", "total", "2.000ms", "max"
+    ]
+
+
+def test_session_cprofile(mocker, temporary_directory):
+    """Write cProfile statistics of session."""
+    path = os.path.join(temporary_directory, "session.prof")
+    mocker.patch.dict(os.environ, {"NOMENCLATOR_PROFILE": path})
+
+    import nomenclator.profiling
+    import nomenclator.template
+
+    with nomenclator.profiling.session("test"):
+        nomenclator.template.resolve("{name}", {"name": "value"})
+
+    stats = pstats.Stats(path)
+    assert any(
+        function == "resolve" for _, _, function in stats.stats.keys()
+    )
+
+
+def test_session_error(mocker, capsys):
+    """Report error when results cannot be written."""
+    mocker.patch.dict(
+        os.environ, {"NOMENCLATOR_PROFILE": "/does/not/exist.json"}
+    )
+
+    import nomenclator.profiling
+
+    with nomenclator.profiling.session("test"):
+        pass
+
+    assert capsys.readouterr().err.startswith(
+        "Impossible to write profiling results:"
+    )
+
+
+def test_session_trace(mocker, temporary_directory):
+    """Write trace of session in the Chrome Trace Event format."""
+    path = os.path.join(temporary_directory, "trace.json")
+    mocker.patch.dict(
+        os.environ, {"NOMENCLATOR_PROFILE": "", "NOMENCLATOR_TRACE": path}
+    )
+
+    import nomenclator.config
+    import nomenclator.context
+    import nomenclator.profiling
+
+    config = nomenclator.config.load({
+        "comp-templates": [{
+            "id": "Shot",
+            "pattern-path": temporary_directory,
+            "pattern-base": "comp_v{version}",
+            "outputs": [{
+                "id": "comps",
+                "pattern-path": temporary_directory,
+                "pattern-base": "comp_v{version}",
+            }]
+        }]
+    })
+
+    assert nomenclator.profiling.is_enabled() is True
+
+    with nomenclator.profiling.session("comp_manager"):
+        context = nomenclator.context.fetch(
+            config, path=os.path.join(temporary_directory, "comp_v001.nk"),
+            nodes=([], [])
+        )
+        nomenclator.context.update(context)
+
+        assert len(nomenclator.profiling.fetch_events()) == 7
+
+    assert nomenclator.profiling.fetch_events() == []
+
+    with open(path) as stream:
+        data = json.load(stream)
+
+    assert data["displayTimeUnit"] == "ms"
+
+    events = data["traceEvents"]
+    assert [(event["name"], event["cat"]) for event in events] == [
+        ("session.comp_manager", "session"),
+        ("utilities.fetch_template_config", "utilities"),
+        ("context.fetch_outputs", "context"),
+        ("context.fetch", "context"),
+        ("utilities.fetch_template_config", "utilities"),
+        ("utilities.fetch_next_version", "utilities"),
+        ("context.update_outputs", "context"),
+        ("context.update", "context"),
+    ]
+    assert all(event["ph"] == "X" for event in events)
+    assert all(event["pid"] == os.getpid() for event in events)
+
+    # Sub-stages are nested within their parent span.
+    session, update = events[0], events[-1]
+    for event in events[4:7]:
+        assert update["ts"] <= event["ts"]
+        assert event["ts"] + event["dur"] <= update["ts"] + update["dur"]
+
+    assert session["ts"] == 0
+    assert session["dur"] >= update["ts"] + update["dur"]
+
+    # Timers are not written without profiling path.
+    assert sorted(os.listdir(temporary_directory)) == ["trace.json"]
+
+
+def test_record_outside_session(mocker, temporary_directory):
+    """Record timers without trace events outside of session."""
+    path = os.path.join(temporary_directory, "trace.json")
+    mocker.patch.dict(os.environ, {"NOMENCLATOR_TRACE": path})
+
+    import nomenclator.profiling
+
+    nomenclator.profiling.record("function", 0.1, start=0.0)
+    assert nomenclator.profiling.fetch_events() == []
+    assert nomenclator.profiling.fetch_timers()["function"]["calls"] == 1
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+import pytest
+
+#: Composition script with nodes nested in groups and a large roto block.
+SCRIPT = """#! /usr/local/Nuke13.0v1/libnuke-13.0.1.so -nx
+version 13.0 v1
+define_window_layout_xml {<?xml version="1.0" encoding="UTF-8"?>
+<layout version="1.0"/>
+}
+Root {
+ inputs 0
+ name /path/to/script.nk
+ format "2048 1556 0 0 2048 1556 1 2K_Super_35(full-ap)"
+}
+Read {
+ inputs 0
+ file /path/to/plate.####.exr
+ name Read1
+ xpos 0
+ ypos 0
+}
+Roto {
+ curves {{{v x3f99999a}
+  {f 0}
+  {n
+   {layer Root
+    {f 2097152}
+    {t x44800000 x44428000}
+    {a pt1x 0 pt1y 0 pt2x 0 pt2y 0 name "Write2"}
+{%(roto)s}
+    }}}}
+ toolbox {selectAll}
+ name Roto1
+ xpos 0
+ ypos 50
+}
+Write {
+ file "/path/to/my renders/comp.####.exr"
+ file_type exr
+ views {left right}
+ colorspace linear
+ name Write1
+ xpos 0
+ ypos 100
+}
+DeepWrite {
+ file /path/to/deep.####.exr
+ disable true
+ name DeepWrite1
+ xpos 0
+ ypos 150
+}
+Group {
+ name Group1
+ xpos 100
+ ypos 100
+}
+ Input {
+  inputs 0
+  name Input1
+ }
+ Write {
+  file /path/to/nested.####.dpx
+  file_type dpx
+  name NestedWrite
+ }
+ Group {
+  name Group2
+ }
+  Write {
+   name DeepNestedWrite
+  }
+ end_group
+ Output {
+  name Output1
+ }
+end_group
+Write {
+ name Write3
+ xpos 0
+ ypos 200
+}
+""" % {"roto": "x0 " * 100000}
+
+
+@pytest.fixture()
+def script_path(temporary_directory):
+    """Return path to composition script."""
+    path = os.path.join(temporary_directory, "script.nk")
+
+    with open(path, "w") as stream:
+        stream.write(SCRIPT)
+
+    return path
+
+
+def test_scan(script_path):
+    """Yield nodes from the root graph."""
+    import nomenclator.scanner
+
+    nodes = list(nomenclator.scanner.scan(script_path))
+    assert [(node.Class(), node.name()) for node in nodes] == [
+        ("Read", "Read1"),
+        ("Roto", "Roto1"),
+        ("Write", "Write1"),
+        ("DeepWrite", "DeepWrite1"),
+        ("Group", "Group1"),
+        ("Write", "Write3"),
+    ]
+
+    # Knobs are only extracted from output nodes.
+    assert nodes[0].knobs() == {}
+    assert nodes[1].knobs() == {}
+    assert nodes[2].knobs() == {
+        "file": "/path/to/my renders/comp.####.exr",
+        "file_type": "exr",
+        "views": "left right",
+        "colorspace": "linear",
+        "xpos": "0",
+        "ypos": "100",
+    }
+
+
+def test_scan_recursive(script_path):
+    """Yield nodes from the root graph and within groups."""
+    import nomenclator.scanner
+
+    nodes = nomenclator.scanner.scan(script_path, recursive=True)
+    assert [(node.Class(), node.fullName()) for node in nodes] == [
+        ("Read", "Read1"),
+        ("Roto", "Roto1"),
+        ("Write", "Write1"),
+        ("DeepWrite", "DeepWrite1"),
+        ("Group", "Group1"),
+        ("Input", "Group1.Input1"),
+        ("Write", "Group1.NestedWrite"),
+        ("Group", "Group1.Group2"),
+        ("Write", "Group1.Group2.DeepNestedWrite"),
+        ("Output", "Group1.Output1"),
+        ("Write", "Write3"),
+    ]
+
+
+def test_scan_classes(script_path):
+    """Yield nodes with knobs extracted from requested classes."""
+    import nomenclator.scanner
+
+    nodes = list(nomenclator.scanner.scan(script_path, classes=("Read",)))
+    assert nodes[0].knobs() == {
+        "inputs": "0",
+        "file": "/path/to/plate.####.exr",
+        "xpos": "0",
+        "ypos": "0",
+    }
+    assert nodes[2].knobs() == {}
+
+
+def test_scan_empty(temporary_directory):
+    """Yield no nodes from empty script."""
+    import nomenclator.scanner
+
+    path = os.path.join(temporary_directory, "script.nk")
+
+    with open(path, "w") as stream:
+        stream.write("")
+
+    assert list(nomenclator.scanner.scan(path)) == []
+
+
+def test_fetch_nodes(script_path):
+    """Fetch output nodes and node names from script."""
+    import nomenclator.scanner
+
+    nodes, names = nomenclator.scanner.fetch_nodes(script_path)
+    assert [node.name() for node in nodes] == [
+        "Write1", "DeepWrite1", "Write3"
+    ]
+    assert names == [
+        "Read1", "Roto1", "Write1", "DeepWrite1", "Group1", "Write3"
+    ]
+
+
+def test_fetch_nodes_with_utilities(script_path):
+    """Extract node values with utility functions."""
+    import nomenclator.scanner
+    import nomenclator.utilities
+
+    nodes, _ = nomenclator.scanner.fetch_nodes(script_path)
+
+    assert [
+        nomenclator.utilities.fetch_output_path(node) for node in nodes
+    ] == [
+        "/path/to/my renders/comp.####.exr", "/path/to/deep.####.exr", ""
+    ]
+    assert [
+        nomenclator.utilities.fetch_file_type(node, "exr") for node in nodes
+    ] == ["exr", "exr", "exr"]
+    assert [
+        nomenclator.utilities.fetch_file_types(node) for node in nodes
+    ] == [("exr",), tuple(), tuple()]
+    assert [
+        nomenclator.utilities.fetch_colorspace(node, {"linear": "lin"})
+        for node in nodes
+    ] == ["lin", "none", "default"]
+    assert [
+        nomenclator.utilities.has_multiple_views(node) for node in nodes
+    ] == [True, False, False]
+    assert [
+        nomenclator.utilities.is_enabled(node) for node in nodes
+    ] == [True, False, True]
+
+
+def test_node_unknown_knob():
+    """Fail to access unknown knob."""
+    import nomenclator.scanner
+
+    node = nomenclator.scanner.Node("Write", "Write1")
+    assert node.knob("unknown") is None
+
+    with pytest.raises(NameError):
+        node["unknown"]
+
+
+@pytest.mark.parametrize("block, expected", [
+    ("", {}),
+    (" file /path/to/file.exr\n", {"file": "/path/to/file.exr"}),
+    (
+        " file \"/path/to/my \\\"file\\\".exr\"\n",
+        {"file": "/path/to/my \"file\".exr"}
+    ),
+    (" views {left right}\n", {"views": "left right"}),
+    (
+        " curves {{{v x3f99999a}\n  {f 0}}}\n name Roto1\n",
+        {"curves": "{{v x3f99999a}\n  {f 0}}", "name": "Roto1"}
+    ),
+    (" disable true\r\n name Write1", {"disable": "true", "name": "Write1"}),
+], ids=[
+    "empty",
+    "bare",
+    "quoted",
+    "braced",
+    "multi-lines",
+    "windows-line-endings",
+])
+def test_parse_knobs(block, expected):
+    """Return knob values from node block."""
+    import nomenclator.scanner
+    assert nomenclator.scanner.parse_knobs(block) == expected
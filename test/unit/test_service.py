@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import threading
+import time
+
+import pytest
+
+#: Configuration used by the naming service.
+CONFIG = """
+[[comp-templates]]
+id = "Shot"
+pattern-path = "{root}/{{project}}/{{shot:sh\\\\d+}}/scripts"
+pattern-base = "{{project}}_{{shot}}_{{description}}_v{{version}}"
+
+[[comp-templates.outputs]]
+id = "comps"
+pattern-path = "{root}/{{project}}/{{shot}}/comps"
+pattern-base = "{{project}}_{{shot}}_comp_v{{version}}"
+
+[[comp-templates.outputs]]
+id = "precomps"
+pattern-path = "{root}/{{project}}/{{shot}}/precomps"
+pattern-base = "{{project}}_{{shot}}_precomp_v{{version}}"
+
+[[project-templates]]
+id = "Conform"
+pattern-path = "{root}/{{project}}/edit"
+pattern-base = "{{project}}_{{description}}_v{{version}}"
+"""
+
+
+@pytest.fixture()
+def location_path(mocker, temporary_directory):
+    """Return location path with composition scripts and configuration."""
+    import nomenclator.config
+
+    config_path = os.path.join(temporary_directory, "config")
+    os.makedirs(config_path)
+
+    with open(os.path.join(config_path, "nomenclator.toml"), "w") as stream:
+        stream.write(CONFIG.format(root=temporary_directory))
+
+    mocker.patch.dict(os.environ, {"NOMENCLATOR_CONFIG_PATH": config_path})
+
+    path = os.path.join(temporary_directory, "proj", "sh001", "scripts")
+    os.makedirs(path)
+
+    for name in ["proj_sh001_comp_v001.nk", "proj_sh001_comp_v002.nk"]:
+        with open(os.path.join(path, name), "w") as stream:
+            stream.write("")
+
+    yield path
+
+    nomenclator.config.stop_watcher()
+
+
+@pytest.fixture(params=["tcp", "unix"])
+def server(request, location_path, temporary_directory):
+    """Return running naming service server."""
+    import nomenclator.service
+
+    if request.param == "tcp":
+        address = 0
+    else:
+        address = os.path.join(temporary_directory, "service.sock")
+
+    server = nomenclator.service.create_server(address, jobs=2)
+
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}
+    )
+    thread.daemon = True
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def _client(server):
+    """Return client connected to *server*."""
+    import nomenclator.service
+
+    address = server.server_address
+    if isinstance(address, tuple):
+        address = address[1]
+
+    return nomenclator.service.Client(address, timeout=5)
+
+
+def test_service_scene_name(server, location_path):
+    """Resolve scene name from service."""
+    with _client(server) as client:
+        assert client.call("scene_name", location_path=location_path) == {
+            "path": os.path.join(location_path, "proj_sh001_comp_v003.nk"),
+            "version": 3,
+            "error": None,
+        }
+
+        # New files are detected between calls.
+        path = os.path.join(location_path, "proj_sh001_roto_v007.nk")
+        with open(path, "w") as stream:
+            stream.write("")
+
+        assert client.call(
+            "scene_name", location_path=location_path, description="roto"
+        ) == {
+            "path": os.path.join(location_path, "proj_sh001_roto_v008.nk"),
+            "version": 8,
+            "error": None,
+        }
+
+
+def test_service_output_paths(server, location_path, temporary_directory):
+    """Resolve output paths from service."""
+    root = os.path.join(temporary_directory, "proj", "sh001")
+
+    with _client(server) as client:
+        assert client.call(
+            "output_paths", location_path=location_path,
+            outputs=[
+                {"name": "Write1"},
+                {"name": "Write2", "destination": "precomps", "file_type": "dpx"},
+            ]
+        ) == {
+            "path": os.path.join(location_path, "proj_sh001_comp_v003.nk"),
+            "version": 3,
+            "error": None,
+            "outputs": [
+                {
+                    "name": "Write1",
+                    "path": os.path.join(
+                        root, "comps", "proj_sh001_comp_v003.#.exr"
+                    ),
+                    "destination": "comps",
+                    "error": None,
+                },
+                {
+                    "name": "Write2",
+                    "path": os.path.join(
+                        root, "precomps", "proj_sh001_precomp_v003.#.dpx"
+                    ),
+                    "destination": "precomps",
+                    "error": None,
+                },
+            ]
+        }
+
+
+def test_service_next_version(server, location_path):
+    """Fetch next version from service."""
+    with _client(server) as client:
+        assert client.call("next_version", location_path=location_path) == {
+            "version": 3, "error": None
+        }
+
+        result = client.call(
+            "next_version", location_path=location_path,
+            tokens={"project": "other"}, is_project=True
+        )
+        assert result["version"] is None
+        assert result["error"]["message"] == (
+            "No matching template configuration found."
+        )
+
+
+def test_service_concurrent_clients(server, location_path):
+    """Process requests from several clients concurrently."""
+    results = []
+
+    def _request():
+        """Fetch next version from new client."""
+        with _client(server) as client:
+            for _ in range(10):
+                results.append(
+                    client.call("next_version", location_path=location_path)
+                )
+
+    threads = [threading.Thread(target=_request) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert results == [{"version": 3, "error": None}] * 40
+
+
+def test_service_error(server):
+    """Fail to call unknown method."""
+    with _client(server) as client:
+        with pytest.raises(RuntimeError) as error:
+            client.call("unknown", location_path="/path")
+
+        assert str(error.value) == "Method not found: unknown [-32601]"
+
+
+@pytest.mark.parametrize("data, expected", [
+    ("{", -32700),
+    ("[]", -32600),
+    ("{\"id\": 1}", -32600),
+    ("{\"id\": 1, \"method\": \"unknown\"}", -32601),
+    ("{\"id\": 1, \"method\": \"scene_name\"}", -32602),
+    (
+        "{\"id\": 1, \"method\": \"scene_name\", "
+        "\"params\": {\"location_path\": \"/path\", \"unknown\": 1}}",
+        -32602
+    ),
+    (
+        "{\"id\": 1, \"method\": \"scene_name\", "
+        "\"params\": {\"location_path\": \"/path\", "
+        "\"fetch_file_names\": 1}}",
+        -32602
+    ),
+    ("{\"id\": 1, \"method\": \"scene_name\", \"params\": []}", -32602),
+], ids=[
+    "parse-error",
+    "invalid-request",
+    "missing-method",
+    "unknown-method",
+    "missing-location",
+    "unknown-param",
+    "internal-param",
+    "invalid-params",
+])
+def test_process_request_error(data, expected):
+    """Return error response for invalid requests."""
+    import nomenclator.service
+
+    response = nomenclator.service.process_request(data)
+    assert response["error"]["code"] == expected
+
+
+def test_process_request_notification(mocker):
+    """Return no response for notifications."""
+    import nomenclator.service
+
+    mocked_method = mocker.create_autospec(
+        nomenclator.service.resolve_scene_name
+    )
+    mocker.patch.dict(
+        nomenclator.service.METHODS, {"scene_name": mocked_method}
+    )
+
+    data = json.dumps({
+        "method": "scene_name", "params": {"location_path": "/path"}
+    })
+    assert nomenclator.service.process_request(data) is None
+
+    mocked_method.assert_called_once_with(
+        location_path="/path", fetch_file_names=None
+    )
+
+
+def test_process_request_params_message():
+    """Return error message for missing and unexpected parameters."""
+    import nomenclator.service
+
+    response = nomenclator.service.process_request(json.dumps({
+        "id": 1, "method": "output_paths", "params": {"unknown": 1}
+    }))
+    assert response["error"] == {
+        "code": -32602,
+        "message": "Missing parameters: location_path, outputs",
+    }
+
+    response = nomenclator.service.process_request(json.dumps({
+        "id": 1, "method": "scene_name",
+        "params": {"location_path": "/path", "b": 1, "a": 2}
+    }))
+    assert response["error"] == {
+        "code": -32602, "message": "Unexpected parameters: a, b",
+    }
+
+
+def test_process_request_internal_error(mocker):
+    """Return internal error when method raises a type error."""
+    import nomenclator.service
+
+    mocked_method = mocker.create_autospec(
+        nomenclator.service.resolve_scene_name,
+        side_effect=TypeError("__ERROR__")
+    )
+    mocker.patch.dict(
+        nomenclator.service.METHODS, {"scene_name": mocked_method}
+    )
+
+    response = nomenclator.service.process_request(json.dumps({
+        "id": 1, "method": "scene_name", "params": {"location_path": "/path"}
+    }))
+    assert response["error"] == {"code": -32603, "message": "__ERROR__"}
+
+
+def test_directory_cache(mocker, temporary_directory):
+    """List directory only when modified."""
+    import nomenclator.service
+
+    cache = nomenclator.service.DirectoryCache()
+    listdir = mocker.spy(os, "listdir")
+
+    os.utime(temporary_directory, (0, 0))
+
+    assert cache.fetch(temporary_directory) == []
+    assert cache.fetch(temporary_directory) == []
+    assert listdir.call_count == 1
+
+    path = os.path.join(temporary_directory, "file.nk")
+    with open(path, "w") as stream:
+        stream.write("")
+
+    # Ensure that modification time is changed.
+    os.utime(temporary_directory, (1, 1))
+
+    assert cache.fetch(temporary_directory) == ["file.nk"]
+    assert listdir.call_count == 2
+
+
+def test_directory_cache_recently_modified(mocker, temporary_directory):
+    """List directory again when listed right after its modification."""
+    import nomenclator.service
+
+    cache = nomenclator.service.DirectoryCache()
+    listdir = mocker.spy(os, "listdir")
+
+    mtime = os.stat(temporary_directory).st_mtime
+    mocker.patch.object(time, "time", return_value=mtime + 0.5)
+
+    assert cache.fetch(temporary_directory) == []
+
+    # File added with the same modification time on coarse file system.
+    path = os.path.join(temporary_directory, "file.nk")
+    with open(path, "w") as stream:
+        stream.write("")
+
+    os.utime(temporary_directory, (mtime, mtime))
+
+    assert cache.fetch(temporary_directory) == ["file.nk"]
+    assert listdir.call_count == 2
+
+    time.time.return_value = mtime + 5
+
+    assert cache.fetch(temporary_directory) == ["file.nk"]
+    assert cache.fetch(temporary_directory) == ["file.nk"]
+    assert listdir.call_count == 3
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+
+import pytest
+
+
+@pytest.fixture()
+def telemetry_path(mocker, temporary_directory):
+    """Enable telemetry and return path to records."""
+    path = os.path.join(temporary_directory, "telemetry.jsonl")
+    mocker.patch.dict(os.environ, {"NOMENCLATOR_TELEMETRY": path})
+    return path
+
+
+def _fetch_records(path):
+    """Return list of records written in *path*."""
+    with open(path) as stream:
+        return [json.loads(line) for line in stream]
+
+
+def test_disabled(mocker, temporary_directory):
+    """Record nothing when telemetry is disabled."""
+    mocker.patch.dict(os.environ, {"NOMENCLATOR_TELEMETRY": ""})
+
+    import nomenclator.telemetry
+    assert nomenclator.telemetry.is_enabled() is False
+
+    with nomenclator.telemetry.session("test"):
+        nomenclator.telemetry.set_value("outputs", 10)
+
+    assert nomenclator.telemetry.flush(timeout=1) is True
+    assert os.listdir(temporary_directory) == []
+
+
+def test_session(telemetry_path):
+    """Append one compact record for each session."""
+    import nomenclator.telemetry
+    assert nomenclator.telemetry.is_enabled() is True
+
+    with nomenclator.telemetry.session("comp_manager"):
+        nomenclator.telemetry.set_value("outputs", 10)
+        nomenclator.telemetry.increment("scans")
+        nomenclator.telemetry.increment("scans")
+        nomenclator.telemetry.increment("entries_scanned", 250)
+        nomenclator.telemetry.mark("first_paint")
+        first_paint = nomenclator.telemetry._SESSION["data"]["first_paint"]
+        nomenclator.telemetry.mark("first_paint")
+
+        with nomenclator.telemetry.timer("apply"):
+            pass
+
+    with nomenclator.telemetry.session("settings"):
+        pass
+
+    # Values are ignored outside of a session.
+    nomenclator.telemetry.set_value("outputs", 20)
+
+    assert nomenclator.telemetry.flush(timeout=1) is True
+
+    with open(telemetry_path) as stream:
+        lines = stream.read().splitlines()
+
+    assert len(lines) == 2
+    assert " " not in lines[0]
+
+    records = [json.loads(line) for line in lines]
+    assert [record["session"] for record in records] == [
+        "comp_manager", "settings"
+    ]
+    assert sorted(records[0].keys()) == [
+        "apply", "date", "duration", "entries_scanned", "first_paint",
+        "outputs", "scans", "session"
+    ]
+    assert records[0]["outputs"] == 10
+    assert records[0]["scans"] == 2
+    assert records[0]["entries_scanned"] == 250
+    assert records[0]["first_paint"] == first_paint
+    assert records[0]["duration"] >= records[0]["apply"] >= 0
+    assert sorted(records[1].keys()) == ["date", "duration", "session"]
+
+
+def test_session_hot_paths(telemetry_path, temporary_directory):
+    """Record number of entries scanned to discover versions."""
+    import nomenclator.telemetry
+    import nomenclator.utilities
+
+    with open(os.path.join(temporary_directory, "comp_v001.nk"), "w"):
+        pass
+
+    with nomenclator.telemetry.session("test"):
+        nomenclator.utilities.fetch_next_version(
+            temporary_directory, "comp_v{version}", {}
+        )
+        nomenclator.utilities.fetch_next_version(
+            temporary_directory, "comp_v{version}", {},
+            file_names=["comp_v001.nk", "comp_v002.nk", "other.nk"]
+        )
+
+    nomenclator.telemetry.flush(timeout=1)
+
+    record = _fetch_records(telemetry_path)[0]
+    assert record["scans"] == 2
+    assert record["entries_scanned"] == 4
+
+
+def test_session_prefixed(telemetry_path):
+    """Record values from thread under prefixed keys."""
+    import threading
+    import nomenclator.telemetry
+
+    def _process():
+        """Record values in background."""
+        with nomenclator.telemetry.prefixed("prefetch"):
+            nomenclator.telemetry.increment("scans")
+            nomenclator.telemetry.set_value("outputs", 5)
+
+    with nomenclator.telemetry.session("test"):
+        thread = threading.Thread(target=_process)
+        thread.start()
+        thread.join()
+
+        nomenclator.telemetry.increment("scans")
+
+        # Other threads are not affected by the prefix.
+        with nomenclator.telemetry.prefixed("prefetch"):
+            thread = threading.Thread(
+                target=nomenclator.telemetry.increment, args=("scans",)
+            )
+            thread.start()
+            thread.join()
+
+    nomenclator.telemetry.flush(timeout=1)
+
+    record = _fetch_records(telemetry_path)[0]
+    assert record["scans"] == 2
+    assert record["prefetch_scans"] == 1
+    assert record["prefetch_outputs"] == 5
+    assert "outputs" not in record
+
+
+def test_rotate(mocker, telemetry_path):
+    """Rotate file when its size exceeds the maximum."""
+    import nomenclator.telemetry
+
+    mocker.patch.object(nomenclator.telemetry, "MAX_SIZE", 100)
+    mocker.patch.object(nomenclator.telemetry, "BACKUP_COUNT", 2)
+
+    for index in range(4):
+        nomenclator.telemetry.write(["x" * 60 + str(index)])
+
+    folder = os.path.dirname(telemetry_path)
+    assert sorted(os.listdir(folder)) == [
+        "telemetry.jsonl", "telemetry.jsonl.1", "telemetry.jsonl.2"
+    ]
+
+    for suffix, index in [("", 3), (".1", 2), (".2", 1)]:
+        with open(telemetry_path + suffix) as stream:
+            assert stream.read() == "x" * 60 + "{}\n".format(index)
+
+
+def test_rotate_without_backup(temporary_file):
+    """Remove file when no backups are kept."""
+    import nomenclator.telemetry
+
+    nomenclator.telemetry.rotate(temporary_file, 0)
+    assert not os.path.exists(temporary_file)
+
+
+def test_write_error(mocker, capsys):
+    """Report error when records cannot be written."""
+    mocker.patch.dict(
+        os.environ, {"NOMENCLATOR_TELEMETRY": "/does/not/exist.jsonl"}
+    )
+
+    import nomenclator.telemetry
+
+    with nomenclator.telemetry.session("test"):
+        pass
+
+    assert nomenclator.telemetry.flush(timeout=1) is True
+    assert capsys.readouterr().err.startswith(
+        "Impossible to write telemetry records:"
+    )
+
+
+def test_never_block(mocker, telemetry_path):
+    """Drop records when too many records are waiting to be written."""
+    import nomenclator.telemetry
+
+    # Fill the queue without starting the writer.
+    mocker.patch.dict(nomenclator.telemetry._WRITER, {"thread": object()})
+    limit = nomenclator.telemetry.MAX_PENDING_RECORDS
+
+    for _ in range(limit + 10):
+        with nomenclator.telemetry.session("test"):
+            pass
+
+    assert nomenclator.telemetry._QUEUE.qsize() == limit
+    assert nomenclator.telemetry.flush(timeout=0.01) is False
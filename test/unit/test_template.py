@@ -206,6 +206,29 @@ def test_construct_regexp_without_end_anchor(mocked_sanitize_pattern):
     mocked_sanitize_pattern.assert_called_once_with(template)
 
 
+def test_construct_regexp_cached(mocker, mocked_sanitize_pattern):
+    """Return cached regular expression for identical arguments."""
+    template = r"/path/{project}/{episode:ep\d+}"
+    mocked_sanitize_pattern.return_value = template
+
+    import nomenclator.template
+    mocker.patch.object(nomenclator.template, "_REGEXP_CACHE", {})
+
+    regexp = nomenclator.template.construct_regexp(template)
+    assert nomenclator.template.construct_regexp(template) is regexp
+    mocked_sanitize_pattern.assert_called_once_with(template)
+
+    # Different arguments must create a new expression.
+    nomenclator.template.construct_regexp(template, match_end=False)
+    assert mocked_sanitize_pattern.call_count == 2
+
+    # Cache is cleared when it is full.
+    mocker.patch.object(nomenclator.template, "TEMPLATE_CACHE_SIZE", 2)
+    nomenclator.template.construct_regexp(template, match_start=False)
+    nomenclator.template.construct_regexp(template)
+    assert mocked_sanitize_pattern.call_count == 4
+
+
 @pytest.mark.parametrize("template, expected", [
     (
         r"/^p@th./t0^/l*cation",
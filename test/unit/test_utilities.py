@@ -163,6 +163,45 @@ def test_fetch_template_config(mocker, mocked_fetch_resolved_tokens):
         )
 
 
+def test_fetch_template_config_cached(mocker, mocked_fetch_resolved_tokens):
+    """Return cached template config for identical path and configs."""
+    import nomenclator.utilities
+
+    mocked_fetch_resolved_tokens.side_effect = [None, {"key": "value"}]
+
+    template_configs = (mocker.Mock(), mocker.Mock())
+
+    for _ in range(2):
+        token_mapping = {}
+        config = nomenclator.utilities.fetch_template_config(
+            "/path", template_configs, token_mapping
+        )
+        assert config == template_configs[1]
+        assert token_mapping == {"key": "value"}
+
+    assert mocked_fetch_resolved_tokens.call_count == 2
+
+
+def test_fetch_matching_template_configs(mocker, mocked_fetch_resolved_tokens):
+    """Yield all matching template configs."""
+    import nomenclator.utilities
+
+    mocked_fetch_resolved_tokens.side_effect = [
+        {"key": "value1"}, None, {"key": "value2"}
+    ]
+
+    template_configs = [mocker.Mock(), mocker.Mock(), mocker.Mock()]
+    configs = nomenclator.utilities.fetch_matching_template_configs(
+        "/path", template_configs
+    )
+    assert list(configs) == [
+        (template_configs[0], {"key": "value1"}),
+        (template_configs[2], {"key": "value2"}),
+    ]
+
+    assert mocked_fetch_resolved_tokens.call_count == 3
+
+
 def test_fetch_output_template_config_empty(mocked_fetch_resolved_tokens):
     """Fail to return output template config when config list is empty."""
     import nomenclator.utilities
@@ -328,7 +367,7 @@ def test_fetch_recent_project_paths(mocker, mocked_isfile):
     mocked_action = hiero.ui.findMenuAction.return_value
     mocked_action_menu = mocked_action.menu.return_value
     mocked_action_menu.actions.return_value = items
-    mocked_isfile.side_effect = [True, True, True, True, True, True, False, False]
+    mocked_isfile.side_effect = lambda path: path not in ("1", "2")
 
     paths = nomenclator.utilities.fetch_recent_project_paths()
     assert paths == ("/path1", "/path2", "/path3", "/path4")
@@ -367,7 +406,7 @@ def test_fetch_recent_project_paths_with_max_value(mocker, mocked_isfile):
     mocked_action = hiero.ui.findMenuAction.return_value
     mocked_action_menu = mocked_action.menu.return_value
     mocked_action_menu.actions.return_value = items
-    mocked_isfile.side_effect = [True, True, True]
+    mocked_isfile.return_value = True
 
     paths = nomenclator.utilities.fetch_recent_project_paths(max_values=3)
     assert paths == ("/path1", "/path2")
@@ -382,6 +421,146 @@ def test_fetch_recent_project_paths_with_max_value(mocker, mocked_isfile):
     mocked_isfile.assert_any_call("/path2/project21.hrox")
 
 
+def test_fetch_recent_comp_paths_cached():
+    """Return cached list of comp paths until cache is cleared."""
+    import nuke
+    import nomenclator.utilities
+
+    nuke.recentFile.side_effect = [
+        "/path1/comp11.nk",
+        RuntimeError("no recent file has been found"),
+        "/path2/comp21.nk",
+        RuntimeError("no recent file has been found"),
+    ]
+
+    paths = nomenclator.utilities.fetch_recent_comp_paths()
+    assert paths == ("/path1",)
+    assert nomenclator.utilities.fetch_recent_comp_paths() == paths
+    assert nuke.recentFile.call_count == 2
+
+    nomenclator.utilities.clear_recent_paths()
+
+    paths = nomenclator.utilities.fetch_recent_comp_paths()
+    assert paths == ("/path2",)
+    assert nuke.recentFile.call_count == 4
+
+
+def test_fetch_recent_project_paths_cached(mocker, mocked_isfile):
+    """Return cached list of project paths until a project is saved."""
+    import hiero.core
+    import hiero.ui
+    import nomenclator.utilities
+
+    mocked_action_menu = hiero.ui.findMenuAction.return_value.menu.return_value
+    mocked_action_menu.actions.return_value = [
+        mocker.Mock(**{"text.return_value": "/path1/project11.hrox"}),
+    ]
+    mocked_isfile.return_value = True
+
+    paths = nomenclator.utilities.fetch_recent_project_paths()
+    assert paths == ("/path1",)
+    assert nomenclator.utilities.fetch_recent_project_paths() == paths
+    assert mocked_isfile.call_count == 1
+
+    context = mocker.Mock(path="/path2/project21.hrox")
+    nomenclator.utilities.save_project(context)
+
+    assert nomenclator.utilities.fetch_recent_project_paths() == paths
+    assert mocked_isfile.call_count == 2
+
+
+def test_filter_existing_paths(mocker, mocked_isfile):
+    """Return existing paths checked concurrently."""
+    import threading
+    import nomenclator.utilities
+
+    event = threading.Event()
+
+    def _isfile(path):
+        """Never return for unreachable path."""
+        if path.startswith("/unreachable"):
+            event.wait(5)
+
+        return path != "/path2/missing.hrox"
+
+    mocked_isfile.side_effect = _isfile
+
+    paths = nomenclator.utilities.filter_existing_paths([
+        "/path1/project11.hrox",
+        "/unreachable/project.hrox",
+        "/path2/missing.hrox",
+        "/path3/project31.hrox",
+        "/path1/project11.hrox",
+    ], timeout=0.1)
+
+    event.set()
+
+    assert paths == (
+        "/path1/project11.hrox",
+        "/path3/project31.hrox",
+        "/path1/project11.hrox",
+    )
+    assert mocked_isfile.call_count == 4
+
+
+def test_filter_existing_paths_unreachable(mocker, mocked_isfile):
+    """Ignore unreachable path until its pending check is done."""
+    import threading
+    import time
+    import nomenclator.utilities
+
+    event = threading.Event()
+
+    def _isfile(path):
+        """Wait for event for unreachable path."""
+        if path.startswith("/unreachable"):
+            event.wait(5)
+
+        return True
+
+    mocked_isfile.side_effect = _isfile
+
+    paths = ["/unreachable/project.hrox", "/path1/project11.hrox"]
+
+    result = nomenclator.utilities.filter_existing_paths(paths, timeout=0.1)
+    assert result == ("/path1/project11.hrox",)
+    assert mocked_isfile.call_count == 2
+
+    result = nomenclator.utilities.filter_existing_paths(paths, timeout=0.1)
+    assert result == ("/path1/project11.hrox",)
+    assert mocked_isfile.call_count == 3
+
+    event.set()
+
+    for _ in range(500):
+        if not len(nomenclator.utilities._UNREACHABLE_PATHS):
+            break
+        time.sleep(0.01)
+
+    result = nomenclator.utilities.filter_existing_paths(paths, timeout=1)
+    assert result == tuple(paths)
+    assert mocked_isfile.call_count == 5
+
+
+def test_filter_existing_paths_bounded(mocker, mocked_isfile):
+    """Check paths with a bounded number of threads."""
+    import threading
+    import nomenclator.utilities
+
+    event = threading.Event()
+    mocked_isfile.side_effect = lambda _: event.wait(5)
+
+    paths = ["/unreachable/project{}.hrox".format(index) for index in range(10)]
+
+    assert nomenclator.utilities.filter_existing_paths(
+        paths, timeout=0.1
+    ) == tuple()
+    assert mocked_isfile.call_count == 4
+    assert len(nomenclator.utilities._PATH_WORKERS) == 4
+
+    event.set()
+
+
 def test_fetch_recent_project_paths_error_action(mocked_isfile):
     """Fail to return list of project paths recently used if action is None."""
     import hiero.ui